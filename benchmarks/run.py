@@ -0,0 +1,254 @@
+"""Throughput and latency benchmarks replayed from a recorded archive.
+
+A deterministic synthetic account is recorded once through the plugin's
+record backend, then every workload is replayed with injected latency, so
+the numbers reflect the plugin's own fan-out and overhead rather than
+Robinhood. No credentials or network access are needed.
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --baseline bench.json --tolerance 0.25
+
+With ``--baseline`` the run exits non-zero when any workload's p99 latency
+rises, or its throughput falls, by more than ``--tolerance``.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# pylint: disable=wrong-import-position
+from auto_gpt_robinhood import AutoGPTRobinhoodPlugin, urls  # noqa: E402
+from auto_gpt_robinhood.backend import (  # noqa: E402
+    Archive,
+    RecordingClient,
+    ReplayClient,
+    parse_latency,
+)
+
+
+def _uuid(kind: str, name: str) -> str:
+    digits = hashlib.md5(f"{kind}:{name}".encode()).hexdigest()
+    return "-".join(
+        (digits[:8], digits[8:12], digits[12:16], digits[16:20], digits[20:])
+    )
+
+
+class SyntheticRobinhood:
+    """A deterministic account standing in for pyrh while recording."""
+
+    def __init__(self, symbols: int, positions: int, expirations: int, strikes: int):
+        self.symbols = [f"S{index:04d}" for index in range(symbols)]
+        self.positions = self.symbols[:positions]
+        self.expirations = [
+            (date(2030, 1, 4) + timedelta(weeks=week)).isoformat()
+            for week in range(expirations)
+        ]
+        self.strikes = strikes
+        self.by_id = {_uuid("instrument", symbol): symbol for symbol in self.symbols}
+
+    def instrument(self, symbol: str) -> Dict[str, Any]:
+        id_ = _uuid("instrument", symbol)
+        return {"id": id_, "url": urls.instrument_url(id_), "symbol": symbol}
+
+    def quote_data(self, symbol: str) -> Dict[str, Any]:
+        price = 10 + int(symbol[1:]) % 490
+        return {
+            "symbol": symbol,
+            "ask_price": f"{price + 0.01:.2f}",
+            "bid_price": f"{price - 0.01:.2f}",
+            "last_trade_price": f"{price:.2f}",
+            "previous_close": f"{price * 0.99:.2f}",
+            "updated_at": "2030-01-02T15:00:00Z",
+            "instrument": self.instrument(symbol)["url"],
+        }
+
+    def quotes_data(self, symbols: List[str]) -> List[Dict[str, Any]]:
+        return [self.quote_data(symbol) for symbol in symbols]
+
+    def get_url(self, url: str) -> Dict[str, Any]:
+        parts = urlsplit(url)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        path = f"{parts.scheme}://{parts.netloc}{parts.path}"
+        if path == urls.INSTRUMENTS and "ids" in query:
+            ids = query["ids"].split(",")
+            return {"results": [self.instrument(self.by_id[id_]) for id_ in ids]}
+        if path == urls.INSTRUMENTS and "symbol" in query:
+            return {"results": [self.instrument(query["symbol"])]}
+        if path == urls.INSTRUMENTS:
+            return {"results": [self.instrument(s) for s in self.symbols], "next": None}
+        if path == urls.OPTIONS_CHAINS:
+            chain = _uuid("chain", query["equity_instrument_ids"])
+            return {"results": [{"id": chain, "can_open_position": True}]}
+        if path.startswith(urls.OPTIONS_CHAINS):
+            return {"expiration_dates": self.expirations}
+        if path == urls.OPTIONS_INSTRUMENTS:
+            return {"results": self._contracts(query), "next": None}
+        if path == urls.MARKETDATA_OPTIONS:
+            ids = query["ids"].split(",")
+            return {"results": [self._option_quote(id_) for id_ in ids]}
+        if path == urls.POSITIONS:
+            return {"results": self._positions(), "next": None}
+        if path == urls.PORTFOLIOS:
+            return {"results": [{"equity": "1000000.00"}], "next": None}
+        if path == urls.FUNDAMENTALS:
+            symbols = query["symbols"].split(",")
+            return {"results": [self._fundamentals(symbol) for symbol in symbols]}
+        raise LookupError(url)
+
+    def _contracts(self, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        expiration = query["expiration_dates"]
+        return [
+            {
+                "id": _uuid("option", f"{expiration}{kind}{strike}"),
+                "type": kind,
+                "expiration_date": expiration,
+                "strike_price": f"{50 + strike * 2.5:.4f}",
+            }
+            for kind in ("call", "put")
+            for strike in range(self.strikes)
+        ]
+
+    @staticmethod
+    def _option_quote(id_: str) -> Dict[str, Any]:
+        mark = 0.5 + int(id_[:4], 16) % 2000 / 100
+        return {
+            "instrument_id": id_,
+            "bid_price": f"{mark - 0.05:.2f}",
+            "ask_price": f"{mark + 0.05:.2f}",
+            "adjusted_mark_price": f"{mark:.2f}",
+            "last_trade_price": f"{mark:.2f}",
+            "implied_volatility": None,
+            "open_interest": 100,
+            "volume": 10,
+        }
+
+    def _positions(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "instrument": self.instrument(symbol)["url"],
+                "quantity": f"{1 + index % 20}.00000000",
+                "average_buy_price": f"{10 + index % 300:.4f}",
+            }
+            for index, symbol in enumerate(self.positions)
+        ]
+
+    @staticmethod
+    def _fundamentals(symbol: str) -> Dict[str, Any]:
+        sectors = ("Technology", "Finance", "Health", "Energy", "Utilities")
+        return {"symbol": symbol, "sector": sectors[int(symbol[1:]) % len(sectors)]}
+
+
+def workloads(
+    plugin: AutoGPTRobinhoodPlugin, account: SyntheticRobinhood
+) -> Dict[str, Callable[[], Any]]:
+    """The measured operations, each one call as the agent would make it."""
+    return {
+        "quote_fanout": lambda: plugin.quote_batch(account.symbols, refresh=True),
+        "chain_snapshot": lambda: plugin.get_option_chain_snapshot("S0001"),
+        "portfolio_snapshot": lambda: plugin.portfolio_snapshot(refresh=True),
+    }
+
+
+def measure(operation: Callable[[], Any], iterations: int) -> Dict[str, float]:
+    """Run ``operation`` repeatedly and summarise its latency."""
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    return {
+        "iterations": iterations,
+        "ops_per_second": round(iterations / elapsed, 3),
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+    }
+
+
+def regressions(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[str]:
+    """Describe every workload that got slower than ``baseline`` allows."""
+    failures = []
+    for name, result in results.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if result["p99_ms"] > before["p99_ms"] * (1 + tolerance):
+            failures.append(f"{name}: p99 {before['p99_ms']} -> {result['p99_ms']} ms")
+        rate, rate_before = result["ops_per_second"], before["ops_per_second"]
+        if rate < rate_before * (1 - tolerance):
+            failures.append(f"{name}: {rate_before} -> {rate} ops/s")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency", default="0.02", help="seconds or 'recorded'")
+    parser.add_argument("--symbols", type=int, default=500)
+    parser.add_argument("--positions", type=int, default=50)
+    parser.add_argument("--expirations", type=int, default=8)
+    parser.add_argument("--strikes", type=int, default=60)
+    parser.add_argument("--output", help="write the results as JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    account = SyntheticRobinhood(
+        args.symbols, args.positions, args.expirations, args.strikes
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, value in {
+            "ROBINHOOD_ARCHIVE": f"{workdir}/archive.jsonl.gz",
+            "ROBINHOOD_SYMBOL_INDEX": f"{workdir}/symbols.idx",
+            "ROBINHOOD_INSTRUMENT_CACHE": f"{workdir}/instruments.json",
+            "ROBINHOOD_ORDER_LEDGER": f"{workdir}/orders.sqlite3",
+            "ROBINHOOD_IDEMPOTENCY_FILE": f"{workdir}/idempotency.json",
+            "ROBINHOOD_BAR_STORE_DIR": f"{workdir}/bars",
+        }.items():
+            os.environ[name] = value
+        archive = Archive(os.environ["ROBINHOOD_ARCHIVE"])
+
+        # The plugin is a singleton, so the same instance records and then
+        # replays; its instrument and symbol caches stay warm in between.
+        plugin = AutoGPTRobinhoodPlugin()
+        plugin.session.attach(RecordingClient(account, archive))
+        for operation in workloads(plugin, account).values():
+            operation()
+
+        plugin.session.attach(ReplayClient(archive, parse_latency(args.latency)))
+        results = {}
+        for name, operation in workloads(plugin, account).items():
+            operation()
+            results[name] = measure(operation, args.iterations)
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        failures = regressions(
+            results, json.loads(Path(args.baseline).read_text()), args.tolerance
+        )
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
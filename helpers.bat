@@ -9,8 +9,11 @@ if "%1" == "clean" (
 ) else if "%1" == "style" (
   echo Running code formatters...
   call :style
+) else if "%1" == "bench" (
+  echo Running benchmarks...
+  call :bench
 ) else (
-  echo Usage: %0 [clean^|qa^|style]
+  echo Usage: %0 [clean^|qa^|style^|bench]
   exit /b 1
 )
 
@@ -42,3 +45,14 @@ exit /b 0
   @black --exclude=".*\/*(dist|venv|.venv|test-results)\/*.*" .
   echo Done!
   exit /b 0
+
+:bench
+  rem Run the replay benchmarks, comparing against a baseline when present
+  if exist benchmarks\baseline.json (
+    @python benchmarks\run.py --baseline benchmarks\baseline.json
+  ) else (
+    @python benchmarks\run.py --output benchmarks\baseline.json
+  )
+  if errorlevel 1 exit /b 1
+  echo Done!
+  exit /b 0
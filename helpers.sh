@@ -24,6 +24,15 @@ style() {
   black --exclude=".*\/*(dist|venv|.venv|test-results)\/*.*" .
 }
 
+bench() {
+  # Run the replay benchmarks, comparing against a baseline when present
+  if [ -f benchmarks/baseline.json ]; then
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+  else
+    python benchmarks/run.py --output benchmarks/baseline.json
+  fi
+}
+
 if [ "$1" = "clean" ]; then
   echo Removing build artifacts and temporary files...
   clean
@@ -33,8 +42,11 @@ elif [ "$1" = "qa" ]; then
 elif [ "$1" = "style" ]; then
   echo Running code formatters...
   style
+elif [ "$1" = "bench" ]; then
+  echo Running benchmarks...
+  bench || exit 1
 else
-  echo "Usage: $0 [clean|qa|style]"
+  echo "Usage: $0 [clean|qa|style|bench]"
   exit 1
 fi
 
@@ -1,10 +1,61 @@
 """This is a plugin to use Auto-GPT with Robinhood."""
-from typing import Any, Dict, List, Optional, Tuple, TypeVar, TypedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Iterable,
+    Iterator,
+    Tuple,
+    TypeVar,
+    TypedDict,
+    Union,
+)
 from auto_gpt_plugin_template import AutoGPTPluginTemplate
+from contextlib import contextmanager
 
 # Robinhood
-import pyrh
+import json
 import os
+import threading
+import time
+
+from .aio import AsyncWrappersMixin
+from .bulk import (
+    ORDER_METHODS,
+    IdempotencyLedger,
+    idempotency_key,
+    may_have_reached_server,
+    parse_batch,
+    utc_day,
+    validate_order,
+)
+from .backend import parse_latency
+from .cache import QuoteCache
+from . import urls
+from .concurrency import chunked, fan_out, unique
+from .digest import render as render_digest
+from .instruments import InstrumentCache
+from .metrics import InstrumentedMixin, MetricsRegistry, SamplingProfiler
+from .news import NewsStore
+from .orders import OrderLedger
+from .pool import SessionPool, account_path, current_account, parse_accounts
+from .portfolio import summarize as summarize_portfolio
+from .ratelimit import OrderLaneMixin, RateLimiter, lane_scope
+from .refresh import BackgroundRefresher
+from .session import RobinhoodSession, passive
+from .shaping import ResponseShaper
+from .singleflight import WRITE_PREFIXES, SingleFlightMixin
+from .streaming import QuotePoller
+from .symbol_index import SymbolIndex
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .bar_store import BarStore
+    from .historicals import HistoricalBars
+    from .options import OptionChainSnapshot
+    from .screener import Screener, ScreenTable
 
 PromptGenerator = TypeVar("PromptGenerator")
 
@@ -13,11 +64,135 @@ class Message(TypedDict):
     content: str
 
 
-class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
+class AutoGPTRobinhoodPlugin(
+    AutoGPTPluginTemplate,
+    AsyncWrappersMixin,
+    InstrumentedMixin,
+    SingleFlightMixin,
+    OrderLaneMixin,
+):
     """
     This is a plugin to use Auto-GPT with Robinhood.
+
+    Every wrapper listed in ``ASYNC_WRAPPERS`` also has an awaitable twin
+    prefixed with ``a``, e.g. ``await plugin.aquote_data("AAPL")``, and
+    ``await plugin.amap("get_fundamentals", symbols)`` fans a wrapper out over
+    many arguments at once.
+
+    Concurrent identical calls to the read-only wrappers in ``COALESCED``
+    share one in-flight request. Order placement and cancellation are never
+    coalesced.
+
+    Every wrapper in ``INSTRUMENTED`` is timed into ``metrics``, which can be
+    exported in the Prometheus or OpenMetrics text format.
+
+    Every request made by the wrappers in ``ORDER_WRAPPERS``, including
+    pyrh's own lookups before an order, is paced in the ``orders`` lane.
     """
 
+    ASYNC_WRAPPERS = (
+        "quote_data",
+        "get_quote_list",
+        "quote_batch",
+        "get_quote",
+        "get_stock_marketdata",
+        "get_historical_quotes",
+        "get_stock_news",
+        "ingest_news",
+        "search_news",
+        "get_watchlists",
+        "ask_price",
+        "ask_size",
+        "bid_price",
+        "bid_size",
+        "last_trade_price",
+        "previous_close",
+        "previous_close_date",
+        "get_symbol",
+        "last_updated_at",
+        "get_account",
+        "get_url",
+        "get_tickers_by_tag",
+        "get_options",
+        "get_options_owned",
+        "get_option_market_data",
+        "get_option_chainid",
+        "get_option_quote",
+        "get_option_chain_snapshot",
+        "price_option_chain",
+        "get_fundamentals",
+        "screen_stocks",
+        "get_portfolio",
+        "order_history",
+        "get_positions",
+        "get_securities_owned",
+        "portfolio_snapshot",
+        "place_market_but_order",
+        "place_limit_buy_order",
+        "place_stop_loss_buy_order",
+        "place_stop_limit_buy_order",
+        "place_market_sell_order",
+        "place_limit_sell_order",
+        "place_stop_loss_sell_order",
+        "place_stop_limit_sell_order",
+        "get_open_orders",
+        "cancel_order",
+        "place_orders_bulk",
+        "cancel_orders_bulk",
+    )
+
+    INSTRUMENTED = ASYNC_WRAPPERS + (
+        "technical_indicators",
+        "watch_symbols",
+        "unwatch_symbols",
+    )
+
+    ORDER_WRAPPERS = tuple(
+        name for name in ASYNC_WRAPPERS if name.startswith(WRITE_PREFIXES)
+    )
+
+    COALESCED = (
+        "quote_data",
+        "quote_batch",
+        "get_stock_marketdata",
+        "get_historical_quotes",
+        "technical_indicators",
+        "get_stock_news",
+        "ingest_news",
+        "search_news",
+        "get_watchlists",
+        "get_account",
+        "get_url",
+        "get_tickers_by_tag",
+        "get_options",
+        "get_options_owned",
+        "get_option_market_data",
+        "get_option_chainid",
+        "get_option_quote",
+        "get_option_chain_snapshot",
+        "price_option_chain",
+        "get_fundamentals",
+        "screen_stocks",
+        "get_portfolio",
+        "get_positions",
+        "get_securities_owned",
+        "portfolio_snapshot",
+        "get_open_orders",
+    )
+
+    ACCOUNT_SCOPED = (
+        "get_watchlists",
+        "get_account",
+        "get_url",
+        "get_options_owned",
+        "get_portfolio",
+        "order_history",
+        "get_positions",
+        "get_securities_owned",
+        "portfolio_snapshot",
+        "get_open_orders",
+    )
+
     def __init__(self):
         super().__init__()
         self._name = "Auto-GPT-Robinhood"
@@ -25,7 +200,217 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
         self._description = "This is a plugin for Auto-GPT-Robinhood."
         self.username = os.getenv("ROBINHOOD_USERNAME")
         self.password = os.getenv("ROBINHOOD_PASSWORD")
-        self.robinhood = pyrh.Robinhood(self.username, self.password)
+        self.metrics = MetricsRegistry()
+        self.metrics.add_collector(self._collect_metrics)
+        self.profiler = SamplingProfiler(
+            float(os.getenv("ROBINHOOD_PROFILE_SAMPLE_RATE", "0"))
+        )
+        self.rate_limiter = RateLimiter.from_env()
+        self.session = RobinhoodSession(
+            self.username,
+            self.password,
+            os.getenv("ROBINHOOD_SESSION_FILE"),
+            limiter=self.rate_limiter,
+            metrics=self.metrics,
+            backend=os.getenv("ROBINHOOD_BACKEND", "live"),
+            archive=os.getenv("ROBINHOOD_ARCHIVE"),
+            replay_latency=parse_latency(os.getenv("ROBINHOOD_REPLAY_LATENCY", "0")),
+        )
+        self.sessions = SessionPool(
+            self._account_session,
+            parse_accounts(os.getenv("ROBINHOOD_ACCOUNTS")),
+            max_sessions=int(os.getenv("ROBINHOOD_MAX_SESSIONS", "4")),
+            idle_timeout=float(os.getenv("ROBINHOOD_SESSION_IDLE_TIMEOUT", "900")),
+        )
+        self.quote_cache = QuoteCache(
+            ttl=float(os.getenv("ROBINHOOD_QUOTE_TTL", "5")),
+            max_size=int(os.getenv("ROBINHOOD_QUOTE_CACHE_SIZE", "1024")),
+        )
+        self.quote_batch_size = int(os.getenv("ROBINHOOD_QUOTE_BATCH_SIZE", "100"))
+        self.max_workers = int(os.getenv("ROBINHOOD_MAX_WORKERS", "8"))
+        self.risk_free_rate = float(os.getenv("ROBINHOOD_RISK_FREE_RATE", "0.05"))
+        self.bar_store_dir = os.getenv("ROBINHOOD_BAR_STORE_DIR", "~/.robinhood/bars")
+        self._bar_store = None
+        self.instrument_cache = InstrumentCache(
+            os.getenv("ROBINHOOD_INSTRUMENT_CACHE", "~/.robinhood/instruments.json"),
+            lambda url: self.market_data.get_url(url),
+            max_workers=self.max_workers,
+        )
+        self._watchlist_urls = {}
+        self.symbol_index_path = os.getenv(
+            "ROBINHOOD_SYMBOL_INDEX", "~/.robinhood/symbols.idx"
+        )
+        self.symbol_index_max_age = float(
+            os.getenv("ROBINHOOD_SYMBOL_INDEX_MAX_AGE", "86400")
+        )
+        self._symbol_index = None
+        self.response_shaper = ResponseShaper(
+            fields=json.loads(os.getenv("ROBINHOOD_RESPONSE_FIELDS") or "{}"),
+            max_items=int(os.getenv("ROBINHOOD_RESPONSE_MAX_ITEMS", "20")),
+            max_chars=int(os.getenv("ROBINHOOD_RESPONSE_MAX_CHARS", "500")),
+            max_tokens=int(os.getenv("ROBINHOOD_RESPONSE_MAX_TOKENS", "1000")),
+            commands=self.INSTRUMENTED + ("use_account",),
+        )
+        self.watch_min_interval = float(os.getenv("ROBINHOOD_WATCH_MIN_INTERVAL", "2"))
+        self.watch_max_interval = float(os.getenv("ROBINHOOD_WATCH_MAX_INTERVAL", "60"))
+        self._quote_pollers = {}
+        self.bulk_order_workers = int(os.getenv("ROBINHOOD_BULK_ORDER_WORKERS", "4"))
+        self.idempotency_path = os.getenv(
+            "ROBINHOOD_IDEMPOTENCY_FILE", "~/.robinhood/idempotency.json"
+        )
+        self._idempotency_ledgers = {}
+        self.order_ledger_path = os.getenv(
+            "ROBINHOOD_ORDER_LEDGER", "~/.robinhood/orders.sqlite3"
+        )
+        self.order_sync_interval = float(
+            os.getenv("ROBINHOOD_ORDER_SYNC_INTERVAL", "30")
+        )
+        self._order_ledgers = {}
+        self.portfolio_cache = QuoteCache(
+            ttl=float(os.getenv("ROBINHOOD_PORTFOLIO_TTL", "30")),
+            max_size=len(self.sessions.accounts) + 1,
+        )
+        self.digest_interval = float(os.getenv("ROBINHOOD_DIGEST_INTERVAL", "60"))
+        self.digest_max_age = float(os.getenv("ROBINHOOD_DIGEST_MAX_AGE", "300"))
+        self.digest_max_items = int(os.getenv("ROBINHOOD_DIGEST_MAX_ITEMS", "10"))
+        self._digests = {}
+        self._planned_at = {}
+        self.news_path = os.getenv("ROBINHOOD_NEWS_DB", "~/.robinhood/news.sqlite3")
+        self.news_max_pages = int(os.getenv("ROBINHOOD_NEWS_MAX_PAGES", "3"))
+        self._news_store = None
+        self.screener_universe = unique(
+            os.getenv("ROBINHOOD_SCREENER_UNIVERSE", "").split(",")
+        )
+        self.screener_tags = [
+            tag.strip()
+            for tag in os.getenv(
+                "ROBINHOOD_SCREENER_TAGS", "100-most-popular,top-movers"
+            ).split(",")
+            if tag.strip()
+        ]
+        self.screener_interval = float(os.getenv("ROBINHOOD_SCREENER_INTERVAL", "900"))
+        self.screener_max_age = float(os.getenv("ROBINHOOD_SCREENER_MAX_AGE", "3600"))
+        self._screener = None
+        self._screened_at = float("-inf")
+        self._lock = threading.Lock()
+        self._start_metrics_export()
+
+    @property
+    def robinhood(self):
+        """The logged-in pyrh client of the current account, created on first use."""
+        account = self.account
+        if account is None:
+            return self.session.client
+        return self.sessions.client(account)
+
+    @property
+    def market_data(self):
+        """The pyrh client shared by every account for quotes and reference data.
+
+        That is the primary session's client, except while only the current
+        account's session is logged in: its client is used then, rather than
+        logging in the primary session just for market data.
+        """
+        account = self.account
+        if account is None or self.session.connected:
+            return self.session.client
+        return self.sessions.client(account)
+
+    @property
+    def account(self) -> Optional[str]:
+        """The account selected in this context, or None for the primary one."""
+        return current_account.get()
+
+    @contextmanager
+    def account_scope(self, account: Optional[str]) -> Iterator[None]:
+        """Act for ``account`` (None for the primary one) inside the block.
+
+        Each agent served by one process runs its calls in such a block, or
+        in its own thread after :meth:`use_account`, so sessions, order
+        ledgers and cached account data never mix.
+        """
+        token = current_account.set(self._check_account(account))
+        try:
+            yield
+        finally:
+            current_account.reset(token)
+
+    def use_account(self, account: Optional[str] = None) -> dict:
+        """Act for ``account`` from now on in the current thread or task.
+
+        Args:
+            account (str, optional): one of ``ROBINHOOD_ACCOUNTS``, or empty
+                for the primary account
+
+        Returns:
+            (:obj:`dict`): the selected ``account`` and all ``accounts``
+
+        """
+        current_account.set(self._check_account(account or None))
+        return {"account": self.account, "accounts": self.sessions.accounts}
+
+    def session_pool_stats(self) -> dict:
+        """Report configured accounts, connected sessions and evictions."""
+        return self.sessions.stats()
+
+    def coalescing_scope(self, name: str) -> Optional[str]:
+        """Only join account-bound reads made for the same account."""
+        return self.account if name in self.ACCOUNT_SCOPED else None
+
+    def _check_account(self, account: Optional[str]) -> Optional[str]:
+        if account is None:
+            return None
+        account = account.strip().lower()
+        if account not in self.sessions:
+            raise ValueError(
+                f"Unknown account {account!r}, expected one of {self.sessions.accounts}"
+            )
+        return account
+
+    def _account_session(self, account: str) -> RobinhoodSession:
+        suffix = account.upper()
+        return RobinhoodSession(
+            os.getenv(f"ROBINHOOD_USERNAME_{suffix}"),
+            os.getenv(f"ROBINHOOD_PASSWORD_{suffix}"),
+            str(account_path(self.session.session_file, account)),
+            limiter=self.rate_limiter,
+            metrics=self.metrics,
+            backend=self.session.backend,
+            archive=str(account_path(self.session.archive, account)),
+            replay_latency=self.session.replay_latency,
+        )
+
+    @property
+    def bar_store(self) -> Optional["BarStore"]:
+        """The on-disk historical bar store, or None if it is disabled."""
+        if self._bar_store is None and self.bar_store_dir:
+            with self._lock:
+                if self._bar_store is None:
+                    # pylint: disable-next=import-outside-toplevel
+                    from .bar_store import BarStore
+
+                    self._bar_store = BarStore(
+                        self.bar_store_dir,
+                        lambda *args: self.market_data.get_historical_quotes(*args),
+                    )
+        return self._bar_store
+
+    @property
+    def screener(self) -> "Screener":
+        """The stock screener, created on first use so NumPy loads lazily."""
+        if self._screener is None:
+            with self._lock:
+                if self._screener is None:
+                    # pylint: disable-next=import-outside-toplevel
+                    from .screener import Screener
+
+                    self._screener = Screener(
+                        self._build_screen_table,
+                        interval=self.screener_interval,
+                        max_age=self.screener_max_age,
+                        active=self._screener_active,
+                    )
+        return self._screener
 
     def post_prompt(self, prompt: PromptGenerator) -> PromptGenerator:
         prompt.add_command(
@@ -36,6 +421,14 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             },
             self.quote_data
         ),
+        prompt.add_command(
+            "Quote Batch",
+            "quote_batch",
+            {
+                "symbols": "<list of symbols>"
+            },
+            self.quote_batch
+        ),
         # TODO: get_quote_list
         # TODO: get_quote
         # TODO: get_stock_marketdata
@@ -48,6 +441,107 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             },
             self.get_stock_news
         ),
+        prompt.add_command(
+            "Ingest News",
+            "ingest_news",
+            {
+                "symbols": "<list of symbols, or empty for every symbol"
+                " ingested before>"
+            },
+            self.ingest_news
+        ),
+        prompt.add_command(
+            "Search News",
+            "search_news",
+            {
+                "query": "<keywords, or empty for the newest>",
+                "symbols": "<list of symbols or empty>",
+                "since": "<YYYY-MM-DD or empty>"
+            },
+            self.search_news
+        ),
+        prompt.add_command(
+            "Watch Symbols",
+            "watch_symbols",
+            {
+                "symbols": "<list of symbols>",
+                "threshold_pct": "<minimum % move to report>"
+            },
+            self.watch_symbols
+        ),
+        prompt.add_command(
+            "Unwatch Symbols",
+            "unwatch_symbols",
+            {
+                "symbols": "<list of symbols>"
+            },
+            self.unwatch_symbols
+        ),
+        prompt.add_command(
+            "Technical Indicators",
+            "technical_indicators",
+            {
+                "symbols": "<list of symbols>",
+                "interval": "<day|week|hour|10minute|5minute>",
+                "span": "<day|week|month|3month|year|5year>"
+            },
+            self.technical_indicators
+        ),
+        prompt.add_command(
+            "Screen Stocks",
+            "screen_stocks",
+            {
+                "where": "<filter over columns and tag(\"name\"), e.g."
+                " tag(\"top-movers\") and pe_ratio < 20 and market_cap > 10B>",
+                "sort": "<sort key, e.g. -market_cap, or empty>",
+                "limit": "<max tickers>"
+            },
+            self.screen_stocks
+        ),
+        prompt.add_command(
+            "Portfolio Snapshot",
+            "portfolio_snapshot",
+            {},
+            self.portfolio_snapshot
+        ),
+        prompt.add_command(
+            "Order History",
+            "order_history",
+            {
+                "symbol": "<symbol or empty>",
+                "state": "<filled|cancelled|open|... or empty>",
+                "since": "<YYYY-MM-DD or empty>"
+            },
+            self.order_history
+        ),
+        prompt.add_command(
+            "Place Orders Bulk",
+            "place_orders_bulk",
+            {
+                "orders": "<JSON list of {symbol, side: buy|sell, type:"
+                " market|limit|stop_loss|stop_limit, quantity, time_in_force,"
+                " price, stop_price}>"
+            },
+            self.place_orders_bulk
+        ),
+        prompt.add_command(
+            "Cancel Orders Bulk",
+            "cancel_orders_bulk",
+            {
+                "order_ids": "<list of order ids, or 'all' for every open order>"
+            },
+            self.cancel_orders_bulk
+        ),
+        if self.sessions.accounts:
+            prompt.add_command(
+                "Use Account",
+                "use_account",
+                {
+                    "account": f"<{'|'.join(self.sessions.accounts)},"
+                    " or empty for the primary account>"
+                },
+                self.use_account
+            ),
         return prompt
 
     def can_handle_post_prompt(self) -> bool:
@@ -73,17 +567,34 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
         handle the on_planning method.
         Returns:
             bool: True if the plugin can handle the on_planning method."""
-        return False
+        return True
 
     def on_planning(
         self, prompt: PromptGenerator, messages: List[Message]
     ) -> Optional[str]:
         """This method is called before the planning chat completion is done.
+        Adds the precomputed account digest (buying power, holdings and open
+        orders) and the quote moves of watched symbols since the last turn.
         Args:
             prompt (PromptGenerator): The prompt generator.
             messages (List[str]): The list of messages.
         """
-        pass
+        parts = []
+        context = self.market_context()
+        if context is not None:
+            parts.append(context)
+        moves = {}
+        for event in self.quote_poller.drain():
+            start = moves.get(event.symbol, (event.previous,))[0]
+            moves[event.symbol] = (start, event.price)
+        if moves:
+            summary = "; ".join(
+                f"{symbol} {price:g}"
+                + ("" if start is None else f" ({(price / start - 1) * 100:+.2f}%)")
+                for symbol, (start, price) in moves.items()
+            )
+            parts.append(f"Robinhood quote moves since last turn: {summary}")
+        return "\n".join(parts) or None
 
     def can_handle_post_planning(self) -> bool:
         """This method is called to check that the plugin can
@@ -173,17 +684,21 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
         handle the post_command method.
         Returns:
             bool: True if the plugin can handle the post_command method."""
-        return False
+        return True
 
     def post_command(self, command_name: str, response: str) -> str:
         """This method is called after the command is executed.
+        Responses of this plugin's commands are cut down to their whitelisted
+        fields and a token budget; any other command's response is untouched.
         Args:
             command_name (str): The command name.
             response (str): The response.
         Returns:
             str: The resulting response.
         """
-        pass
+        if not self.response_shaper.handles(command_name):
+            return response
+        return self.response_shaper.shape(command_name, response)
 
     def can_handle_chat_completion(
         self, messages: Dict[Any, Any], model: str, temperature: float, max_tokens: int
@@ -213,6 +728,226 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
         """
         pass
 
+    @property
+    def symbol_index(self) -> SymbolIndex:
+        """The shared symbol to instrument-ID index, opened on first use."""
+        if self._symbol_index is None:
+            with self._lock:
+                if self._symbol_index is None:
+                    self._symbol_index = SymbolIndex(
+                        self.symbol_index_path,
+                        self._instrument_pairs,
+                        self._lookup_instrument_id,
+                        max_age=self.symbol_index_max_age,
+                    )
+        return self._symbol_index
+
+    @property
+    def order_ledger(self) -> OrderLedger:
+        """The current account's local order ledger, opened on first use."""
+        account = self.account
+        ledger = self._order_ledgers.get(account)
+        if ledger is None:
+            with self._lock:
+                ledger = self._order_ledgers.get(account)
+                if ledger is None:
+                    ledger = self._order_ledgers[account] = OrderLedger(
+                        account_path(self.order_ledger_path, account),
+                        self._account_fetch(account),
+                        self._instrument_symbols,
+                        min_interval=self.order_sync_interval,
+                    )
+        return ledger
+
+    @property
+    def idempotency_ledger(self) -> IdempotencyLedger:
+        """The current account's bulk order idempotency ledger."""
+        account = self.account
+        with self._lock:
+            ledger = self._idempotency_ledgers.get(account)
+            if ledger is None:
+                ledger = self._idempotency_ledgers[account] = IdempotencyLedger(
+                    account_path(self.idempotency_path, account)
+                )
+        return ledger
+
+    def _account_fetch(self, account: Optional[str]) -> Callable[[str], dict]:
+        # Bound to the account up front: the ledger may sync from any thread.
+        if account is None:
+            return lambda url: self.session.client.get_url(url)
+        return lambda url: self.sessions.client(account).get_url(url)
+
+    def market_context(self) -> Optional[str]:
+        """Return the current account's digest text without waiting on I/O.
+
+        The digest is rebuilt every ``ROBINHOOD_DIGEST_INTERVAL`` seconds by
+        a background thread started on the first call, so the first planning
+        turn has none yet. Returns None when disabled or not fresh.
+
+        The thread only uses a session the agent already connected, and stops
+        once the account has not planned for ``ROBINHOOD_SESSION_IDLE_TIMEOUT``
+        seconds, so it never logs in and never keeps an idle session alive.
+        """
+        if self.digest_interval <= 0:
+            return None
+        self._planned_at[self.account] = time.monotonic()
+        latest = self._digest_refresher(self.account).latest()
+        if latest is None:
+            return None
+        context, age = latest
+        return render_digest(
+            context["account"],
+            context["snapshot"],
+            context["open_orders"],
+            age,
+            self.digest_max_items,
+        )
+
+    @property
+    def quote_poller(self) -> QuotePoller:
+        """The current account's watch list and its pending quote moves."""
+        account = self.account
+        poller = self._quote_pollers.get(account)
+        if poller is None:
+            with self._lock:
+                poller = self._quote_pollers.get(account)
+                if poller is None:
+                    poller = self._quote_pollers[account] = QuotePoller(
+                        lambda symbols: self._poll_quotes(account, symbols),
+                        min_interval=self.watch_min_interval,
+                        max_interval=self.watch_max_interval,
+                    )
+        return poller
+
+    def _poll_quotes(
+        self, account: Optional[str], symbols: List[str]
+    ) -> Dict[str, dict]:
+        # Runs on the poller thread, which must never log in: until a session
+        # serving market data is connected, every poll is a quiet one.
+        if not (self.session.connected or self._session_of(account).connected):
+            return {}
+        token = passive.set(True)
+        try:
+            with self.account_scope(account):
+                return self.quote_batch(symbols, refresh=True)["quotes"]
+        finally:
+            passive.reset(token)
+
+    def _digest_refresher(self, account: Optional[str]) -> BackgroundRefresher:
+        refresher = self._digests.get(account)
+        if refresher is None:
+            with self._lock:
+                refresher = self._digests.get(account)
+                if refresher is None:
+                    refresher = self._digests[account] = BackgroundRefresher(
+                        lambda: self._market_context(account),
+                        interval=self.digest_interval,
+                        max_age=self.digest_max_age,
+                        name=f"robinhood-digest-{account or 'primary'}",
+                        active=lambda: self._digest_active(account),
+                    )
+        refresher.start()
+        return refresher
+
+    def _session_of(self, account: Optional[str]) -> RobinhoodSession:
+        return self.session if account is None else self.sessions.session(account)
+
+    def _digest_active(self, account: Optional[str]) -> bool:
+        session = self._session_of(account)
+        idle = time.monotonic() - self._planned_at.get(account, float("-inf"))
+        return session.connected and idle < self.sessions.idle_timeout
+
+    def _market_context(self, account: Optional[str]) -> dict:
+        with self.account_scope(account):
+            client, ledger = self.robinhood, self.order_ledger
+            outcomes = fan_out(
+                lambda task: task(),
+                [
+                    client.get_account,
+                    lambda: self._paginate(client, f"{urls.POSITIONS}?nonzero=true"),
+                    ledger.sync,
+                ],
+                3,
+            )
+            for _, _, error in outcomes:
+                if error is not None:
+                    raise error
+            details, positions = outcomes[0][1], outcomes[1][1]
+            open_orders = ledger.query(state="open")
+            symbols = self._instrument_symbols(
+                [position["instrument"] for position in positions]
+            )
+            wanted = unique(
+                [symbol for symbol in symbols if symbol]
+                + [order["symbol"] for order in open_orders if order.get("symbol")]
+            )
+            quotes = self.quote_batch(wanted)["quotes"] if wanted else {}
+            return {
+                "account": details,
+                "snapshot": summarize_portfolio(positions, symbols, quotes, {}),
+                "open_orders": open_orders,
+            }
+
+    @staticmethod
+    def _paginate(client: Any, url: str) -> List[dict]:
+        results = []
+        while url:
+            page = client.get_url(url)
+            results.extend(page["results"])
+            url = page.get("next")
+        return results
+
+    @property
+    def news_store(self) -> NewsStore:
+        """The local news store and index, opened on first use."""
+        if self._news_store is None:
+            with self._lock:
+                if self._news_store is None:
+                    self._news_store = NewsStore(
+                        self.news_path,
+                        lambda url: self.market_data.get_url(url),
+                        max_workers=self.max_workers,
+                        max_pages=self.news_max_pages,
+                    )
+        return self._news_store
+
+    def _instrument_symbols(self, instrument_urls: List[str]) -> List[Optional[str]]:
+        return [
+            instrument and instrument["symbol"]
+            for instrument in self.instrument_cache.resolve(instrument_urls)
+        ]
+
+    def instrument_url(self, symbol: str) -> str:
+        """Return the instrument URL for a ticker symbol.
+
+        Args:
+            symbol (str): stock ticker
+
+        Returns:
+            (str): instrument URL
+
+        """
+        id_ = self.symbol_index.instrument_id(symbol)
+        if id_ is None:
+            raise ValueError(f"Unknown symbol: {symbol}")
+        return urls.instrument_url(id_)
+
+    def _instrument_pairs(self) -> List[Tuple[str, str]]:
+        # Hundreds of pages, so they queue behind every foreground request.
+        with lane_scope("reference"):
+            instruments = self._paginate(self.market_data, urls.INSTRUMENTS)
+        return [(item["symbol"], item["id"]) for item in instruments]
+
+    def _lookup_instrument_id(self, symbol: str) -> Optional[str]:
+        instrument = self.instrument_cache.by_symbol(symbol)
+        if instrument is None:
+            results = self.market_data.get_url(f"{urls.INSTRUMENTS}?symbol={symbol}")
+            if not results.get("results"):
+                return None
+            instrument = results["results"][0]
+            self.instrument_cache.put([instrument])
+        return instrument["id"]
+
     def quote_data(self, stock: str) -> dict:
         """Fetch stock quote.
 
@@ -223,7 +958,10 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`): JSON contents from `quotes` endpoint
 
         """
-        return self.robinhood.quote_data(stock)
+        symbol = stock.get("symbol") if isinstance(stock, dict) else stock
+        if not symbol or "," in symbol:
+            return self.market_data.quote_data(stock)
+        return self.quote_cache.get_or_fetch(symbol, self.market_data.quote_data)
 
     def get_quote_list(self, stock: str, key: str) -> list:
         """Returns multiple stock info and keys from quote_data (prompt if blank)
@@ -237,18 +975,203 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`list`): Returns values from each stock or empty list
                             if none of the stocks were valid
 
+        Quotes come from :meth:`quote_batch`; as in pyrh, each row ends with
+        an empty string and invalid tickers are skipped.
+
+        """
+        keys = key.split(",")
+        symbols = [symbol.strip().upper() for symbol in stock.split(",")]
+        quotes = self.quote_batch(symbols)["quotes"]
+        return [
+            [str(quotes[symbol][item]) for item in keys] + [""]
+            for symbol in symbols
+            if symbol in quotes
+        ]
+
+    def quote_batch(
+        self, symbols: Union[List[str], str], refresh: bool = False
+    ) -> dict:
+        """Fetch quotes for many stocks, one request per chunk of symbols.
+
+        Symbols are de-duplicated, cached quotes are reused, and the rest are
+        requested concurrently from the batch `quotes?symbols=` endpoint.
+
+        Args:
+            symbols (list<str> or str): stock tickers, or a comma separated string
+            refresh (bool, optional): skip the cache and fetch every symbol
+
+        Returns:
+            (:obj:`dict`): ``quotes`` maps each symbol to its `quotes` payload and
+                ``errors`` maps each symbol that could not be quoted to a reason
+
+        """
+        if isinstance(symbols, str):
+            symbols = symbols.split(",")
+        quotes, errors = {}, {}
+        missing = []
+        for symbol in unique(symbols):
+            quote = None if refresh else self.quote_cache.get(symbol)
+            if quote is None:
+                missing.append(symbol)
+            else:
+                quotes[symbol] = quote
+        chunks = list(chunked(missing, self.quote_batch_size))
+        for chunk, results, error in fan_out(
+            self.market_data.quotes_data, chunks, self.max_workers
+        ):
+            if error is not None:
+                # One bad ticker fails the whole request, so retry one by one.
+                results = []
+                for symbol, quote, symbol_error in fan_out(
+                    self.market_data.quote_data, chunk, self.max_workers
+                ):
+                    results.append(quote)
+                    if symbol_error is not None:
+                        errors[symbol] = repr(symbol_error)
+            for symbol, quote in zip(chunk, results):
+                if quote is not None:
+                    self.quote_cache.put(symbol, quote)
+                    quotes[symbol] = quote
+                elif symbol not in errors:
+                    errors[symbol] = "invalid symbol"
+        return {"quotes": quotes, "errors": errors}
+
+    def watch_symbols(
+        self, symbols: Union[List[str], str], threshold_pct: float = 0.5
+    ) -> dict:
+        """Watch symbols in the background and report moves each turn.
+
+        Watched symbols are polled together in batches, and only moves of at
+        least ``threshold_pct`` percent are added to the next planning prompt.
+
+        Args:
+            symbols (list<str> or str): stock tickers, or a comma separated string
+            threshold_pct (float, optional): minimum move, in percent, to report
+
+        Returns:
+            (:obj:`dict`): the symbols now being watched
+
+        """
+        if isinstance(symbols, str):
+            symbols = symbols.split(",")
+        return {
+            "watching": self.quote_poller.watch(unique(symbols), float(threshold_pct))
+        }
+
+    def unwatch_symbols(self, symbols: Union[List[str], str]) -> dict:
+        """Stop watching symbols.
+
+        Args:
+            symbols (list<str> or str): stock tickers, or a comma separated string
+
+        Returns:
+            (:obj:`dict`): the symbols still being watched
+
         """
-        return self.robinhood.get_quote_list(stock, key)
+        if isinstance(symbols, str):
+            symbols = symbols.split(",")
+        return {"watching": self.quote_poller.unwatch(unique(symbols))}
 
     def get_quote(self, stock: str):
         """Wrapper for quote_data."""
-        return self.robinhood.get_quote(stock)
+        return self.quote_data(stock)
+
+    def quote_cache_stats(self) -> dict:
+        """Return hit/miss counters for the quote cache."""
+        return self.quote_cache.stats()
+
+    def rate_limit_stats(self) -> dict:
+        """Return queue depth and wait-time counters per rate limit lane."""
+        return self.rate_limiter.stats()
+
+    def metrics_summary(self) -> dict:
+        """Return call counts, p50/p95/p99 latencies and cache counters."""
+        return self.metrics.summary()
+
+    def enable_profiling(self, sample_rate: float = 0.1) -> None:
+        """Profile a random ``sample_rate`` fraction of wrapper calls."""
+        self.profiler.sample_rate = float(sample_rate)
+
+    def disable_profiling(self) -> None:
+        """Stop sampling calls; collected stats are kept."""
+        self.profiler.sample_rate = 0.0
+
+    def profile_report(self, limit: int = 25) -> str:
+        """Return the hottest functions seen in the sampled calls."""
+        return self.profiler.report(int(limit))
+
+    def _start_metrics_export(self) -> None:
+        openmetrics = os.getenv("ROBINHOOD_METRICS_FORMAT") == "openmetrics"
+        if os.getenv("ROBINHOOD_METRICS_FILE"):
+            self.metrics.write_every(
+                os.getenv("ROBINHOOD_METRICS_FILE"),
+                float(os.getenv("ROBINHOOD_METRICS_INTERVAL", "15")),
+                openmetrics,
+            )
+        if os.getenv("ROBINHOOD_METRICS_PORT"):
+            self.metrics.serve(int(os.getenv("ROBINHOOD_METRICS_PORT")))
+
+    def _collect_metrics(self) -> List[Tuple[str, str, dict, float]]:
+        pollers = list(self._quote_pollers.values())
+        digests = list(self._digests.values())
+        samples = [
+            (
+                "robinhood_coalesced_calls_total",
+                "counter",
+                {},
+                self.single_flight.shared,
+            ),
+            (
+                "robinhood_watch_dropped_events_total",
+                "counter",
+                {},
+                sum(poller.dropped for poller in pollers),
+            ),
+        ]
+        for cache, stats in (
+            ("quote", self.quote_cache.stats()),
+            ("portfolio", self.portfolio_cache.stats()),
+        ):
+            labels = {"cache": cache}
+            samples += [
+                ("robinhood_cache_hits_total", "counter", labels, stats["hits"]),
+                ("robinhood_cache_misses_total", "counter", labels, stats["misses"]),
+            ]
+        for lane, stats in self.rate_limiter.stats().items():
+            labels = {"lane": lane}
+            samples += [
+                ("robinhood_rate_limit_queue_depth", "gauge", labels, stats["depth"]),
+                (
+                    "robinhood_rate_limit_granted_total",
+                    "counter",
+                    labels,
+                    stats["granted"],
+                ),
+                (
+                    "robinhood_rate_limit_wait_seconds_total",
+                    "counter",
+                    labels,
+                    stats["wait_seconds"],
+                ),
+            ]
+        pool = self.sessions.stats()
+        samples += [
+            ("robinhood_sessions_connected", "gauge", {}, len(pool["connected"])),
+            ("robinhood_session_evictions_total", "counter", {}, pool["evictions"]),
+            (
+                "robinhood_digest_errors_total",
+                "counter",
+                {},
+                sum(refresher.errors for refresher in digests),
+            ),
+        ]
+        return samples
 
     def get_stock_marketdata(self, instruments: list[str]) -> list[dict]:
         """Fetch stock market data.
 
         Args:
-            instruments (list<str>): list of instruments
+            instruments (list<str>): list of instrument URLs or ticker symbols
 
         Returns:
             (:obj:`list` of :obj:`dict`): List of JSON contents from `marketdata` \
@@ -256,9 +1179,21 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
                 invalid, a None will occur at that position.
 
         """
-        return self.robinhood.get_stock_marketdata(instruments)
-
-    def get_historical_quotes(self, stock: str, interval: str, span: str) -> dict:
+        instrument_urls = [
+            item if "/" in item else self.instrument_url(item) for item in instruments
+        ]
+        return self.market_data.get_url(
+            f"{urls.MARKETDATA_QUOTES}?instruments={','.join(instrument_urls)}"
+        )["results"]
+
+    def get_historical_quotes(
+        self,
+        stock: str,
+        interval: str,
+        span: str,
+        bounds: str = "regular",
+        columnar: bool = False,
+    ) -> Union[dict, "HistoricalBars"]:
         """Fetch historical data for stock.
 
         Note: valid interval/span configs
@@ -271,12 +1206,67 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             interval (str): resolution of data
             span (str): length of data
             bounds (:obj:`Bounds`, optional): 'extended' or 'regular' trading hours
+            columnar (bool, optional): return parsed float64/int64 column arrays
+                instead of the raw payload, served from the local bar store and
+                topped up with only the bars it is missing
+
+        Returns:
+            (:obj:`dict` or :obj:`HistoricalBars`) values returned from
+                `historicals` endpoint
+
+        """
+        if columnar and self.bar_store is not None:
+            return self.bar_store.get(stock, interval, span, bounds)
+        payload = self.market_data.get_historical_quotes(stock, interval, span, bounds)
+        if not columnar:
+            return payload
+        # pylint: disable-next=import-outside-toplevel
+        from .historicals import parse_historicals
+
+        return parse_historicals(payload)[stock.upper()]
+
+    def technical_indicators(
+        self,
+        symbols: Union[List[str], str],
+        interval: str = "day",
+        span: str = "year",
+        bounds: str = "regular",
+    ) -> dict:
+        """Summarise historical bars as the latest value of each indicator.
+
+        SMA, EMA, RSI, MACD, Bollinger bands, ATR and VWAP are computed with
+        NumPy over all symbols at once, so only a few numbers per symbol reach
+        the prompt instead of the raw bars.
+
+        Args:
+            symbols (list<str> or str): stock tickers, or a comma separated string
+            interval (str): resolution of data
+            span (str): length of data
+            bounds (str, optional): 'extended' or 'regular' trading hours
 
         Returns:
-            (:obj:`dict`) values returned from `historicals` endpoint
+            (:obj:`dict`): ``indicators`` maps each symbol to its latest values and
+                ``errors`` maps each symbol whose bars could not be fetched
 
         """
-        return self.robinhood.get_historical_quotes(stock, interval, span);
+        # pylint: disable-next=import-outside-toplevel
+        from .indicators import summarize
+
+        if isinstance(symbols, str):
+            symbols = symbols.split(",")
+        bars, errors = [], {}
+        for symbol, result, error in fan_out(
+            lambda symbol: self.get_historical_quotes(
+                symbol, interval, span, bounds, columnar=True
+            ),
+            unique(symbols),
+            self.max_workers,
+        ):
+            if error is None:
+                bars.append(result)
+            else:
+                errors[symbol] = repr(error)
+        return {"indicators": summarize(bars), "errors": errors}
 
     def get_stock_news(self, stock: str) -> dict:
         """Fetch news endpoint.
@@ -288,22 +1278,91 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `news` endpoint
 
         """
-        return self.robinhood.get_news(stock);
+        return self.market_data.get_news(stock)
 
-    def get_watchlists(self, ) -> dict:
+    def ingest_news(self, symbols: Union[List[str], str, None] = None) -> dict:
+        """Fetch news for many stocks and return only articles not seen before.
+
+        Symbols are fetched concurrently, each from where its last ingest
+        stopped. Articles already stored under another symbol or URL, or with
+        the same title and summary, are skipped.
+
+        Args:
+            symbols (list<str> or str, optional): stock tickers, or a comma
+                separated string; empty refreshes every symbol ingested before
+
+        Returns:
+            (:obj:`dict`): ``new`` articles, newest first, the number of
+                ``duplicates`` skipped and ``errors`` per symbol
+
+        """
+        if isinstance(symbols, str):
+            symbols = symbols.split(",")
+        return self.news_store.ingest(unique(symbols or []) or None)
+
+    def search_news(
+        self,
+        query: str = "",
+        symbols: Union[List[str], str, None] = None,
+        since: Optional[str] = None,
+        limit: int = 10,
+    ) -> list:
+        """Search ingested news locally, without fetching anything.
+
+        Args:
+            query (str, optional): keywords, ranked by how many match; empty
+                returns the newest articles
+            symbols (list<str> or str, optional): only news about these tickers
+            since (str, optional): ISO-8601 date or time of the oldest article
+            limit (int, optional): maximum number of articles
+
+        Returns:
+            (:obj:`list` of :obj:`dict`): matching articles with their symbols
+
+        """
+        if isinstance(symbols, str):
+            symbols = symbols.split(",")
+        return self.news_store.search(
+            query or "",
+            symbols=unique(symbols or []) or None,
+            since=since or None,
+            limit=10 if limit in (None, "") else int(limit),
+        )
+
+    def get_watchlists(self, ) -> list:
         """Fetch watchlists endpoint and queries for
         each instrumented result aka stock details returned from the watchlist
 
+        Note:
+            instruments are resolved through the instrument cache, so only
+            instruments never seen before are fetched, in batches
+
         Returns:
-            (:obj:`dict`): values returned from `watchlists` and `instrument` endpoints
+            (:obj:`list`): values returned from `watchlists` and `instrument` endpoints
         """
-        return self.robinhood.get_watchlists()
+        watchlist_url = self._watchlist_urls.get(self.account)
+        if watchlist_url is None:
+            watchlists = self.robinhood.get_url(urls.WATCHLISTS)
+            if not watchlists or not watchlists.get("results"):
+                return []
+            watchlist_url = watchlists["results"][0]["url"]
+            self._watchlist_urls[self.account] = watchlist_url
+        instrument_urls = []
+        page = self.robinhood.get_url(watchlist_url)
+        while page:
+            instrument_urls.extend(rec["instrument"] for rec in page["results"])
+            page = page.get("next") and self.robinhood.get_url(page["next"])
+        return [
+            instrument
+            for instrument in self.instrument_cache.resolve(instrument_urls)
+            if instrument is not None
+        ]
 
     def ask_price(self, stock: str) -> float:
         """Get asking price for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -312,13 +1371,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (float): ask price
 
         """
-        return self.robinhood.ask_price(stock)
+        return float(self.quote_data(stock)["ask_price"])
 
     def ask_size(self, stock: str) -> int:
         """Get ask size for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -327,13 +1386,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (int): ask size
 
         """
-        return self.robinhood.ask_size(stock)
+        return int(self.quote_data(stock)["ask_size"])
 
     def bid_price(self, stock: str) -> float:
         """Get bid price for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -342,13 +1401,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (float): bid price
 
         """
-        return self.robinhood.bid_price(stock)
+        return float(self.quote_data(stock)["bid_price"])
 
     def bid_size(self, stock: str) -> int:
         """Get bid size for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -357,13 +1416,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (int): bid size
 
         """
-        return self.robinhood.bid_size(stock)
+        return int(self.quote_data(stock)["bid_size"])
 
     def last_trade_price(self, stock: str) -> float:
         """Get last trade price for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -372,13 +1431,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (float): last trade price
 
         """
-        return self.robinhood.last_trade_price(stock)
+        return float(self.quote_data(stock)["last_trade_price"])
 
     def previous_close(self, stock: str) -> float:
         """Get previous close price for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -387,13 +1446,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (float): previous close price
 
         """
-        return self.robinhood.previous_close(stock)
+        return float(self.quote_data(stock)["previous_close"])
 
     def previous_close_date(self, stock: str) -> str:
         """Get previous close date for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -402,13 +1461,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (str): previous close date
 
         """
-        return self.robinhood.previous_close_date(stock)
+        return str(self.quote_data(stock)["previous_close_date"])
 
     def get_symbol(self, stock: str) -> str:
         """Get symbol for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -417,13 +1476,13 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (str): symbol
 
         """
-        return self.robinhood.symbol(stock)
+        return str(self.quote_data(stock)["symbol"])
 
     def last_updated_at(self, stock: str) -> str:
         """Get last updated date for a stock.
 
         Note:
-            queries `quote` endpoint, dict wrapper
+            served from the quote cache, queries `quote` endpoint on a miss
 
         Args:
             stock (str): stock ticker
@@ -432,7 +1491,7 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (str): last updated date
 
         """
-        return self.robinhood.last_updated_at(stock)
+        return str(self.quote_data(stock)["updated_at"])
 
     def get_account(self, ) -> dict:
         """Fetch account endpoint.
@@ -465,7 +1524,12 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`list` of :obj:`str`) tickers
 
         """
-        return self.robinhood.get_tickers_by_tag(tag)
+        instrument_urls = self.market_data.get_url(f"{urls.TAGS}{tag}/")["instruments"]
+        return [
+            instrument["symbol"]
+            for instrument in self.instrument_cache.resolve(instrument_urls)
+            if instrument is not None
+        ]
 
     def get_options(self, stock: str, expiration_dates: list[str], option_type: str) -> list[dict]:
         """Fetch options for stock.
@@ -479,7 +1543,14 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`list` of :obj:`dict`) values returned from `options` endpoint
 
         """
-        return self.robinhood.get_options(stock, expiration_dates, option_type)
+        if isinstance(expiration_dates, list):
+            expiration_dates = ",".join(expiration_dates)
+        chain_id = self.get_option_chainid(stock)
+        return self.market_data.get_url(
+            f"{urls.OPTIONS_INSTRUMENTS}?chain_id={chain_id}"
+            f"&expiration_dates={expiration_dates}"
+            f"&state=active&tradability=tradable&type={option_type}"
+        )["results"]
 
     def get_options_owned(self, ) -> list[dict]:
         """Fetch options owned.
@@ -500,7 +1571,7 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `option_market_data` endpoint
 
         """
-        return self.robinhood.get_option_market_data(option_id)
+        return self.market_data.get_option_market_data(option_id)
 
     def get_option_chainid(self, symbol: str) -> str:
         """Fetch option chain id.
@@ -512,7 +1583,17 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`str`) option chain id
 
         """
-        return self.robinhood.get_option_chainid(symbol)
+        instrument_id = self.symbol_index.instrument_id(symbol)
+        if instrument_id is None:
+            raise ValueError(f"Unknown symbol: {symbol}")
+        chains = self.market_data.get_url(
+            f"{urls.OPTIONS_CHAINS}?equity_instrument_ids={instrument_id}"
+        )["results"]
+        chain_id = None
+        for chain in chains:
+            if chain["can_open_position"]:
+                chain_id = chain["id"]
+        return chain_id
 
     def get_option_quote(self, symbol: str, strike: float, expiration_date: str, option_type: str) -> dict:
         """Fetch option quote.
@@ -527,7 +1608,95 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `option_quote` endpoint
 
         """
-        return self.robinhood.get_option_quote(symbol, strike, expiration_date, option_type)
+        return self.market_data.get_option_quote(
+            symbol, strike, expiration_date, option_type
+        )
+
+    def get_option_chain_snapshot(
+        self,
+        symbol: str,
+        expiration_dates: Optional[List[str]] = None,
+        option_type: Optional[str] = None,
+    ) -> "OptionChainSnapshot":
+        """Fetch a whole option chain with quotes and greeks in one call.
+
+        Expirations are listed concurrently and market data is requested for
+        many contracts at a time, instead of one `get_option_market_data` call
+        per contract.
+
+        Args:
+            symbol (str): stock ticker
+            expiration_dates (list<str>, optional): expiration dates, all if None
+            option_type (str, optional): option type (call or put), both if None
+
+        Returns:
+            (:obj:`OptionChainSnapshot`) strike, expiration, bid, ask, IV and
+                greeks of every contract as columns
+
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .options import build_snapshot
+
+        if isinstance(expiration_dates, str):
+            expiration_dates = expiration_dates.split(",")
+        return build_snapshot(
+            symbol,
+            self.get_option_chainid(symbol),
+            self.market_data.get_url,
+            expiration_dates=expiration_dates,
+            option_type=option_type,
+            max_workers=self.max_workers,
+        )
+
+    def price_option_chain(
+        self,
+        symbol: str,
+        expiration_dates: Optional[List[str]] = None,
+        option_type: Optional[str] = None,
+        dividend_yield: float = 0.0,
+    ) -> "OptionChainSnapshot":
+        """Fetch a chain snapshot and fill missing IV and greeks locally.
+
+        Contracts the API left without IV or greeks are priced with
+        Black-Scholes against the last trade price, solving IV for the whole
+        chain at once. Each contract expires at its expiration day's close
+        from the NYSE market hours, so early closes are priced correctly.
+
+        Args:
+            symbol (str): stock ticker
+            expiration_dates (list<str>, optional): expiration dates, all if None
+            option_type (str, optional): option type (call or put), both if None
+            dividend_yield (float, optional): continuous dividend yield
+
+        Returns:
+            (:obj:`OptionChainSnapshot`) the chain with IV and greeks filled in
+
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .pricing import fill_chain
+
+        snapshot = self.get_option_chain_snapshot(
+            symbol, expiration_dates, option_type
+        )
+        return fill_chain(
+            snapshot,
+            self.last_trade_price(symbol),
+            self.risk_free_rate,
+            dividend_yield,
+            closes=self._market_closes(set(snapshot.expiration.astype(str))),
+        )
+
+    def _market_closes(self, dates: Iterable[str]) -> Dict[str, str]:
+        """Return the ``closes_at`` time of each date the market is open."""
+        closes = {}
+        for date, hours, error in fan_out(
+            lambda date: self.market_data.get_url(urls.market_hours_url(date)),
+            sorted(dates),
+            self.max_workers,
+        ):
+            if error is None and hours.get("is_open") and hours.get("closes_at"):
+                closes[date] = hours["closes_at"]
+        return closes
 
     def get_fundamentals(self, stock: str) -> dict:
         """Fetch fundamentals.
@@ -539,7 +1708,76 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `fundamentals` endpoint
 
         """
-        return self.robinhood.get_fundamentals(stock)
+        return self.market_data.get_fundamentals(stock)
+
+    def screen_stocks(
+        self, where: str = "", sort: str = "", limit: int = 25
+    ) -> list[str]:
+        """Screen the cached universe by fundamentals, quotes and tags.
+
+        The universe is ``ROBINHOOD_SCREENER_UNIVERSE`` plus the members of
+        every ``ROBINHOOD_SCREENER_TAGS`` tag. Its fundamentals and quotes are
+        kept in a columnar table refreshed in the background, so a screen
+        makes no request once the table is built.
+
+        Args:
+            where (str, optional): filter, e.g. ``tag("top-movers") and
+                pe_ratio < 20 and market_cap > 10B``; see
+                :func:`screener.compile_expression` for the syntax
+            sort (str, optional): sort key, ascending; e.g. ``-market_cap``
+            limit (int, optional): maximum number of tickers
+
+        Returns:
+            (:obj:`list` of :obj:`str`) tickers that match
+
+        """
+        self._screened_at = time.monotonic()
+        return self.screener.screen(
+            where or "",
+            sort or "",
+            None if limit in (None, "") else int(limit),
+        )
+
+    def _screener_active(self) -> bool:
+        idle = time.monotonic() - self._screened_at
+        return self.session.connected and idle < self.sessions.idle_timeout
+
+    def _build_screen_table(self) -> "ScreenTable":
+        # pylint: disable-next=import-outside-toplevel
+        from .screener import ScreenTable
+
+        tags = {}
+        for tag, members, error in fan_out(
+            self.get_tickers_by_tag, self.screener_tags, self.max_workers
+        ):
+            if error is not None:
+                raise error
+            tags[tag] = unique(members)
+        symbols = unique(
+            self.screener_universe
+            + [symbol for members in tags.values() for symbol in members]
+        )
+
+        def fundamentals(chunk: List[str]) -> List[Optional[dict]]:
+            url = f"{urls.FUNDAMENTALS}?symbols={','.join(chunk)}"
+            return self.market_data.get_url(url)["results"]
+
+        chunks = list(chunked(symbols, self.quote_batch_size))
+        outcomes = fan_out(
+            lambda task: task(),
+            [lambda: self.quote_batch(symbols)]
+            + [lambda chunk=chunk: fundamentals(chunk) for chunk in chunks],
+            self.max_workers,
+        )
+        for _, _, error in outcomes:
+            if error is not None:
+                raise error
+        fundamentals_by_symbol = {}
+        for chunk, (_, results, _) in zip(chunks, outcomes[1:]):
+            fundamentals_by_symbol.update(zip(chunk, results))
+        return ScreenTable.build(
+            symbols, fundamentals_by_symbol, outcomes[0][1]["quotes"], tags
+        )
 
     def get_portfolio(self, ) -> dict:
         """Fetch portfolio.
@@ -550,14 +1788,35 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
         """
         return self.robinhood.get_portfolio()
 
-    def order_history() -> list[dict]:
+    def order_history(
+        self,
+        symbol: Optional[str] = None,
+        state: Optional[str] = None,
+        since: Optional[str] = None,
+        limit: Optional[int] = 50,
+    ) -> list[dict]:
         """Fetch order history.
 
+        Orders updated since the last sync are pulled into the local order
+        ledger first, then the query is answered from its indexes.
+
+        Args:
+            symbol (str, optional): stock ticker
+            state (str, optional): order state, e.g. 'filled', or 'open'
+            since (str, optional): ISO-8601 date or time of the oldest update
+            limit (int, optional): maximum number of orders, newest first
+
         Returns:
-            (:obj:`list` of :obj:`dict`) values returned from `order_history` endpoint
+            (:obj:`list` of :obj:`dict`) values returned from `orders` endpoint
 
         """
-        return self.robinhood.order_history()
+        self.order_ledger.sync()
+        return self.order_ledger.query(
+            symbol=symbol or None,
+            state=state or None,
+            since=since or None,
+            limit=None if limit in (None, "") else int(limit),
+        )
 
     def get_positions(self, ) -> list[dict]:
         """Fetch positions.
@@ -577,6 +1836,75 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
         """
         return self.robinhood.get_securities_owned()
 
+    def portfolio_snapshot(self, refresh: bool = False) -> dict:
+        """Value the whole portfolio in one pass.
+
+        Positions and the portfolio are fetched together, then quotes and
+        fundamentals for every holding are fetched together in batches. The
+        result is cached for a short TTL and dropped whenever an order is
+        placed.
+
+        Args:
+            refresh (bool, optional): skip the cache
+
+        Returns:
+            (:obj:`dict`): ``holdings`` with market value, unrealized P&L and
+                weight, portfolio ``totals`` and ``sector_exposure``
+
+        """
+        key = self.account or ""
+        if refresh:
+            self.portfolio_cache.invalidate(key)
+        return self.portfolio_cache.get_or_fetch(
+            key, lambda _: self._build_portfolio_snapshot()
+        )
+
+    def _build_portfolio_snapshot(self) -> dict:
+        client = self.robinhood
+        (_, positions, error), (_, portfolios, _) = fan_out(
+            lambda url: self._paginate(client, url),
+            [f"{urls.POSITIONS}?nonzero=true", urls.PORTFOLIOS],
+            2,
+        )
+        if error is not None:
+            raise error
+        symbols = self._instrument_symbols(
+            [position["instrument"] for position in positions]
+        )
+        held = unique(symbol for symbol in symbols if symbol)
+
+        def fundamentals(chunk: List[str]) -> List[Optional[dict]]:
+            url = f"{urls.FUNDAMENTALS}?symbols={','.join(chunk)}"
+            return self.market_data.get_url(url)["results"]
+
+        chunks = list(chunked(held, self.quote_batch_size))
+        outcomes = fan_out(
+            lambda task: task(),
+            [lambda: self.quote_batch(held)]
+            + [lambda chunk=chunk: fundamentals(chunk) for chunk in chunks],
+            self.max_workers,
+        )
+        quotes = outcomes[0][1]["quotes"] if outcomes[0][2] is None else {}
+        fundamentals_by_symbol = {}
+        for chunk, (_, results, _) in zip(chunks, outcomes[1:]):
+            fundamentals_by_symbol.update(zip(chunk, results or []))
+        return summarize_portfolio(
+            positions,
+            symbols,
+            quotes,
+            fundamentals_by_symbol,
+            portfolios[0] if portfolios else None,
+        )
+
+    def _order_placed(self) -> None:
+        self.portfolio_cache.invalidate(self.account or "")
+        ledger = self._order_ledgers.get(self.account)
+        if ledger is not None:
+            ledger.expire()
+        refresher = self._digests.get(self.account)
+        if refresher is not None:
+            refresher.request()
+
     def place_market_but_order(self, symbol: str, time_in_force: str, quantity: int):
         """Place market buy order.
 
@@ -589,7 +1917,14 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_market_buy_order` endpoint
 
         """
-        return self.robinhood.place_market_buy_order(symbol, time_in_force, quantity)
+        order = self.robinhood.place_market_buy_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            quantity=quantity,
+        )
+        self._order_placed()
+        return order
 
     def place_limit_buy_order(self, symbol: str, time_in_force: str, quantity: int, price: float):
         """Place limit buy order.
@@ -604,7 +1939,15 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_limit_buy_order` endpoint
 
         """
-        return self.robinhood.place_limit_buy_order(symbol, time_in_force, quantity, price)
+        order = self.robinhood.place_limit_buy_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            quantity=quantity,
+            price=price,
+        )
+        self._order_placed()
+        return order
 
     def place_stop_loss_buy_order(self, symbol: str, time_in_force: str, stop_price: float, quantity: int):
         """Place stop loss buy order.
@@ -619,7 +1962,15 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_stop_loss_buy_order` endpoint
 
         """
-        return self.robinhood.place_stop_loss_buy_order(symbol, time_in_force, stop_price, quantity)
+        order = self.robinhood.place_stop_loss_buy_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            stop_price=stop_price,
+            quantity=quantity,
+        )
+        self._order_placed()
+        return order
 
     def place_stop_limit_buy_order(self, symbol: str, time_in_force: str, stop_price: float, price: float, quantity: int):
         """Place stop limit buy order.
@@ -635,7 +1986,16 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_stop_limit_buy_order` endpoint
 
         """
-        return self.robinhood.place_stop_limit_buy_order(symbol, time_in_force, stop_price, price, quantity)
+        order = self.robinhood.place_stop_limit_buy_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            stop_price=stop_price,
+            price=price,
+            quantity=quantity,
+        )
+        self._order_placed()
+        return order
 
     def place_market_sell_order(self, symbol: str, time_in_force: str, quantity: int):
         """Place market sell order.
@@ -649,7 +2009,14 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_market_sell_order` endpoint
 
         """
-        return self.robinhood.place_market_sell_order(symbol, time_in_force, quantity)
+        order = self.robinhood.place_market_sell_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            quantity=quantity,
+        )
+        self._order_placed()
+        return order
 
     def place_limit_sell_order(self, symbol: str, time_in_force: str, price: float, quantity: int):
         """Place limit sell order.
@@ -664,7 +2031,15 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_limit_sell_order` endpoint
 
         """
-        return self.robinhood.place_limit_sell_order(symbol, time_in_force, price, quantity)
+        order = self.robinhood.place_limit_sell_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            price=price,
+            quantity=quantity,
+        )
+        self._order_placed()
+        return order
 
     def place_stop_loss_sell_order(self, symbol: str, time_in_force: str, stop_price: float, quantity: int): 
         """Place stop loss sell order.
@@ -679,7 +2054,15 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_stop_loss_sell_order` endpoint
 
         """
-        return self.robinhood.place_stop_loss_sell_order(symbol, time_in_force, stop_price, quantity)
+        order = self.robinhood.place_stop_loss_sell_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            stop_price=stop_price,
+            quantity=quantity,
+        )
+        self._order_placed()
+        return order
 
     def place_stop_limit_sell_order(self, symbol: str, time_in_force: str, price: float, stop_price: float, quantity: int):
         """Place stop limit sell order.
@@ -695,7 +2078,16 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `place_stop_limit_sell_order` endpoint
 
         """
-        return self.robinhood.place_stop_limit_sell_order(symbol, time_in_force, price, stop_price, quantity)
+        order = self.robinhood.place_stop_limit_sell_order(
+            instrument_URL=self.instrument_url(symbol),
+            symbol=symbol,
+            time_in_force=time_in_force,
+            price=price,
+            stop_price=stop_price,
+            quantity=quantity,
+        )
+        self._order_placed()
+        return order
 
     def get_open_orders(self, ) -> list[dict]:
         """Fetch open orders.
@@ -706,7 +2098,7 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
         """
         return self.robinhood.get_open_orders()
 
-    def cancel_order(order_id: str):
+    def cancel_order(self, order_id: str):
         """Cancel order.
 
         Args:
@@ -716,4 +2108,155 @@ class AutoGPTRobinhoodPlugin(AutoGPTPluginTemplate):
             (:obj:`dict`) values returned from `cancel_order` endpoint
 
         """
-        return self.robinhood.cancel_order(order_id)
\ No newline at end of file
+        result = self.robinhood.cancel_order(order_id)
+        if result is not None:
+            self._order_placed()
+        return result
+
+    def place_orders_bulk(self, orders: Union[List[dict], str]) -> dict:
+        """Validate and submit many orders at once.
+
+        The whole batch is validated and every symbol resolved before anything
+        is sent; if any order is invalid, none are submitted. Orders are then
+        submitted concurrently. Each carries an idempotency key derived from
+        its contents, the UTC day and how many identical orders precede it
+        (or its own ``idempotency_key``), so retrying a batch, even with
+        orders added or reordered, never resubmits an order that was already
+        accepted.
+
+        Args:
+            orders (list<dict> or str): order specs, or their JSON text; see
+                :func:`bulk.validate_order` for the fields
+
+        Returns:
+            (:obj:`dict`): ``submitted``, ``failed``, ``skipped`` counts and a
+                ``results`` row per order with its ``status`` (submitted,
+                failed, unknown, duplicate, pending, invalid or not_submitted).
+                An ``unknown`` order may have reached Robinhood before the
+                connection dropped; its key stays ``pending`` so a retry
+                never sends it twice.
+
+        """
+        orders = parse_batch(orders)
+        day = utc_day()
+        rows, valid, seen = [], [], {}
+        for index, order in enumerate(orders):
+            row = {"index": index}
+            try:
+                order = validate_order(order)
+            except (TypeError, ValueError) as error:
+                row.update(status="invalid", error=str(error))
+            else:
+                content = idempotency_key(order, day)
+                occurrence = seen[content] = seen.get(content, -1) + 1
+                row.update(
+                    symbol=order["symbol"],
+                    side=order["side"],
+                    type=order["type"],
+                    quantity=order["quantity"],
+                    idempotency_key=idempotency_key(order, day, occurrence),
+                )
+                valid.append((row, order))
+            rows.append(row)
+
+        instruments = {}
+        if len(valid) == len(orders):
+            symbols = unique(order["symbol"] for _, order in valid)
+            for symbol, url, error in fan_out(
+                self.instrument_url, symbols, self.max_workers
+            ):
+                instruments[symbol] = url
+                if error is not None:
+                    for row, order in valid:
+                        if order["symbol"] == symbol:
+                            row.update(status="invalid", error=str(error))
+        if any(row.get("status") == "invalid" for row in rows):
+            for row in rows:
+                row.setdefault("status", "not_submitted")
+            return self._bulk_summary(rows)
+
+        # Resolved once for the whole batch rather than once per order.
+        client, ledger = self.robinhood, self.idempotency_ledger
+
+        def submit(item: Tuple[dict, dict]) -> None:
+            row, order = item
+            claimed, entry = ledger.reserve(row["idempotency_key"])
+            if not claimed:
+                status = "duplicate" if entry["status"] == "submitted" else "pending"
+                row.update(status=status, order_id=entry.get("order_id"))
+                return
+            method, prices = ORDER_METHODS[order["side"], order["type"]]
+            try:
+                result = getattr(client, method)(
+                    instrument_URL=instruments[order["symbol"]],
+                    symbol=order["symbol"],
+                    time_in_force=order["time_in_force"],
+                    quantity=order["quantity"],
+                    **{field: order[field] for field in prices},
+                )
+            except Exception as error:
+                if may_have_reached_server(error):
+                    row["status"] = "unknown"
+                else:
+                    ledger.release(row["idempotency_key"])
+                raise
+            result = result if isinstance(result, dict) else {}
+            ledger.record(row["idempotency_key"], result)
+            row.update(
+                status="submitted", order_id=result.get("id"), state=result.get("state")
+            )
+
+        for (row, _), _, error in fan_out(submit, valid, self.bulk_order_workers):
+            if error is not None:
+                row.setdefault("status", "failed")
+                row["error"] = repr(error)
+        if any(row["status"] in ("submitted", "unknown") for row in rows):
+            self._order_placed()
+        return self._bulk_summary(rows)
+
+    def cancel_orders_bulk(self, order_ids: Union[List[str], str] = "all") -> dict:
+        """Cancel many orders concurrently.
+
+        Args:
+            order_ids (list<str> or str): order ids, a comma separated string
+                of them, or 'all' to cancel every open order
+
+        Returns:
+            (:obj:`dict`): ``cancelled`` and ``failed`` counts and a
+                ``results`` row per order with its ``status``
+
+        """
+        if isinstance(order_ids, str):
+            if order_ids.strip().lower() == "all":
+                order_ids = [order["id"] for order in self.robinhood.get_open_orders()]
+            else:
+                order_ids = order_ids.split(",")
+        order_ids = list(dict.fromkeys(id_.strip() for id_ in order_ids if id_.strip()))
+        rows = []
+        for order_id, result, error in fan_out(
+            self.robinhood.cancel_order, order_ids, self.bulk_order_workers
+        ):
+            row = {"order_id": order_id, "status": "cancelled"}
+            if error is not None:
+                row.update(status="failed", error=str(error))
+            elif result is None:
+                row["status"] = "not_cancellable"
+            rows.append(row)
+        if any(row["status"] == "cancelled" for row in rows):
+            self._order_placed()
+        return {
+            "cancelled": sum(row["status"] == "cancelled" for row in rows),
+            "failed": sum(row["status"] != "cancelled" for row in rows),
+            "results": rows,
+        }
+
+    @staticmethod
+    def _bulk_summary(rows: List[dict]) -> dict:
+        statuses = [row["status"] for row in rows]
+        submitted, failed = statuses.count("submitted"), statuses.count("failed")
+        return {
+            "submitted": submitted,
+            "failed": failed,
+            "skipped": len(rows) - submitted - failed,
+            "results": rows,
+        }
@@ -0,0 +1,105 @@
+"""Asyncio twins of the plugin's blocking wrappers."""
+import asyncio
+import contextvars
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[Any]], limit: int, return_exceptions: bool = False
+) -> List[Any]:
+    """Await every awaitable with at most ``limit`` running at once.
+
+    Results come back in input order, as with :func:`asyncio.gather`.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(awaitable: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(
+        *(run(awaitable) for awaitable in aws), return_exceptions=return_exceptions
+    )
+
+
+def _async_twin(name: str) -> Callable[..., Awaitable[Any]]:
+    async def twin(self: "AsyncWrappersMixin", *args: Any, **kwargs: Any) -> Any:
+        return await self.run_blocking(getattr(self, name), *args, **kwargs)
+
+    twin.__name__ = twin.__qualname__ = f"a{name}"
+    twin.__doc__ = f"Awaitable version of :meth:`{name}`."
+    return twin
+
+
+class AsyncWrappersMixin:
+    """
+    Adds an ``a<name>`` coroutine for every method named in ``ASYNC_WRAPPERS``.
+
+    pyrh is built on blocking requests, so the coroutines hand the existing
+    wrappers to one shared, bounded I/O pool that reuses the pooled
+    transport's warm connections. The sync methods stay the source of truth.
+    """
+
+    ASYNC_WRAPPERS: tuple = ()
+    max_workers: int = 8
+
+    _io_pool: Optional[ThreadPoolExecutor] = None
+    _io_pool_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        for name in cls.ASYNC_WRAPPERS:
+            setattr(cls, f"a{name}", _async_twin(name))
+
+    def io_pool(self) -> ThreadPoolExecutor:
+        """Return the executor that runs blocking wrappers for the coroutines."""
+        if self._io_pool is None:
+            with self._io_pool_lock:
+                if self._io_pool is None:
+                    self._io_pool = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix="robinhood-io"
+                    )
+        return self._io_pool
+
+    async def run_blocking(self, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        """Run a blocking callable on the I/O pool and await its result.
+
+        The callable runs in a copy of the caller's context, so context
+        variables such as the selected account carry over to the pool thread.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self.io_pool(), functools.partial(context.run, func, *args, **kwargs)
+        )
+
+    async def amap(
+        self,
+        name: str,
+        arguments: Iterable[Any],
+        limit: Optional[int] = None,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Call wrapper ``name`` once per argument with bounded concurrency.
+
+        Args:
+            name (str): wrapper method name, e.g. ``"get_fundamentals"``
+            arguments (iterable): one entry per call; tuples are unpacked
+            limit (int, optional): calls in flight, defaults to ``max_workers``
+            return_exceptions (bool): return errors in place instead of raising
+
+        Returns:
+            (:obj:`list`): results in the order of ``arguments``
+
+        """
+        func = getattr(self, name)
+        calls = (
+            self.run_blocking(func, *(args if isinstance(args, tuple) else (args,)))
+            for args in arguments
+        )
+        return await gather_bounded(
+            calls, limit or self.max_workers, return_exceptions=return_exceptions
+        )
@@ -0,0 +1,241 @@
+"""Record and replay pyrh calls, with paper fills for orders in replay."""
+import gzip
+import json
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from . import urls
+from .bulk import ORDER_METHODS
+
+BACKENDS = ("live", "record", "replay")
+
+PAPER_ORDERS = {method: key for key, (method, _) in ORDER_METHODS.items()}
+"""pyrh order method to the ``(side, type)`` it places."""
+
+
+class RecordedError(Exception):
+    """A call that raised while recording raises this when replayed."""
+
+
+def parse_latency(value: str) -> Union[float, str]:
+    """Parse a replay latency: seconds, or "recorded"."""
+    return value if value == "recorded" else float(value)
+
+
+def call_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Return the canonical archive key of a call."""
+    return json.dumps([name, list(args), kwargs], sort_keys=True, default=str)
+
+
+class Archive:
+    """
+    Gzipped JSON lines of recorded calls, one ``{k, r, e, t}`` object each.
+
+    ``k`` is the call key, ``r`` the response, ``e`` the error message when
+    the call raised and ``t`` its latency in seconds. Records are appended as
+    separate gzip members, so recording can stop at any point without
+    corrupting the file.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+        self._lock = threading.Lock()
+
+    def append(
+        self, key: str, response: Any, error: Optional[str], elapsed: float
+    ) -> None:
+        """Add one record."""
+        record = {"k": key, "r": response, "t": round(elapsed, 6)}
+        if error is not None:
+            record["e"] = error
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as file:
+                file.write(line)
+
+    def load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return every record grouped by key, in recording order."""
+        records: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        if self.path.is_file():
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                for line in file:
+                    record = json.loads(line)
+                    records[record["k"]].append(record)
+        return records
+
+
+class RecordingClient:
+    """Passes every call to the pyrh ``client`` and archives its result."""
+
+    def __init__(self, client: Any, archive: Archive):
+        self.client = client
+        self.archive = archive
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.client, name)
+        if not callable(attribute):
+            return attribute
+
+        def record(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                response = attribute(*args, **kwargs)
+            except Exception as error:
+                self.archive.append(
+                    call_key(name, args, kwargs),
+                    None,
+                    f"{type(error).__name__}: {error}",
+                    time.perf_counter() - started,
+                )
+                raise
+            self.archive.append(
+                call_key(name, args, kwargs),
+                response,
+                None,
+                time.perf_counter() - started,
+            )
+            return response
+
+        return record
+
+
+class ReplayClient:
+    """
+    Serves archived responses in place of the pyrh client.
+
+    Repeated calls with the same key step through the recorded responses
+    and then keep returning the last one. Each call sleeps for ``latency``
+    seconds, or for the recorded latency when ``latency`` is "recorded".
+    Orders are never replayed: they are filled on paper against the latest
+    recorded quote of their symbol, or left open when the price does not
+    cross, and can then be listed and cancelled.
+    """
+
+    authenticated = True
+
+    def __init__(
+        self,
+        archive: Archive,
+        latency: Union[float, str] = 0.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.archive = archive
+        self.latency = latency
+        self.paper_orders: Dict[str, Dict[str, Any]] = {}
+        self._sleep = sleep
+        self._records = archive.load()
+        self._cursors: Dict[str, int] = defaultdict(int)
+        self._quotes = self._index_quotes()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in PAPER_ORDERS:
+            return lambda **kwargs: self._paper_order(name, **kwargs)
+        return lambda *args, **kwargs: self._replay(name, args, kwargs)
+
+    def get_open_orders(self) -> List[Dict[str, Any]]:
+        """Return the paper orders that are still open."""
+        return [
+            order
+            for order in self.paper_orders.values()
+            if order["state"] == "confirmed"
+        ]
+
+    def cancel_order(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel an open paper order; None if it can no longer be cancelled."""
+        order = self.paper_orders.get(order_id)
+        if order is None:
+            return self._replay("cancel_order", (order_id,), {})
+        if order["state"] != "confirmed":
+            return None
+        order.update(state="cancelled", cancel=None, updated_at=_now())
+        return {}
+
+    def _replay(self, name: str, args: tuple, kwargs: Dict[str, Any]) -> Any:
+        key = call_key(name, args, kwargs)
+        with self._lock:
+            records = self._records.get(key)
+            if not records:
+                raise LookupError(f"No recorded response for {key}")
+            record = records[min(self._cursors[key], len(records) - 1)]
+            self._cursors[key] += 1
+        delay = record["t"] if self.latency == "recorded" else float(self.latency)
+        if delay > 0:
+            self._sleep(delay)
+        if "e" in record:
+            raise RecordedError(record["e"])
+        return record["r"]
+
+    def _index_quotes(self) -> Dict[str, Dict[str, Any]]:
+        quotes: Dict[str, Dict[str, Any]] = {}
+
+        def scan(value: Any) -> None:
+            if isinstance(value, list):
+                for item in value:
+                    scan(item)
+            elif isinstance(value, dict):
+                if "symbol" in value and "last_trade_price" in value:
+                    quotes[value["symbol"].upper()] = value
+                scan(value.get("results"))
+
+        for records in self._records.values():
+            for record in records:
+                scan(record["r"])
+        return quotes
+
+    def _paper_order(self, method: str, **kwargs: Any) -> Dict[str, Any]:
+        side, order_type = PAPER_ORDERS[method]
+        symbol = kwargs["symbol"].upper()
+        quote = self._quotes.get(symbol)
+        if quote is None:
+            raise LookupError(f"No recorded quote to fill {symbol} against")
+        last = float(quote["last_trade_price"])
+        market = float(
+            quote.get("ask_price" if side == "buy" else "bid_price") or last
+        )
+        limit = kwargs.get("price")
+        stop = kwargs.get("stop_price")
+        triggered = stop is None or (last >= stop if side == "buy" else last <= stop)
+        fill = None
+        if triggered:
+            if limit is None:
+                fill = market
+            elif side == "buy" and market <= limit:
+                fill = market
+            elif side == "sell" and market >= limit:
+                fill = market
+        order_id = str(uuid.uuid4())
+        now = _now()
+        order = {
+            "id": order_id,
+            "symbol": symbol,
+            "instrument": kwargs.get("instrument_URL"),
+            "side": side,
+            "type": "market" if order_type in ("market", "stop_loss") else "limit",
+            "trigger": "immediate" if stop is None else "stop",
+            "time_in_force": kwargs.get("time_in_force"),
+            "price": limit,
+            "stop_price": stop,
+            "quantity": float(kwargs["quantity"]),
+            "cumulative_quantity": 0.0 if fill is None else float(kwargs["quantity"]),
+            "average_price": fill,
+            "state": "confirmed" if fill is None else "filled",
+            "cancel": None if fill is not None else f"{urls.ORDERS}{order_id}/cancel/",
+            "created_at": now,
+            "updated_at": now,
+        }
+        with self._lock:
+            self.paper_orders[order_id] = order
+        return dict(order)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
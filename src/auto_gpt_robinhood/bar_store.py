@@ -0,0 +1,238 @@
+"""Persistent, memory-mapped store of historical bars."""
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+from .historicals import INTERVAL_SECONDS, HistoricalBars, parse_historicals
+
+logger = logging.getLogger(__name__)
+
+BAR_DTYPE = np.dtype(
+    [
+        ("t", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+"""On-disk record layout: one fixed-width little-endian row per bar."""
+
+SPAN_SECONDS = {
+    "day": 86400,
+    "week": 7 * 86400,
+    "month": 31 * 86400,
+    "3month": 92 * 86400,
+    "year": 366 * 86400,
+    "5year": 5 * 366 * 86400,
+}
+"""Length of each span accepted by the `historicals` endpoint; ``day`` is
+really the latest trading session."""
+
+SESSION_OFFSET = 5 * 3600
+"""Seconds behind UTC at which every US session, extended hours included,
+falls on a single calendar date, with or without daylight saving time."""
+
+INTERVAL_SPANS = {
+    "5minute": ("day", "week"),
+    "10minute": ("day", "week"),
+    "hour": ("week", "month", "3month"),
+    "day": ("month", "3month", "year", "5year"),
+    "week": ("year", "5year"),
+}
+"""Spans the `historicals` endpoint allows for each interval, shortest first."""
+
+Fetch = Callable[[str, str, str, str], Dict[str, Any]]
+
+
+class BarStore:
+    """
+    Append-only bar files keyed by (symbol, interval, bounds).
+
+    Each key is a flat file of ``BAR_DTYPE`` records read back with
+    ``np.memmap``, plus a small JSON sidecar recording the widest span
+    fetched. A top-up only asks the API for the shortest span that covers
+    the last stored bar, rewrites that bar in place (it may have still been
+    forming) and appends the rest. A top-up that found no new bar, e.g. on a
+    weekend, is not repeated within one interval. A record left incomplete
+    by a crash mid-append is truncated away the next time the file is read.
+    """
+
+    def __init__(
+        self, root: str, fetch: Fetch, clock: Callable[[], float] = time.time
+    ):
+        self.root = Path(root).expanduser()
+        self.fetch = fetch
+        self._clock = clock
+        self._locks: Dict[Path, threading.Lock] = {}
+        self._quiet_until: Dict[Path, float] = {}
+        self._locks_lock = threading.Lock()
+
+    def path(self, symbol: str, interval: str, bounds: str = "regular") -> Path:
+        """Return the bar file for a key."""
+        return self.root / f"{symbol.upper()}-{interval}-{bounds}.bars"
+
+    def read(
+        self, symbol: str, interval: str, bounds: str = "regular"
+    ) -> HistoricalBars:
+        """Memory-map the stored bars without touching the network."""
+        path = self.path(symbol, interval, bounds)
+        with self._lock_for(path):
+            records = self._records(path)
+        if records is None:
+            records = np.empty(0, dtype=BAR_DTYPE)
+        return HistoricalBars(
+            symbol.upper(),
+            interval,
+            records["t"],
+            records["open"],
+            records["high"],
+            records["low"],
+            records["close"],
+            records["volume"],
+        )
+
+    def get(
+        self, symbol: str, interval: str, span: str, bounds: str = "regular"
+    ) -> HistoricalBars:
+        """Top up the stored bars, then return the most recent ``span``.
+
+        The span is counted back from the last stored bar, not from now, and
+        ``day`` means that bar's trading session, so outside market hours
+        the latest session is returned from disk.
+        """
+        self.top_up(symbol, interval, span, bounds)
+        bars = self.read(symbol, interval, bounds)
+        if not len(bars):
+            return bars
+        last = int(bars.timestamps[-1])
+        if span == "day":
+            return bars.between(session_day(last) * 86400 + SESSION_OFFSET)
+        return bars.between(last - SPAN_SECONDS[span])
+
+    def top_up(
+        self, symbol: str, interval: str, span: str, bounds: str = "regular"
+    ) -> int:
+        """Fetch and store any bars newer than the last one held.
+
+        Returns:
+            (int): number of bars written
+
+        """
+        if span not in INTERVAL_SPANS.get(interval, ()):
+            raise ValueError(f"Span {span!r} is not valid for interval {interval!r}")
+        path = self.path(symbol, interval, bounds)
+        with self._lock_for(path):
+            records = self._records(path)
+            meta = self._read_meta(path)
+            covered = SPAN_SECONDS.get(meta.get("span"), 0)
+            if records is None or SPAN_SECONDS[span] > covered:
+                bars = self._fetch(symbol, interval, span, bounds)
+                self._rewrite(path, bars, span)
+                return len(bars)
+
+            last = int(records["t"][-1])
+            now = int(self._clock())
+            quiet_until = self._quiet_until.get(path, 0)
+            if now - last < INTERVAL_SECONDS[interval] or now < quiet_until:
+                return 0
+            # The oldest bar needed is the last one held, which may have been
+            # stored while still forming; ``day`` only reaches back to the
+            # start of the current session.
+            fetch_span = next(
+                (
+                    s
+                    for s in INTERVAL_SPANS[interval]
+                    if session_day(last) == session_day(now)
+                    or (s != "day" and SPAN_SECONDS[s] >= now - last)
+                ),
+                None,
+            )
+            if fetch_span is None:
+                # The gap is wider than any single request can cover.
+                bars = self._fetch(symbol, interval, meta["span"], bounds)
+                self._rewrite(path, bars, meta["span"])
+                return len(bars)
+
+            new = self._fetch(symbol, interval, fetch_span, bounds).between(last)
+            if len(new) and new.timestamps[0] == last:
+                tail = np.memmap(path, dtype=BAR_DTYPE, mode="r+")
+                tail[-1] = _to_records(new[:1])[0]
+                tail.flush()
+                del tail
+                new = new[1:]
+            if len(new):
+                with open(path, "ab") as file:
+                    _to_records(new).tofile(file)
+                self._quiet_until.pop(path, None)
+            else:
+                self._quiet_until[path] = now + INTERVAL_SECONDS[interval]
+            return len(new)
+
+    def _fetch(
+        self, symbol: str, interval: str, span: str, bounds: str
+    ) -> HistoricalBars:
+        payload = self.fetch(symbol.upper(), interval, span, bounds)
+        bars = parse_historicals(payload).get(symbol.upper())
+        if bars is None:
+            raise ValueError(f"No historicals returned for {symbol!r}")
+        return bars
+
+    def _rewrite(self, path: Path, bars: HistoricalBars, span: str) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        _to_records(bars).tofile(tmp)
+        os.replace(tmp, path)
+        path.with_suffix(".json").write_text(json.dumps({"span": span}))
+
+    def _lock_for(self, path: Path) -> threading.Lock:
+        with self._locks_lock:
+            return self._locks.setdefault(path, threading.Lock())
+
+    @staticmethod
+    def _read_meta(path: Path) -> Dict[str, Any]:
+        try:
+            return json.loads(path.with_suffix(".json").read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _records(path: Path) -> Optional[np.ndarray]:
+        if not path.is_file():
+            return None
+        size = path.stat().st_size
+        torn = size % BAR_DTYPE.itemsize
+        if torn:
+            logger.warning(
+                "Truncating %s to its last complete bar, dropping %d bytes",
+                path,
+                torn,
+            )
+            os.truncate(path, size - torn)
+            size -= torn
+        if size < BAR_DTYPE.itemsize:
+            return None
+        return np.memmap(path, dtype=BAR_DTYPE, mode="r")
+
+
+def session_day(timestamp: int) -> int:
+    """Return the trading session a bar belongs to, as days since the epoch."""
+    return (timestamp - SESSION_OFFSET) // 86400
+
+
+def _to_records(bars: HistoricalBars) -> np.ndarray:
+    records = np.empty(len(bars), dtype=BAR_DTYPE)
+    records["t"] = bars.timestamps
+    records["open"] = bars.open
+    records["high"] = bars.high
+    records["low"] = bars.low
+    records["close"] = bars.close
+    records["volume"] = bars.volume
+    return records
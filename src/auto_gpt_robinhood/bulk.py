@@ -0,0 +1,188 @@
+"""Validation and idempotency bookkeeping for bulk order submission."""
+import hashlib
+import json
+import math
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+ORDER_METHODS = {
+    ("buy", "market"): ("place_market_buy_order", ()),
+    ("buy", "limit"): ("place_limit_buy_order", ("price",)),
+    ("buy", "stop_loss"): ("place_stop_loss_buy_order", ("stop_price",)),
+    ("buy", "stop_limit"): ("place_stop_limit_buy_order", ("stop_price", "price")),
+    ("sell", "market"): ("place_market_sell_order", ()),
+    ("sell", "limit"): ("place_limit_sell_order", ("price",)),
+    ("sell", "stop_loss"): ("place_stop_loss_sell_order", ("stop_price",)),
+    ("sell", "stop_limit"): ("place_stop_limit_sell_order", ("stop_price", "price")),
+}
+"""``(side, type)`` to the pyrh method and the prices it requires."""
+
+TIMES_IN_FORCE = ("gfd", "gtc")
+
+
+def utc_day() -> str:
+    """Return today's UTC date as ``YYYY-MM-DD``."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def parse_batch(batch: Union[str, List[Any]]) -> List[Any]:
+    """Accept a list, or the JSON text of one as passed by a prompt command."""
+    if isinstance(batch, str):
+        batch = json.loads(batch)
+    if not isinstance(batch, list):
+        raise ValueError("expected a list")
+    return batch
+
+
+def validate_order(order: Any) -> Dict[str, Any]:
+    """Return a normalised copy of one order spec, or raise ValueError.
+
+    An order is a dict with ``symbol``, ``side`` (buy or sell), ``type``
+    (market, limit, stop_loss or stop_limit), ``quantity``, optional
+    ``time_in_force`` (gfd or gtc, default gfd), the prices its type needs
+    and an optional caller-chosen ``idempotency_key``.
+    """
+    if not isinstance(order, dict):
+        raise ValueError("order must be an object")
+    symbol = str(order.get("symbol") or "").strip().upper()
+    if not symbol:
+        raise ValueError("symbol is required")
+    side = str(order.get("side") or "").lower()
+    order_type = str(order.get("type") or "market").lower()
+    if (side, order_type) not in ORDER_METHODS:
+        raise ValueError(f"unsupported side/type: {side!r}/{order_type!r}")
+    time_in_force = str(order.get("time_in_force") or "gfd").lower()
+    if time_in_force not in TIMES_IN_FORCE:
+        raise ValueError(f"time_in_force must be one of {TIMES_IN_FORCE}")
+    quantity = _finite(order, "quantity")
+    if quantity <= 0 or quantity != int(quantity):
+        raise ValueError("quantity must be a positive whole number")
+    normalised = {
+        "symbol": symbol,
+        "side": side,
+        "type": order_type,
+        "time_in_force": time_in_force,
+        "quantity": int(quantity),
+    }
+    for field in ORDER_METHODS[side, order_type][1]:
+        price = _finite(order, field)
+        if price <= 0:
+            raise ValueError(f"{field} must be a positive number")
+        normalised[field] = price
+    if order.get("idempotency_key"):
+        normalised["idempotency_key"] = str(order["idempotency_key"])
+    return normalised
+
+
+def _finite(order: Dict[str, Any], field: str) -> float:
+    try:
+        value = float(order.get(field) or 0)
+    except (TypeError, ValueError):
+        raise ValueError(f"{field} must be a number") from None
+    if not math.isfinite(value):
+        raise ValueError(f"{field} must be a finite number")
+    return value
+
+
+def may_have_reached_server(error: BaseException) -> bool:
+    """Whether a failed submit could still have placed the order.
+
+    Errors raised before the request left, or carrying Robinhood's response,
+    are safe to retry; a connection lost mid-request is not.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from requests import exceptions
+
+    if isinstance(error, exceptions.ConnectTimeout):
+        return False
+    return isinstance(error, (exceptions.ConnectionError, exceptions.ReadTimeout))
+
+
+def idempotency_key(order: Dict[str, Any], day: str, occurrence: int = 0) -> str:
+    """Key an order by its content, the UTC day and its repeat count.
+
+    ``occurrence`` counts identical orders earlier in the same batch, so two
+    identical orders in one batch get different keys while adding, removing
+    or reordering other orders leaves the key unchanged. An identical order
+    placed again tomorrow does not collide. A caller-chosen
+    ``idempotency_key`` is used as is.
+    """
+    if order.get("idempotency_key"):
+        return order["idempotency_key"]
+    content = json.dumps([order, day, occurrence], sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()[:32]
+
+
+class IdempotencyLedger:
+    """
+    Records which idempotency keys were submitted today, on disk.
+
+    A key is reserved as ``pending`` before its order is sent and marked
+    ``submitted`` once the API accepts it, or released if the call fails
+    without reaching Robinhood.
+    A key still pending after a crash is never resent automatically, since
+    its order may have reached Robinhood. Entries from earlier UTC days are
+    dropped when the ledger is loaded.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]]):
+        self.path = Path(path).expanduser() if path else None
+        self._day: Optional[str] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Claim ``key`` for submission.
+
+        Returns:
+            (:obj:`tuple`): ``(claimed, entry)``; when ``claimed`` is False,
+                ``entry`` is the earlier pending or submitted record
+        """
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            if entry is not None:
+                return False, dict(entry)
+            self._entries[key] = {"status": "pending"}
+            self._save()
+        return True, None
+
+    def record(self, key: str, order: Dict[str, Any]) -> None:
+        """Mark ``key`` submitted with the order Robinhood returned."""
+        with self._lock:
+            self._entries[key] = {
+                "status": "submitted",
+                "order_id": order.get("id"),
+                "state": order.get("state"),
+            }
+            self._save()
+
+    def release(self, key: str) -> None:
+        """Forget ``key`` after a failed submit so a retry may send it again."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._save()
+
+    def _load(self) -> None:
+        day = utc_day()
+        if self._day == day:
+            return
+        self._day, self._entries = day, {}
+        if self.path is not None and self.path.is_file():
+            try:
+                data = json.loads(self.path.read_text())
+            except ValueError:
+                data = {}
+            if data.get("day") == day:
+                self._entries = data.get("entries", {})
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"day": self._day, "entries": self._entries}))
+        os.replace(tmp, self.path)
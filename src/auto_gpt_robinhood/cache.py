@@ -0,0 +1,78 @@
+"""In-memory quote cache shared by the quote-derived wrappers."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+
+class QuoteCache:
+    """
+    TTL cache of `quotes` endpoint payloads keyed by ticker symbol.
+
+    Entries expire ``ttl`` seconds after they were stored, and the least
+    recently used entry is evicted once ``max_size`` symbols are held.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 5.0,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str) -> Optional[dict]:
+        """Return the cached quote for ``symbol``, or None if missing or stale."""
+        key = symbol.upper()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._clock() - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, symbol: str, quote: dict) -> None:
+        """Store ``quote`` for ``symbol``, evicting the oldest entry if full."""
+        key = symbol.upper()
+        with self._lock:
+            self._entries[key] = (self._clock(), quote)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(self, symbol: str, fetch: Callable[[str], dict]) -> dict:
+        """Return the cached quote, calling ``fetch(symbol)`` on a miss."""
+        quote = self.get(symbol)
+        if quote is None:
+            quote = fetch(symbol)
+            self.put(symbol, quote)
+        return quote
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop one symbol, or every entry when ``symbol`` is None."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol.upper(), None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters suitable for exporting as metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,42 @@
+"""Helpers for fanning blocking Robinhood calls out over a thread pool."""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Outcome = Tuple[Any, Any, Optional[BaseException]]
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Yield consecutive slices of ``items`` holding at most ``size`` entries."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def unique(items: Iterable[str]) -> List[str]:
+    """Upper-case and de-duplicate symbols, keeping their first-seen order."""
+    return list(dict.fromkeys(item.strip().upper() for item in items if item.strip()))
+
+
+def fan_out(
+    func: Callable[[Any], Any], items: Sequence[Any], max_workers: int = 8
+) -> List[Outcome]:
+    """Call ``func`` on every item with at most ``max_workers`` in flight.
+
+    Returns:
+        (:obj:`list` of :obj:`tuple`): ``(item, result, error)`` per item, in
+            input order. A failing call sets ``error`` instead of raising, so
+            one bad item never fails the whole batch. Each call runs in a
+            copy of the caller's context, so it acts for the same account.
+    """
+    context = contextvars.copy_context()
+
+    def call(item: Any) -> Outcome:
+        try:
+            return item, context.copy().run(func, item), None
+        except Exception as error:  # pylint: disable=broad-except
+            return item, None, error
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(call, items))
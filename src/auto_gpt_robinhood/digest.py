@@ -0,0 +1,77 @@
+"""Compact account and market context for the planning prompt."""
+from typing import Any, Dict, List
+
+
+def _amount(value: Any) -> str:
+    return "n/a" if value in (None, "") else f"${float(value):,.2f}"
+
+
+def _number(value: Any) -> str:
+    return f"{float(value):g}"
+
+
+def _order(order: Dict[str, Any]) -> str:
+    text = (
+        f"{order.get('side')} {_number(order.get('quantity') or 0)} "
+        f"{order.get('symbol')} {order.get('type')}"
+    )
+    if order.get("price") is not None:
+        text += f" @ {_number(order['price'])}"
+    if order.get("stop_price") is not None:
+        text += f" stop {_number(order['stop_price'])}"
+    return f"{text} ({order.get('state')}, id {order.get('id')})"
+
+
+def render(
+    account: Dict[str, Any],
+    snapshot: Dict[str, Any],
+    open_orders: List[Dict[str, Any]],
+    age: float,
+    max_items: int = 10,
+) -> str:
+    """Render the digest as a few short lines for the planning prompt.
+
+    Args:
+        account (dict): `accounts` payload
+        snapshot (dict): :func:`portfolio.summarize` result for the holdings
+        open_orders (list<dict>): open `orders` payloads, with ``symbol``
+        age (float): seconds since the data was fetched
+        max_items (int, optional): most holdings and orders listed
+
+    Returns:
+        (str): the digest text
+
+    """
+    totals = snapshot["totals"]
+    lines = [
+        f"Robinhood account as of {age:.0f}s ago: buying power "
+        f"{_amount(account.get('buying_power'))}, cash {_amount(account.get('cash'))}"
+        f", holdings {_amount(totals['market_value'])} "
+        f"(day {_amount(totals['day_change'])}, "
+        f"unrealized {_amount(totals['unrealized_pnl'])})."
+    ]
+    holdings = [
+        f"{holding['symbol']} {_number(holding['quantity'])} @ {holding['price']:g}"
+        + (
+            ""
+            if holding["unrealized_pnl_pct"] is None
+            else f" ({holding['unrealized_pnl_pct'] * 100:+.1f}%)"
+        )
+        for holding in snapshot["holdings"][:max_items]
+        if holding["price"] is not None
+    ]
+    if holdings:
+        more = len(snapshot["holdings"]) - max_items
+        lines.append(
+            "Holdings: "
+            + "; ".join(holdings)
+            + (f"; +{more} more" if more > 0 else "")
+        )
+    orders = [_order(order) for order in open_orders[:max_items]]
+    more = len(open_orders) - max_items
+    lines.append(
+        "Open orders: "
+        + ("; ".join(orders) if orders else "none")
+        + (f"; +{more} more" if more > 0 else "")
+    )
+    return "\n".join(lines)
@@ -0,0 +1,196 @@
+"""Columnar, NumPy-backed historical bars."""
+from typing import Any, Dict, Iterable, Optional, Union
+
+import numpy as np
+
+INTERVAL_SECONDS = {
+    "5minute": 300,
+    "10minute": 600,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+}
+"""Bar length of each interval accepted by the `historicals` endpoint."""
+
+# 1970-01-01 was a Thursday; weekly buckets start on the Monday before it.
+_WEEK_ORIGIN = -3 * 86400
+
+PRICE_FIELDS = ("open_price", "high_price", "low_price", "close_price")
+
+TimeLike = Union[int, str, np.datetime64, None]
+
+
+def to_epoch(value: TimeLike) -> Optional[int]:
+    """Convert an ISO-8601 string or datetime64 to epoch seconds."""
+    if value is None or isinstance(value, (int, np.integer)):
+        return value
+    if isinstance(value, str):
+        value = np.datetime64(value.rstrip("Z")[:19], "s")
+    return int(value.astype("datetime64[s]").astype(np.int64))
+
+
+class HistoricalBars:
+    """
+    OHLCV bars for one symbol stored as parallel arrays.
+
+    Prices and volume are float64 and ``timestamps`` holds the int64 epoch
+    second each bar begins at, sorted ascending. Indexing with a slice, mask
+    or index array returns a new ``HistoricalBars`` over views where NumPy
+    allows it, so slicing does not copy.
+    """
+
+    __slots__ = (
+        "symbol",
+        "interval",
+        "timestamps",
+        "open",
+        "high",
+        "low",
+        "close",
+        "volume",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        interval: str,
+        timestamps: np.ndarray,
+        open_: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ):
+        self.symbol = symbol
+        self.interval = interval
+        self.timestamps = timestamps
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    @classmethod
+    def from_rows(
+        cls, symbol: str, interval: str, rows: Iterable[Dict[str, Any]]
+    ) -> "HistoricalBars":
+        """Parse the ``historicals`` list of one `historicals` result."""
+        rows = list(rows)
+        prices = np.array(
+            [[row[field] for field in PRICE_FIELDS] for row in rows], dtype=np.float64
+        ).reshape(-1, len(PRICE_FIELDS))
+        timestamps = np.array(
+            [row["begins_at"][:19] for row in rows], dtype="datetime64[s]"
+        ).astype(np.int64)
+        volume = np.array([row["volume"] for row in rows], dtype=np.float64)
+        open_, high, low, close = np.ascontiguousarray(prices.T)
+        return cls(symbol, interval, timestamps, open_, high, low, close, volume)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, key: Any) -> "HistoricalBars":
+        if isinstance(key, (int, np.integer)):
+            key = slice(key, key + 1 or None)
+        return HistoricalBars(
+            self.symbol,
+            self.interval,
+            self.timestamps[key],
+            self.open[key],
+            self.high[key],
+            self.low[key],
+            self.close[key],
+            self.volume[key],
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"HistoricalBars(symbol={self.symbol!r}, interval={self.interval!r}, "
+            f"bars={len(self)})"
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memory held by the column arrays."""
+        return sum(
+            column.nbytes
+            for column in (
+                self.timestamps,
+                self.open,
+                self.high,
+                self.low,
+                self.close,
+                self.volume,
+            )
+        )
+
+    def between(self, start: TimeLike = None, end: TimeLike = None) -> "HistoricalBars":
+        """Return the bars beginning in ``[start, end)`` by binary search."""
+        first = (
+            0
+            if start is None
+            else np.searchsorted(self.timestamps, to_epoch(start), side="left")
+        )
+        last = (
+            len(self)
+            if end is None
+            else np.searchsorted(self.timestamps, to_epoch(end), side="left")
+        )
+        return self[first:last]
+
+    def resample(self, interval: Union[str, int]) -> "HistoricalBars":
+        """Aggregate into coarser bars.
+
+        Args:
+            interval (str or int): a key of ``INTERVAL_SECONDS`` or a bar length
+                in seconds
+
+        Returns:
+            (:obj:`HistoricalBars`): first open, max high, min low, last close
+                and summed volume of every bucket
+
+        """
+        seconds = INTERVAL_SECONDS.get(interval, interval)
+        if not isinstance(seconds, (int, np.integer)) or seconds <= 0:
+            raise ValueError(f"Unknown resample interval: {interval!r}")
+        if not len(self):
+            return self
+        origin = _WEEK_ORIGIN if seconds == INTERVAL_SECONDS["week"] else 0
+        buckets = (self.timestamps - origin) // seconds
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+        ends = np.r_[starts[1:], len(self)] - 1
+        return HistoricalBars(
+            self.symbol,
+            interval if isinstance(interval, str) else f"{seconds}s",
+            buckets[starts] * seconds + origin,
+            self.open[starts],
+            np.maximum.reduceat(self.high, starts),
+            np.minimum.reduceat(self.low, starts),
+            self.close[ends],
+            np.add.reduceat(self.volume, starts),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return plain lists, e.g. for JSON serialisation."""
+        return {
+            "symbol": self.symbol,
+            "interval": self.interval,
+            "begins_at": np.datetime_as_string(
+                self.timestamps.astype("datetime64[s]"), timezone="UTC"
+            ).tolist(),
+            "open": self.open.tolist(),
+            "high": self.high.tolist(),
+            "low": self.low.tolist(),
+            "close": self.close.tolist(),
+            "volume": self.volume.tolist(),
+        }
+
+
+def parse_historicals(payload: Dict[str, Any]) -> Dict[str, HistoricalBars]:
+    """Convert a `historicals` endpoint payload into bars keyed by symbol."""
+    return {
+        result["symbol"]: HistoricalBars.from_rows(
+            result["symbol"], result.get("interval", ""), result["historicals"]
+        )
+        for result in payload.get("results", [])
+    }
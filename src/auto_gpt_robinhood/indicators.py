@@ -0,0 +1,144 @@
+"""Vectorised technical indicators over historical bars.
+
+Every function works along the last axis, so a 2-D array of shape
+``(symbols, bars)`` computes the indicator for all symbols in one pass.
+Values are NaN until enough bars have been seen.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .historicals import HistoricalBars
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average using a running sum."""
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] < period:
+        return out
+    csum = np.cumsum(values, axis=-1)
+    out[..., period - 1] = csum[..., period - 1]
+    out[..., period:] = csum[..., period:] - csum[..., :-period]
+    out[..., period - 1 :] /= period
+    return out
+
+
+def ema(values: np.ndarray, period: int, alpha: Optional[float] = None) -> np.ndarray:
+    """Exponential moving average seeded with the SMA of the first ``period``.
+
+    ``alpha`` defaults to ``2 / (period + 1)``; Wilder smoothing uses
+    ``1 / period``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    alpha = 2.0 / (period + 1) if alpha is None else alpha
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] < period:
+        return out
+    out[..., period - 1] = values[..., :period].mean(axis=-1)
+    for i in range(period, values.shape[-1]):
+        out[..., i] = alpha * values[..., i] + (1 - alpha) * out[..., i - 1]
+    return out
+
+
+def rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder's relative strength index."""
+    close = np.asarray(close, dtype=np.float64)
+    out = np.full(close.shape, np.nan)
+    if close.shape[-1] <= period:
+        return out
+    delta = np.diff(close, axis=-1)
+    gain = ema(np.clip(delta, 0, None), period, alpha=1.0 / period)
+    loss = ema(np.clip(-delta, 0, None), period, alpha=1.0 / period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[..., 1:] = np.where(loss == 0, 100.0, 100.0 - 100.0 / (1 + gain / loss))
+    return out
+
+
+def macd(
+    close: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram."""
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = np.full(line.shape, np.nan)
+    if line.shape[-1] >= slow - 1 + signal:
+        signal_line[..., slow - 1 :] = ema(line[..., slow - 1 :], signal)
+    return line, signal_line, line - signal_line
+
+
+def bollinger(
+    close: np.ndarray, period: int = 20, width: float = 2.0
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Lower band, middle band (SMA) and upper band."""
+    middle = sma(close, period)
+    variance = np.clip(sma(np.square(close), period) - np.square(middle), 0, None)
+    deviation = width * np.sqrt(variance)
+    return middle - deviation, middle, middle + deviation
+
+
+def atr(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14
+) -> np.ndarray:
+    """Wilder's average true range."""
+    high, low, close = (np.asarray(a, dtype=np.float64) for a in (high, low, close))
+    previous = np.concatenate([close[..., :1], close[..., :-1]], axis=-1)
+    true_range = np.maximum(high, previous) - np.minimum(low, previous)
+    return ema(true_range, period, alpha=1.0 / period)
+
+
+def vwap(
+    high: np.ndarray, low: np.ndarray, close: np.ndarray, volume: np.ndarray
+) -> np.ndarray:
+    """Volume-weighted average of the typical price since the first bar."""
+    typical = (np.asarray(high) + np.asarray(low) + np.asarray(close)) / 3.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.cumsum(typical * volume, axis=-1) / np.cumsum(volume, axis=-1)
+
+
+def _last(values: np.ndarray) -> List[Optional[float]]:
+    return [None if np.isnan(v) else round(float(v), 4) for v in values[..., -1]]
+
+
+def summarize(bars: Iterable[HistoricalBars]) -> Dict[str, Dict[str, Optional[float]]]:
+    """Compute the latest value of every indicator for each symbol.
+
+    Symbols with the same number of bars are stacked and computed together.
+
+    Returns:
+        (:obj:`dict`): indicator name to latest value, keyed by symbol
+
+    """
+    groups = defaultdict(list)
+    for item in bars:
+        if len(item):
+            groups[len(item)].append(item)
+
+    summary = {}
+    for group in groups.values():
+        high, low, close, volume = (
+            np.stack([getattr(item, column) for item in group])
+            for column in ("high", "low", "close", "volume")
+        )
+        lower, _, upper = bollinger(close)
+        line, signal_line, histogram = macd(close)
+        columns = {
+            "close": close,
+            "change_pct": (close / close[..., :1] - 1) * 100,
+            "sma_20": sma(close, 20),
+            "sma_50": sma(close, 50),
+            "ema_12": ema(close, 12),
+            "ema_26": ema(close, 26),
+            "rsi_14": rsi(close),
+            "macd": line,
+            "macd_signal": signal_line,
+            "macd_hist": histogram,
+            "bb_lower": lower,
+            "bb_upper": upper,
+            "atr_14": atr(high, low, close),
+            "vwap": vwap(high, low, close, volume),
+        }
+        latest = {name: _last(values) for name, values in columns.items()}
+        for row, item in enumerate(group):
+            summary[item.symbol] = {name: latest[name][row] for name in columns}
+    return summary
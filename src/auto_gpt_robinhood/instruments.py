@@ -0,0 +1,124 @@
+"""Long-lived, on-disk cache of instrument metadata."""
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from . import urls
+from .concurrency import chunked, fan_out
+
+Fetch = Callable[[str], Dict[str, Any]]
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentCache:
+    """
+    Instrument payloads keyed by URL and by symbol.
+
+    Instrument metadata almost never changes, so entries do not expire and
+    the cache is persisted to ``path`` as JSON. Misses are fetched through
+    the batch ``instruments/?ids=`` endpoint, ``batch_size`` ids per request
+    with ``max_workers`` requests in flight.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        fetch: Fetch,
+        batch_size: int = 50,
+        max_workers: int = 8,
+    ):
+        self.path = Path(path).expanduser() if path else None
+        self.fetch = fetch
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._by_url: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_symbol: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached instrument for ``url`` without fetching it."""
+        return self._entries().get(urls.instrument_url(urls.instrument_id(url)))
+
+    def by_symbol(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Return the cached instrument for ``symbol`` without fetching it."""
+        self._entries()
+        return self._by_symbol.get(symbol.upper())
+
+    def put(self, instruments: Sequence[Dict[str, Any]]) -> None:
+        """Add instrument payloads to the cache."""
+        entries = self._entries()
+        with self._lock:
+            for instrument in instruments:
+                url = urls.instrument_url(instrument["id"])
+                entries[url] = instrument
+                if instrument.get("symbol"):
+                    self._by_symbol[instrument["symbol"].upper()] = instrument
+
+    def resolve(self, instrument_urls: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+        """Return the instrument for every URL, fetching only the misses.
+
+        Returns:
+            (:obj:`list` of :obj:`dict`): instruments in input order, None for
+                any URL that could not be fetched
+
+        """
+        ids = list(dict.fromkeys(urls.instrument_id(url) for url in instrument_urls))
+        entries = self._entries()
+        missing = [id_ for id_ in ids if urls.instrument_url(id_) not in entries]
+        if missing:
+            fetched = []
+            for _, payload, error in fan_out(
+                self._fetch_batch,
+                list(chunked(missing, self.batch_size)),
+                self.max_workers,
+            ):
+                if error is None:
+                    fetched.extend(payload)
+            self.put(fetched)
+            self.save()
+        return [self.get(url) for url in instrument_urls]
+
+    def save(self) -> None:
+        """Write the cache to ``path`` atomically.
+
+        A failed write is logged and otherwise ignored: the cache stays
+        usable in memory and is written again after the next fetch.
+        """
+        if self.path is None:
+            return
+        # One writer at a time, so concurrent saves never share the temp file.
+        with self._lock:
+            try:
+                data = json.dumps(list(self._entries().values()))
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_suffix(".tmp")
+                tmp.write_text(data)
+                os.replace(tmp, self.path)
+            except (OSError, TypeError, ValueError) as error:
+                logger.warning(
+                    "Could not save instrument cache %s: %s", self.path, error
+                )
+
+    def _fetch_batch(self, ids: Sequence[str]) -> List[Dict[str, Any]]:
+        payload = self.fetch(f"{urls.INSTRUMENTS}?ids={','.join(ids)}")
+        return [item for item in payload.get("results", []) if item]
+
+    def _entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._by_url is None:
+            with self._lock:
+                if self._by_url is None:
+                    self._by_url = {}
+                    self.put(self._load())
+        return self._by_url
+
+    def _load(self) -> List[Dict[str, Any]]:
+        if self.path is None or not self.path.is_file():
+            return []
+        try:
+            return json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return []
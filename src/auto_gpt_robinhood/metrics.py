@@ -0,0 +1,388 @@
+"""In-process metrics, Prometheus/OpenMetrics export and sampled profiling."""
+import cProfile
+import functools
+import io
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+"""Latency histogram upper bounds, in seconds."""
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, str, Dict[str, Any], float]
+"""``(name, type, labels, value)`` reported by a collector."""
+
+
+def _labels(labels: Dict[str, Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in pairs
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _family(name: str, kind: str, openmetrics: bool) -> str:
+    # OpenMetrics names a counter family without its samples' _total suffix.
+    if openmetrics and kind == "counter" and name.endswith("_total"):
+        return name[: -len("_total")]
+    return name
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    Cumulative bucket counts plus a window of recent samples.
+
+    Buckets feed the exported histogram; quantiles are computed from the
+    last ``window`` observations, so they track current behaviour.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...], window: int):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.recent: "deque[float]" = deque(maxlen=window)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = 0
+        while index < len(self.buckets) and value > self.buckets[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Return the ``q`` quantile of the recent window, None if empty."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counters and latency histograms keyed by name and labels.
+
+    Collectors registered with :meth:`add_collector` are called at export
+    time, so values already counted elsewhere (cache hits, limiter queues)
+    are reported without double bookkeeping.
+    """
+
+    def __init__(
+        self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, window: int = 1024
+    ):
+        self.buckets = buckets
+        self.window = window
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._lock = threading.Lock()
+
+    def describe(self, name: str, text: str) -> None:
+        """Set the HELP text exported for ``name``."""
+        self._help[name] = text
+
+    def inc(self, name: str, amount: float = 1, **labels: Any) -> None:
+        """Add ``amount`` to a counter."""
+        key = _labels(labels)
+        with self._lock:
+            family = self._counters.setdefault(name, {})
+            family[key] = family.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record one observation in a histogram."""
+        key = _labels(labels)
+        with self._lock:
+            family = self._histograms.setdefault(name, {})
+            histogram = family.get(key)
+            if histogram is None:
+                histogram = family[key] = Histogram(self.buckets, self.window)
+            histogram.observe(value)
+
+    def add_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """Register a callable reporting extra samples at export time."""
+        self._collectors.append(collector)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return counters and per-series count, mean, p50, p95 and p99."""
+        with self._lock:
+            counters = {
+                name: {_format_labels(key): value for key, value in family.items()}
+                for name, family in self._counters.items()
+            }
+            histograms = {
+                name: {
+                    _format_labels(key): {
+                        "count": histogram.count,
+                        "mean": histogram.sum / histogram.count,
+                        **{
+                            f"p{int(q * 100)}": histogram.quantile(q)
+                            for q in QUANTILES
+                        },
+                    }
+                    for key, histogram in family.items()
+                }
+                for name, family in self._histograms.items()
+            }
+        for name, _, labels, value in self._collect():
+            counters.setdefault(name, {})[_format_labels(_labels(labels))] = value
+        return {"counters": counters, "latency": histograms}
+
+    def exposition(self, openmetrics: bool = False) -> str:
+        """Render every metric in the Prometheus or OpenMetrics text format."""
+        lines: List[str] = []
+
+        def header(name: str, kind: str) -> None:
+            family_name = _family(name, kind, openmetrics)
+            if name in self._help:
+                lines.append(f"# HELP {family_name} {self._help[name]}")
+            lines.append(f"# TYPE {family_name} {kind}")
+
+        with self._lock:
+            for name, family in sorted(self._counters.items()):
+                header(name, "counter")
+                for key, value in family.items():
+                    lines.append(f"{name}{_format_labels(key)} {_format_value(value)}")
+            for name, family in sorted(self._histograms.items()):
+                header(name, "histogram")
+                for key, histogram in family.items():
+                    cumulative = 0
+                    bounds = histogram.buckets + (float("inf"),)
+                    for bound, count in zip(bounds, histogram.counts):
+                        cumulative += count
+                        le = (("le", _format_value(float(bound))),)
+                        lines.append(
+                            f"{name}_bucket{_format_labels(key, le)} {cumulative}"
+                        )
+                    series = _format_labels(key)
+                    lines.append(f"{name}_count{series} {histogram.count}")
+                    lines.append(f"{name}_sum{series} {_format_value(histogram.sum)}")
+                quantile_name = f"{name}_quantile"
+                header(quantile_name, "gauge")
+                for key, histogram in family.items():
+                    for q in QUANTILES:
+                        value = histogram.quantile(q)
+                        if value is not None:
+                            extra = (("quantile", str(q)),)
+                            lines.append(
+                                f"{quantile_name}{_format_labels(key, extra)}"
+                                f" {_format_value(value)}"
+                            )
+        seen = set()
+        for name, kind, labels, value in sorted(
+            self._collect(), key=lambda sample: sample[0]
+        ):
+            if name not in seen:
+                seen.add(name)
+                header(name, kind)
+            lines.append(
+                f"{name}{_format_labels(_labels(labels))} {_format_value(value)}"
+            )
+        if openmetrics:
+            lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: Union[str, Path], openmetrics: bool = False) -> None:
+        """Write the exposition to ``path`` atomically, e.g. for node_exporter."""
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(self.exposition(openmetrics))
+        os.replace(tmp, path)
+
+    def write_every(
+        self, path: Union[str, Path], interval: float, openmetrics: bool = False
+    ) -> threading.Thread:
+        """Rewrite ``path`` every ``interval`` seconds from a daemon thread."""
+
+        def run() -> None:
+            while True:
+                time.sleep(interval)
+                try:
+                    self.write(path, openmetrics)
+                except OSError:
+                    pass
+
+        thread = threading.Thread(target=run, name="robinhood-metrics", daemon=True)
+        thread.start()
+        return thread
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve ``/metrics`` from a daemon thread and return the server.
+
+        Scrapers asking for OpenMetrics in their Accept header get it.
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # pylint: disable=invalid-name
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get(
+                    "Accept", ""
+                )
+                body = registry.exposition(openmetrics).encode()
+                self.send_response(200)
+                self.send_header(
+                    "Content-Type",
+                    OPENMETRICS_CONTENT_TYPE
+                    if openmetrics
+                    else PROMETHEUS_CONTENT_TYPE,
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(
+            target=server.serve_forever, name="robinhood-metrics", daemon=True
+        ).start()
+        return server
+
+    def _collect(self) -> List[Sample]:
+        samples = []
+        for collector in self._collectors:
+            samples.extend(collector())
+        return samples
+
+
+class SamplingProfiler:
+    """
+    Runs a random ``sample_rate`` fraction of calls under :mod:`cProfile`.
+
+    Only one call is profiled at a time, since the interpreter supports a
+    single active profiler; calls arriving meanwhile run unprofiled. Stats
+    accumulate across samples until :meth:`reset`.
+    """
+
+    def __init__(self, sample_rate: float = 0.0):
+        self.sample_rate = sample_rate
+        self.samples = 0
+        self._stats: Optional[pstats.Stats] = None
+        self._busy = threading.Lock()
+        self._lock = threading.Lock()
+
+    def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call ``func``, profiling it if this call is sampled."""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return func(*args, **kwargs)
+        if not self._busy.acquire(blocking=False):
+            return func(*args, **kwargs)
+        profile = cProfile.Profile()
+        try:
+            return profile.runcall(func, *args, **kwargs)
+        finally:
+            self._busy.release()
+            with self._lock:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profile)
+                else:
+                    self._stats.add(profile)
+                self.samples += 1
+
+    def report(self, limit: int = 25, sort: str = "cumulative") -> str:
+        """Return the top ``limit`` functions of the accumulated profile."""
+        with self._lock:
+            if self._stats is None:
+                return "no samples"
+            out = io.StringIO()
+            self._stats.stream = out
+            self._stats.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
+
+    def dump(self, path: Union[str, Path]) -> None:
+        """Write the accumulated profile for ``pstats``/snakeviz."""
+        with self._lock:
+            if self._stats is not None:
+                self._stats.dump_stats(str(Path(path).expanduser()))
+
+    def reset(self) -> None:
+        """Drop every accumulated sample."""
+        with self._lock:
+            self._stats = None
+            self.samples = 0
+
+
+def _instrumented(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: "InstrumentedMixin", *args: Any, **kwargs: Any) -> Any:
+        metrics = self.metrics
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = self.profiler.run(method, self, *args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            metrics.observe(
+                "robinhood_call_duration_seconds",
+                time.perf_counter() - started,
+                method=name,
+            )
+            metrics.inc("robinhood_calls_total", method=name, outcome=outcome)
+
+    return wrapper
+
+
+class InstrumentedMixin:
+    """
+    Times every method named in ``INSTRUMENTED`` into ``metrics``.
+
+    Each call adds to ``robinhood_calls_total{method, outcome}`` and
+    ``robinhood_call_duration_seconds{method}``, and may be sampled by
+    ``profiler``.
+    """
+
+    INSTRUMENTED: tuple = ()
+
+    metrics: MetricsRegistry
+    profiler: SamplingProfiler
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        for name in cls.INSTRUMENTED:
+            setattr(cls, name, _instrumented(name, getattr(cls, name)))
@@ -0,0 +1,340 @@
+"""Deduplicated, incrementally fetched news with a local keyword index."""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from . import urls
+from .concurrency import fan_out, unique
+
+Fetch = Callable[[str], Dict[str, Any]]
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the"
+    " this to was were will with".split()
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    content_hash TEXT NOT NULL UNIQUE,
+    published_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_published ON articles (published_at);
+CREATE TABLE IF NOT EXISTS article_symbols (
+    symbol TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    PRIMARY KEY (symbol, article_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    article_id INTEGER NOT NULL,
+    PRIMARY KEY (term, article_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cursors (
+    symbol TEXT PRIMARY KEY,
+    published_at TEXT,
+    pending TEXT,
+    resume TEXT
+);
+"""
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9'.&-]*[a-z0-9]|[a-z0-9]")
+
+
+def terms(text: str) -> List[str]:
+    """Split text into lower-case index terms, dropping stopwords."""
+    words = _WORD.findall(text.lower())
+    return list(dict.fromkeys(word for word in words if word not in STOPWORDS))
+
+
+def canonical_url(url: str) -> str:
+    """Normalize an article URL so syndicated copies compare equal.
+
+    The scheme and host are lower-cased, ``www.`` and the fragment dropped,
+    ``utm_*`` tracking parameters removed and the trailing slash stripped.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    host = host[4:] if host.startswith("www.") else host
+    query = urlencode(
+        [
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+        ]
+    )
+    return urlunsplit(("https", host, parts.path.rstrip("/"), query, ""))
+
+
+def content_hash(article: Dict[str, Any]) -> str:
+    """Hash the normalized title and summary, so re-posted stories match."""
+    text = " ".join(
+        " ".join(str(article.get(field) or "").lower().split())
+        for field in ("title", "summary")
+    ).strip() or str(article.get("url"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class NewsStore:
+    """
+    News articles for every tracked symbol in one SQLite database.
+
+    ``ingest`` fetches the `news` feed of many symbols concurrently and keeps
+    a cursor per symbol at the newest ``published_at`` read without gaps, so
+    later runs stop paging at the first article already read. When a run
+    hits ``max_pages`` before reaching the cursor, the next page's URL is
+    saved and the next run resumes there, and the cursor only moves once the
+    gap is closed. A symbol's first run reads at most ``max_pages`` pages of
+    history. Each symbol's articles are stored as soon as its fetch
+    finishes. An article whose canonical URL or content hash is already
+    stored is not stored again, only linked to the new symbol. Titles and
+    summaries go into an inverted index of terms, which ``search`` answers
+    from without any network call.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]],
+        fetch: Fetch,
+        max_workers: int = 8,
+        max_pages: int = 3,
+    ):
+        path = Path(path).expanduser() if path else None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.fetch = fetch
+        self.max_workers = max_workers
+        self.max_pages = max_pages
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(path) if path else ":memory:", check_same_thread=False
+        )
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Every symbol ingested so far."""
+        with self._lock:
+            rows = self._db.execute("SELECT symbol FROM cursors ORDER BY symbol")
+            return [row["symbol"] for row in rows]
+
+    def ingest(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Fetch and store the news of ``symbols``, default every tracked one.
+
+        Returns:
+            (:obj:`dict`): ``new`` articles, as compact records newest first,
+                ``duplicates`` skipped, and ``errors`` per symbol
+
+        """
+        symbols = unique(symbols) if symbols is not None else self.symbols
+        new: List[int] = []
+        duplicates = 0
+        errors = {}
+        for symbol, stored, error in fan_out(self._ingest, symbols, self.max_workers):
+            if error is not None:
+                errors[symbol] = repr(error)
+                continue
+            new.extend(stored[0])
+            duplicates += stored[1]
+        return {
+            "new": self._records(new),
+            "duplicates": duplicates,
+            "errors": errors,
+        }
+
+    def search(
+        self,
+        query: str = "",
+        symbols: Optional[Sequence[str]] = None,
+        since: Optional[str] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """Return stored articles matching ``query``, best first.
+
+        Args:
+            query (str, optional): keywords; articles rank by how many of them
+                they contain, then by recency. Empty means newest first.
+            symbols (list<str>, optional): only articles about these tickers
+            since (str, optional): ISO-8601 lower bound on ``published_at``
+            limit (int, optional): maximum number of articles
+
+        Returns:
+            (:obj:`list` of :obj:`dict`): compact article records with
+                ``score``, the number of query terms matched
+
+        """
+        wanted = terms(query or "")
+        clauses, params = [], []
+        if wanted:
+            sql = (
+                "SELECT a.id, count(*) AS score FROM postings p"
+                " JOIN articles a ON a.id = p.article_id"
+            )
+            clauses.append(f"p.term IN ({', '.join('?' * len(wanted))})")
+            params.extend(wanted)
+        else:
+            sql = "SELECT a.id, 0 AS score FROM articles a"
+        if symbols:
+            symbols = unique(symbols)
+            clauses.append(
+                "a.id IN (SELECT article_id FROM article_symbols"
+                f" WHERE symbol IN ({', '.join('?' * len(symbols))}))"
+            )
+            params.extend(symbols)
+        if since:
+            clauses.append("a.published_at >= ?")
+            params.append(since)
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        if wanted:
+            sql += " GROUP BY a.id"
+        sql += " ORDER BY score DESC, a.published_at DESC LIMIT ?"
+        params.append(int(limit))
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        scores = {row["id"]: row["score"] for row in rows}
+        records = self._records(list(scores))
+        for record in records:
+            record["score"] = scores[record["id"]]
+        records.sort(key=lambda record: -record["score"])
+        return records
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM articles").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    def _ingest(self, symbol: str) -> tuple:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT published_at, pending, resume FROM cursors WHERE symbol = ?",
+                (symbol,),
+            ).fetchone()
+        cursor, pending, resume = tuple(row) if row else (None, None, None)
+        articles, pages = [], 0
+        url = resume or f"{urls.NEWS}{symbol}/"
+        while url and pages < self.max_pages:
+            page = self.fetch(url)
+            pages += 1
+            results = page.get("results") or []
+            fresh = [
+                article
+                for article in results
+                if cursor is None or (article.get("published_at") or "") > cursor
+            ]
+            articles.extend(fresh)
+            # The feed is newest first: an old article means we caught up.
+            url = None if len(fresh) < len(results) else page.get("next")
+        newest = max(
+            [pending or cursor or ""]
+            + [article.get("published_at") or "" for article in articles]
+        )
+        if url and cursor is not None:
+            # Out of pages before reaching the cursor: resume from ``url``.
+            state = (cursor, newest, url)
+        else:
+            state = (newest or None, None, None)
+        return self._store(symbol, articles, state)
+
+    def _store(
+        self,
+        symbol: str,
+        articles: List[Dict[str, Any]],
+        state: Tuple[Optional[str], Optional[str], Optional[str]],
+    ) -> tuple:
+        new, duplicates = [], 0
+        with self._lock, self._db:
+            for article in articles:
+                url = canonical_url(article.get("url") or article.get("uuid") or "")
+                digest = content_hash(article)
+                row = self._db.execute(
+                    "SELECT id FROM articles WHERE url = ? OR content_hash = ?",
+                    (url, digest),
+                ).fetchone()
+                if row is not None:
+                    duplicates += 1
+                    article_id = row["id"]
+                else:
+                    article_id = self._db.execute(
+                        "INSERT INTO articles (url, content_hash, published_at, data)"
+                        " VALUES (?, ?, ?, ?)",
+                        (url, digest, article.get("published_at"), json.dumps(article)),
+                    ).lastrowid
+                    self._db.executemany(
+                        "INSERT OR IGNORE INTO postings VALUES (?, ?)",
+                        [
+                            (term, article_id)
+                            for term in terms(
+                                f"{article.get('title') or ''} "
+                                f"{article.get('summary') or ''}"
+                            )
+                        ],
+                    )
+                    new.append(article_id)
+                self._db.execute(
+                    "INSERT OR IGNORE INTO article_symbols VALUES (?, ?)",
+                    (symbol, article_id),
+                )
+            self._db.execute(
+                "INSERT INTO cursors (symbol, published_at, pending, resume)"
+                " VALUES (?, ?, ?, ?) ON CONFLICT (symbol) DO UPDATE"
+                " SET published_at = excluded.published_at,"
+                " pending = excluded.pending, resume = excluded.resume",
+                (symbol, *state),
+            )
+        return new, duplicates
+
+    def _records(self, ids: List[int]) -> List[Dict[str, Any]]:
+        if not ids:
+            return []
+        marks = ", ".join("?" * len(ids))
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT id, data FROM articles WHERE id IN ({marks})"
+                " ORDER BY published_at DESC",
+                ids,
+            ).fetchall()
+            links = self._db.execute(
+                "SELECT article_id, symbol FROM article_symbols"
+                f" WHERE article_id IN ({marks}) ORDER BY symbol",
+                ids,
+            ).fetchall()
+        symbols: Dict[int, List[str]] = {}
+        for link in links:
+            symbols.setdefault(link["article_id"], []).append(link["symbol"])
+        records = []
+        for row in rows:
+            article = json.loads(row["data"])
+            records.append(
+                {
+                    "id": row["id"],
+                    "symbols": symbols.get(row["id"], []),
+                    "title": article.get("title"),
+                    "source": article.get("source"),
+                    "published_at": article.get("published_at"),
+                    "url": article.get("url"),
+                    "summary": article.get("summary") or article.get("preview_text"),
+                }
+            )
+        return records
@@ -0,0 +1,188 @@
+"""Whole option-chain snapshots with market data, stored as columns."""
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from . import urls
+from .concurrency import chunked, fan_out
+
+MARKET_DATA_FIELDS = {
+    "bid": "bid_price",
+    "ask": "ask_price",
+    "mark": "adjusted_mark_price",
+    "last": "last_trade_price",
+    "iv": "implied_volatility",
+    "delta": "delta",
+    "gamma": "gamma",
+    "theta": "theta",
+    "vega": "vega",
+    "rho": "rho",
+    "open_interest": "open_interest",
+    "volume": "volume",
+}
+"""Snapshot column name to `marketdata/options` field."""
+
+Fetch = Callable[[str], Dict[str, Any]]
+
+
+def _floats(values: Iterable[Any]) -> np.ndarray:
+    return np.array(
+        [np.nan if value in (None, "") else value for value in values],
+        dtype=np.float64,
+    )
+
+
+class OptionChainSnapshot:
+    """
+    Every contract of an option chain with its quote and greeks.
+
+    Columns are NumPy arrays of equal length: ``id``, ``type``, ``expiration``
+    (datetime64[D]), ``strike`` and one float64 column per key of
+    ``MARKET_DATA_FIELDS``, NaN where the API returned nothing. Columns are
+    available as attributes, and filtering builds a boolean mask over them
+    without any further I/O.
+    """
+
+    def __init__(self, symbol: str, columns: Dict[str, np.ndarray]):
+        self.symbol = symbol
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        try:
+            return self.__dict__["columns"][name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __getitem__(self, key: Any) -> "OptionChainSnapshot":
+        return OptionChainSnapshot(
+            self.symbol, {name: column[key] for name, column in self.columns.items()}
+        )
+
+    def __repr__(self) -> str:
+        return f"OptionChainSnapshot(symbol={self.symbol!r}, contracts={len(self)})"
+
+    def filter(
+        self,
+        option_type: Optional[str] = None,
+        expiration_dates: Optional[Sequence[str]] = None,
+        min_strike: Optional[float] = None,
+        max_strike: Optional[float] = None,
+        **ranges: Sequence[Optional[float]],
+    ) -> "OptionChainSnapshot":
+        """Select contracts by type, expiry and column ranges.
+
+        Args:
+            option_type (str, optional): 'call' or 'put'
+            expiration_dates (list<str>, optional): YYYY-MM-DD dates to keep
+            min_strike (float, optional): lowest strike to keep
+            max_strike (float, optional): highest strike to keep
+            **ranges: ``column=(low, high)`` bounds, either may be None,
+                e.g. ``delta=(0.25, 0.5)``
+
+        Returns:
+            (:obj:`OptionChainSnapshot`): the matching contracts
+
+        """
+        mask = np.ones(len(self), dtype=bool)
+        if option_type is not None:
+            mask &= self.columns["type"] == option_type
+        if expiration_dates is not None:
+            dates = np.array(list(expiration_dates), dtype="datetime64[D]")
+            mask &= np.isin(self.columns["expiration"], dates)
+        ranges.setdefault("strike", (min_strike, max_strike))
+        for name, (low, high) in ranges.items():
+            if low is not None:
+                mask &= self.columns[name] >= low
+            if high is not None:
+                mask &= self.columns[name] <= high
+        return self[mask]
+
+    def to_records(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` contracts as plain dicts."""
+        rows = []
+        for index in range(len(self) if limit is None else min(limit, len(self))):
+            row = {}
+            for name, column in self.columns.items():
+                value = column[index : index + 1].tolist()[0]
+                if name == "expiration":
+                    value = value.isoformat()
+                elif isinstance(value, float) and np.isnan(value):
+                    value = None
+                row[name] = value
+            rows.append(row)
+        return rows
+
+
+def build_snapshot(
+    symbol: str,
+    chain_id: str,
+    fetch: Fetch,
+    expiration_dates: Optional[Sequence[str]] = None,
+    option_type: Optional[str] = None,
+    batch_size: int = 40,
+    max_workers: int = 8,
+) -> OptionChainSnapshot:
+    """Fetch every contract of a chain and its market data concurrently.
+
+    Contracts are listed with one paginated request per expiration date, and
+    their market data is pulled ``batch_size`` contracts per request.
+    """
+    if expiration_dates is None:
+        expiration_dates = fetch(f"{urls.OPTIONS_CHAINS}{chain_id}/")[
+            "expiration_dates"
+        ]
+    type_filter = f"&type={option_type}" if option_type else ""
+
+    def list_contracts(date: str) -> List[Dict[str, Any]]:
+        contracts = []
+        url = (
+            f"{urls.OPTIONS_INSTRUMENTS}?chain_id={chain_id}&expiration_dates={date}"
+            f"&state=active&tradability=tradable{type_filter}"
+        )
+        while url:
+            page = fetch(url)
+            contracts.extend(page["results"])
+            url = page.get("next")
+        return contracts
+
+    contracts = []
+    for _, result, error in fan_out(
+        list_contracts, list(expiration_dates), max_workers
+    ):
+        if error is not None:
+            raise error
+        contracts.extend(result)
+
+    def market_data(ids: Sequence[str]) -> List[Dict[str, Any]]:
+        return fetch(f"{urls.MARKETDATA_OPTIONS}?ids={','.join(ids)}")["results"]
+
+    quotes = {}
+    ids = [contract["id"] for contract in contracts]
+    for _, result, error in fan_out(
+        market_data, list(chunked(ids, batch_size)), max_workers
+    ):
+        if error is not None:
+            raise error
+        for quote in result:
+            if quote:
+                quote_id = quote.get("instrument_id") or urls.instrument_id(
+                    quote["instrument"]
+                )
+                quotes[quote_id] = quote
+
+    columns = {
+        "id": np.array(ids, dtype=object),
+        "type": np.array([contract["type"] for contract in contracts], dtype="U4"),
+        "expiration": np.array(
+            [contract["expiration_date"] for contract in contracts],
+            dtype="datetime64[D]",
+        ),
+        "strike": _floats(contract["strike_price"] for contract in contracts),
+    }
+    for name, field in MARKET_DATA_FIELDS.items():
+        columns[name] = _floats(quotes.get(id_, {}).get(field) for id_ in ids)
+    order = np.lexsort((columns["strike"], columns["type"], columns["expiration"]))
+    return OptionChainSnapshot(symbol.upper(), columns)[order]
@@ -0,0 +1,225 @@
+"""Local, incrementally synced ledger of the account's stock orders."""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Union
+from urllib.parse import quote
+
+from . import urls
+
+Fetch = Callable[[str], Dict[str, Any]]
+ResolveSymbols = Callable[[Sequence[str]], List[Optional[str]]]
+
+OPEN_STATES = ("unconfirmed", "queued", "confirmed", "partially_filled")
+"""Order states that can still fill or be cancelled."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id TEXT PRIMARY KEY,
+    symbol TEXT,
+    state TEXT,
+    side TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_symbol ON orders (symbol, state, updated_at);
+CREATE INDEX IF NOT EXISTS orders_state ON orders (state, updated_at);
+CREATE INDEX IF NOT EXISTS orders_updated ON orders (updated_at);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+class OrderLedger:
+    """
+    Every order of the account in an indexed SQLite table.
+
+    ``sync`` asks the `orders` endpoint only for orders updated since the
+    newest ``updated_at`` already stored, so after the first run it usually
+    reads a single page. Orders are indexed by id, symbol, state and update
+    time, and ``query`` answers from the table without any network call.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]],
+        fetch: Fetch,
+        resolve_symbols: ResolveSymbols,
+        min_interval: float = 30.0,
+    ):
+        path = Path(path).expanduser() if path else None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.fetch = fetch
+        self.resolve_symbols = resolve_symbols
+        self.min_interval = min_interval
+        self._synced_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._db = sqlite3.connect(
+            str(path) if path else ":memory:", check_same_thread=False
+        )
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def cursor(self) -> Optional[str]:
+        """The newest ``updated_at`` stored, where the next sync resumes."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM meta WHERE key = 'cursor'"
+            ).fetchone()
+        return row["value"] if row else None
+
+    def sync(self, force: bool = False) -> int:
+        """Pull orders updated since the cursor, returning how many were stored.
+
+        Calls within ``min_interval`` seconds of the last sync do nothing
+        unless ``force`` is set. Concurrent callers wait for one sync.
+        """
+        with self._sync_lock:
+            now = time.monotonic()
+            if (
+                not force
+                and self._synced_at is not None
+                and now - self._synced_at < self.min_interval
+            ):
+                return 0
+            cursor = self.cursor
+            url = urls.ORDERS
+            if cursor is not None:
+                # The bound is inclusive, so the newest stored order is
+                # re-read and simply upserted again.
+                url += f"?updated_at[gte]={quote(cursor)}"
+            stored, newest = 0, cursor or ""
+            while url:
+                page = self.fetch(url)
+                orders = page.get("results", [])
+                newest = max(
+                    [newest] + [order.get("updated_at") or "" for order in orders]
+                )
+                url = page.get("next")
+                # Pages come newest first, so the cursor only moves once the
+                # oldest page is stored; a failure before then resumes from
+                # the old cursor and re-reads every page.
+                stored += self.upsert(orders, cursor=None if url else newest)
+            self._synced_at = now
+        return stored
+
+    def expire(self) -> None:
+        """Make the next ``sync`` call fetch even if one ran recently."""
+        self._synced_at = None
+
+    def upsert(
+        self, orders: Sequence[Dict[str, Any]], cursor: Optional[str] = None
+    ) -> int:
+        """Store or replace orders, and advance the cursor to ``cursor`` if set.
+
+        The orders and the cursor are written in one transaction.
+        """
+        if not orders and not cursor:
+            return 0
+        instruments = [order["instrument"] for order in orders]
+        symbols = self.resolve_symbols(instruments) if instruments else []
+        rows = [
+            (
+                order["id"],
+                order.get("symbol") or symbol,
+                order.get("state"),
+                order.get("side"),
+                order.get("created_at"),
+                order.get("updated_at"),
+                json.dumps(order),
+            )
+            for order, symbol in zip(orders, symbols)
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO orders VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            if cursor:
+                self._db.execute(
+                    "INSERT INTO meta VALUES ('cursor', ?) ON CONFLICT (key)"
+                    " DO UPDATE SET value = max(value, excluded.value)",
+                    (cursor,),
+                )
+        return len(rows)
+
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Return one stored order by id."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT symbol, data FROM orders WHERE id = ?", (order_id,)
+            ).fetchone()
+        return self._order(row) if row else None
+
+    def query(
+        self,
+        symbol: Optional[str] = None,
+        state: Optional[Union[str, Iterable[str]]] = None,
+        side: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return stored orders, newest update first.
+
+        Args:
+            symbol (str, optional): stock ticker
+            state (str or list<str>, optional): order state(s); 'open' means
+                any of ``OPEN_STATES``
+            side (str, optional): 'buy' or 'sell'
+            since (str, optional): ISO-8601 lower bound on ``updated_at``
+            until (str, optional): ISO-8601 upper bound on ``updated_at``
+            limit (int, optional): maximum number of orders
+
+        Returns:
+            (:obj:`list` of :obj:`dict`): the matching order payloads
+
+        """
+        clauses, params = [], []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol.upper())
+        if state is not None:
+            states = [state] if isinstance(state, str) else list(state)
+            if "open" in states:
+                states = [item for item in states if item != "open"]
+                states.extend(OPEN_STATES)
+            clauses.append(f"state IN ({', '.join('?' * len(states))})")
+            params.extend(states)
+        if side is not None:
+            clauses.append("side = ?")
+            params.append(side.lower())
+        if since is not None:
+            clauses.append("updated_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("updated_at < ?")
+            params.append(until)
+        sql = "SELECT symbol, data FROM orders"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY updated_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [self._order(row) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT count(*) FROM orders").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
+
+    @staticmethod
+    def _order(row: sqlite3.Row) -> Dict[str, Any]:
+        order = json.loads(row["data"])
+        order.setdefault("symbol", row["symbol"])
+        return order
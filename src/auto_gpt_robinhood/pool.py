@@ -0,0 +1,143 @@
+"""Per-account Robinhood sessions served from one process."""
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from .session import RobinhoodSession, passive
+
+current_account: ContextVar[Optional[str]] = ContextVar(
+    "robinhood_account", default=None
+)
+"""Account the calls in this context act for; None is the primary account."""
+
+
+def parse_accounts(value: Optional[str]) -> List[str]:
+    """Parse ``ROBINHOOD_ACCOUNTS``: comma separated, case-insensitive names."""
+    names = (name.strip().lower() for name in (value or "").split(","))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def account_path(path: Union[str, Path], account: Optional[str]) -> Path:
+    """Return ``path`` with ``-<account>`` before its suffix for named accounts.
+
+    The primary account (None) keeps ``path`` unchanged, so single-account
+    installs find their existing files.
+    """
+    path = Path(path).expanduser()
+    if account is None:
+        return path
+    suffixes = "".join(path.suffixes)
+    stem = path.name[: len(path.name) - len(suffixes)] if suffixes else path.name
+    return path.with_name(f"{stem}-{account}{suffixes}")
+
+
+class SessionPool:
+    """
+    Lazily logged-in sessions for a fixed set of named accounts.
+
+    A session is created on the first call for its account and logs in on
+    first use. Connected sessions unused for ``idle_timeout`` seconds are
+    dropped on the next access, and when connecting one more would exceed
+    ``max_sessions`` the least recently used connected session is dropped
+    first. A dropped session keeps its saved token, so reconnecting is a
+    token refresh rather than a full login.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str], RobinhoodSession],
+        accounts: Sequence[str],
+        max_sessions: int = 4,
+        idle_timeout: float = 900.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.factory = factory
+        self.accounts = list(accounts)
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.evictions = 0
+        self._clock = clock
+        self._sessions: Dict[str, RobinhoodSession] = {}
+        self._used: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, account: object) -> bool:
+        return account in self.accounts
+
+    def session(self, account: str) -> RobinhoodSession:
+        """Return the session of ``account``, creating it if needed."""
+        if account not in self.accounts:
+            raise KeyError(f"Unknown Robinhood account {account!r}")
+        with self._lock:
+            session = self._sessions.get(account)
+            if session is None:
+                session = self._sessions[account] = self.factory(account)
+            return session
+
+    def client(self, account: str) -> Any:
+        """Return the logged-in pyrh client of ``account``.
+
+        While :data:`session.passive` is set the session is neither connected
+        nor counted as used, so background work never keeps it alive.
+        """
+        session = self.session(account)
+        if passive.get():
+            return session.client
+        with self._lock:
+            now = self._clock()
+            self._used[account] = now
+            self._evict(self._idle(now))
+            if not session.connected:
+                connected = [
+                    name
+                    for name, other in self._sessions.items()
+                    if other.connected and name != account
+                ]
+                connected.sort(key=lambda name: self._used.get(name, 0.0))
+                excess = len(connected) + 1 - self.max_sessions
+                self._evict(connected[: max(excess, 0)])
+        return session.client
+
+    def evict_idle(self) -> List[str]:
+        """Drop every connected session idle for ``idle_timeout``."""
+        with self._lock:
+            idle = self._idle(self._clock())
+            self._evict(idle)
+        return idle
+
+    def close(self) -> None:
+        """Drop every connected session."""
+        with self._lock:
+            self._evict([name for name in self._sessions])
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the accounts, which of them are connected and evictions."""
+        with self._lock:
+            now = self._clock()
+            return {
+                "accounts": list(self.accounts),
+                "connected": {
+                    name: round(now - self._used.get(name, now), 3)
+                    for name, session in self._sessions.items()
+                    if session.connected
+                },
+                "max_sessions": self.max_sessions,
+                "evictions": self.evictions,
+            }
+
+    def _idle(self, now: float) -> List[str]:
+        return [
+            name
+            for name, session in self._sessions.items()
+            if session.connected
+            and now - self._used.get(name, now) >= self.idle_timeout
+        ]
+
+    def _evict(self, accounts: Sequence[str]) -> None:
+        for account in accounts:
+            if self._sessions[account].connected:
+                # Calls already holding the client finish with it.
+                self._sessions[account].reset()
+                self.evictions += 1
@@ -0,0 +1,101 @@
+"""One computed view of the account's holdings."""
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def _float(value: Any) -> Optional[float]:
+    return None if value in (None, "") else float(value)
+
+
+def _money(value: Optional[float]) -> Optional[float]:
+    return None if value is None else round(value, 4)
+
+
+def _ratio(numerator: float, denominator: float) -> Optional[float]:
+    return round(numerator / denominator, 6) if denominator else None
+
+
+def summarize(
+    positions: Sequence[Dict[str, Any]],
+    symbols: Sequence[Optional[str]],
+    quotes: Dict[str, Dict[str, Any]],
+    fundamentals: Dict[str, Dict[str, Any]],
+    portfolio: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Value every position and aggregate the portfolio.
+
+    Args:
+        positions (list<dict>): `positions` payloads with non-zero quantity
+        symbols (list<str>): the ticker of each position, None if unknown
+        quotes (dict): `quotes` payloads keyed by symbol
+        fundamentals (dict): `fundamentals` payloads keyed by symbol
+        portfolio (dict, optional): the account's `portfolios` payload
+
+    Returns:
+        (:obj:`dict`): ``holdings`` sorted by market value with their
+            quantity, price, market value, cost basis, unrealized and daily
+            P&L, weight, sector and industry; ``totals`` across holdings; and
+            ``sector_exposure`` mapping each sector to its weight
+
+    """
+    holdings: List[Dict[str, Any]] = []
+    for position, symbol in zip(positions, symbols):
+        quantity = float(position["quantity"])
+        cost = float(position.get("average_buy_price") or 0)
+        quote = quotes.get(symbol or "", {})
+        price = _float(quote.get("last_trade_price"))
+        previous = _float(quote.get("previous_close"))
+        fundamental = fundamentals.get(symbol or "") or {}
+        value = quantity * price if price is not None else None
+        holdings.append(
+            {
+                "symbol": symbol,
+                "quantity": quantity,
+                "average_buy_price": cost,
+                "price": price,
+                "market_value": value,
+                "cost_basis": quantity * cost,
+                "unrealized_pnl": None
+                if value is None
+                else _money(value - quantity * cost),
+                "unrealized_pnl_pct": None
+                if value is None
+                else _ratio(value - quantity * cost, quantity * cost),
+                "day_change": None
+                if price is None or previous is None
+                else _money(quantity * (price - previous)),
+                "sector": fundamental.get("sector") or "Unknown",
+                "industry": fundamental.get("industry"),
+            }
+        )
+
+    priced = [holding for holding in holdings if holding["market_value"] is not None]
+    market_value = sum(holding["market_value"] for holding in priced)
+    cost_basis = sum(holding["cost_basis"] for holding in priced)
+    sectors: Dict[str, float] = defaultdict(float)
+    for holding in priced:
+        holding["weight"] = _ratio(holding["market_value"], market_value)
+        sectors[holding["sector"]] += holding["market_value"]
+    holdings.sort(key=lambda holding: holding["market_value"] or 0, reverse=True)
+
+    totals = {
+        "positions": len(holdings),
+        "unpriced": [h["symbol"] for h in holdings if h["market_value"] is None],
+        "market_value": _money(market_value),
+        "cost_basis": _money(cost_basis),
+        "unrealized_pnl": _money(market_value - cost_basis),
+        "unrealized_pnl_pct": _ratio(market_value - cost_basis, cost_basis),
+        "day_change": _money(sum(holding["day_change"] or 0 for holding in priced)),
+    }
+    if portfolio:
+        equity = _float(portfolio.get("equity"))
+        totals["equity"] = equity
+        totals["cash"] = None if equity is None else _money(equity - market_value)
+    return {
+        "holdings": holdings,
+        "totals": totals,
+        "sector_exposure": {
+            sector: _ratio(value, market_value)
+            for sector, value in sorted(sectors.items(), key=lambda item: -item[1])
+        },
+    }
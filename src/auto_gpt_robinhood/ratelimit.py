@@ -0,0 +1,240 @@
+"""Client-side token-bucket pacing of Robinhood requests with priority lanes."""
+import functools
+import itertools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+LANES = ("orders", "account", "historicals", "quotes", "reference")
+"""Endpoint classes, each with its own budget. ``reference`` is only used
+through :func:`lane_scope`, for background bulk reads such as the instrument
+list."""
+
+PRIORITIES = {
+    "orders": 0,
+    "account": 1,
+    "historicals": 1,
+    "quotes": 1,
+    "reference": 2,
+}
+"""Lower runs first when lanes compete for the global budget."""
+
+DEFAULT_BUDGETS = "orders=1/5,account=2/5,historicals=2/4,quotes=5/10,reference=2/2"
+DEFAULT_GLOBAL_BUDGET = "8/16"
+
+current_lane: ContextVar[Optional[str]] = ContextVar("robinhood_lane", default=None)
+"""Lane every request sent in this context goes to, instead of :func:`classify`."""
+
+# First matching path fragment wins; order writes are matched on method too.
+_PATH_LANES = (
+    ("/historicals/", "historicals"),
+    ("/marketdata/", "quotes"),
+    ("/quotes/", "quotes"),
+    ("/fundamentals/", "quotes"),
+    ("/midlands/", "quotes"),
+    ("/instruments/", "quotes"),
+    ("/options/chains/", "quotes"),
+    ("/orders/", "account"),
+    ("/accounts/", "account"),
+    ("/positions/", "account"),
+    ("/portfolios/", "account"),
+    ("/watchlists/", "account"),
+    ("/oauth2/", "account"),
+)
+
+
+def classify(method: str, url: str) -> str:
+    """Return the lane a request belongs to.
+
+    Anything that writes to an ``orders`` endpoint, placing or cancelling,
+    goes to the ``orders`` lane; unknown endpoints count as ``quotes``.
+    """
+    path = urlsplit(url).path
+    if "/orders/" in path and method.upper() != "GET":
+        return "orders"
+    for fragment, lane in _PATH_LANES:
+        if fragment in path:
+            return lane
+    return "quotes"
+
+
+@contextmanager
+def lane_scope(lane: str) -> Iterator[None]:
+    """Send every request made inside the block in ``lane``."""
+    token = current_lane.set(lane)
+    try:
+        yield
+    finally:
+        current_lane.reset(token)
+
+
+def parse_budget(text: str) -> Tuple[float, float]:
+    """Parse ``"<rate per second>/<burst>"``; a bare rate bursts to itself."""
+    rate, _, burst = text.strip().partition("/")
+    return float(rate), float(burst or rate)
+
+
+class TokenBucket:
+    """Refills ``rate`` tokens a second up to ``burst``; a rate of 0 is unlimited."""
+
+    def __init__(
+        self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic
+    ):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self._clock = clock
+        self._updated = clock()
+
+    def refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def ready(self) -> bool:
+        """Whether a token can be taken right now."""
+        return self.rate <= 0 or self.tokens >= 1
+
+    def take(self) -> None:
+        """Consume one token."""
+        if self.rate > 0:
+            self.tokens -= 1
+
+    def delay(self) -> float:
+        """Seconds until the next token is available."""
+        if self.ready():
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class RateLimiter:
+    """
+    Paces requests through per-lane token buckets and one global bucket.
+
+    A request needs a token from its lane's bucket and from the global
+    bucket. Waiters are queued by ``PRIORITIES`` and then arrival, and a
+    waiter only holds back those behind it while its own lane has budget, so
+    a throttled lane never blocks the others while orders always take the
+    next global token ahead of research traffic.
+    """
+
+    def __init__(
+        self,
+        budgets: Dict[str, Tuple[float, float]],
+        global_budget: Tuple[float, float],
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.buckets = {lane: TokenBucket(*budgets[lane], clock) for lane in budgets}
+        self.global_bucket = TokenBucket(*global_budget, clock)
+        self._clock = clock
+        self._waiters: List[Tuple[int, int, str]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stats = {
+            lane: {
+                "granted": 0,
+                "waited": 0,
+                "wait_seconds": 0.0,
+                "max_wait_seconds": 0.0,
+                "max_depth": 0,
+            }
+            for lane in budgets
+        }
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """Build a limiter from ``ROBINHOOD_RATE_LIMITS`` and ``..._GLOBAL``."""
+        budgets = {lane: parse_budget("0") for lane in LANES}
+        for item in os.getenv("ROBINHOOD_RATE_LIMITS", DEFAULT_BUDGETS).split(","):
+            if item.strip():
+                lane, _, budget = item.partition("=")
+                budgets[lane.strip()] = parse_budget(budget)
+        global_budget = parse_budget(
+            os.getenv("ROBINHOOD_RATE_LIMIT_GLOBAL", DEFAULT_GLOBAL_BUDGET)
+        )
+        return cls(budgets, global_budget)
+
+    def acquire(self, lane: str) -> float:
+        """Block until ``lane`` may send a request, returning the seconds waited."""
+        started = self._clock()
+        entry = (PRIORITIES.get(lane, 1), next(self._sequence), lane)
+        bucket = self.buckets[lane]
+        with self._condition:
+            self._waiters.append(entry)
+            stats = self._stats[lane]
+            depth = sum(1 for waiter in self._waiters if waiter[2] == lane)
+            stats["max_depth"] = max(stats["max_depth"], depth)
+            while True:
+                for each in (*self.buckets.values(), self.global_bucket):
+                    each.refill()
+                if self._is_next(entry) and self.global_bucket.ready():
+                    break
+                self._condition.wait(self._delay(bucket))
+            self._waiters.remove(entry)
+            bucket.take()
+            self.global_bucket.take()
+            waited = self._clock() - started
+            stats["granted"] += 1
+            if waited > 0.001:
+                stats["waited"] += 1
+                stats["wait_seconds"] += waited
+                stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+            self._condition.notify_all()
+        return waited
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return per-lane queue depth, grant and wait counters."""
+        with self._condition:
+            return {
+                lane: dict(
+                    stats,
+                    depth=sum(1 for waiter in self._waiters if waiter[2] == lane),
+                    tokens=round(self.buckets[lane].tokens, 3),
+                )
+                for lane, stats in self._stats.items()
+            }
+
+    def _is_next(self, entry: Tuple[int, int, str]) -> bool:
+        if not self.buckets[entry[2]].ready():
+            return False
+        for waiter in sorted(self._waiters):
+            if waiter == entry:
+                return True
+            if self.buckets[waiter[2]].ready():
+                return False
+        return False
+
+    def _delay(self, bucket: TokenBucket) -> float:
+        # Waiting behind another lane: its grant notifies, so just re-check.
+        return max(bucket.delay(), self.global_bucket.delay()) or 0.05
+
+
+def _in_lane(lane: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        with lane_scope(lane):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class OrderLaneMixin:
+    """
+    Sends every request of the methods named in ``ORDER_WRAPPERS`` as orders.
+
+    pyrh reads a quote and the account before placing an order, and reads
+    the order before cancelling it. Those reads are part of the order, so
+    they take the ``orders`` lane and queue ahead of research traffic too.
+    """
+
+    ORDER_WRAPPERS: tuple = ()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        for name in cls.ORDER_WRAPPERS:
+            setattr(cls, name, _in_lane("orders", getattr(cls, name)))
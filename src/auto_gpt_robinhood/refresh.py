@@ -0,0 +1,102 @@
+"""Values rebuilt on a background thread and served without waiting."""
+import threading
+import time
+from typing import Any, Callable, Optional, Tuple
+
+from .session import passive
+
+
+class BackgroundRefresher:
+    """
+    Rebuild a value on a background thread every ``interval`` seconds.
+
+    Readers get the last value built and its age without ever waiting on
+    I/O. A failed build keeps the previous value and is counted in
+    ``errors``; values older than ``max_age`` are not served at all.
+    ``request`` wakes the thread for an early rebuild, e.g. after an order.
+    The thread exits as soon as ``active`` returns False before a rebuild;
+    ``start`` runs it again. Its rebuilds run under :data:`session.passive`,
+    so they only ever use sessions that are already logged in.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], Any],
+        interval: float = 60.0,
+        max_age: float = 300.0,
+        name: str = "robinhood-refresher",
+        clock: Callable[[], float] = time.monotonic,
+        active: Optional[Callable[[], bool]] = None,
+    ):
+        self.build = build
+        self.active = active
+        self.interval = interval
+        self.max_age = max_age
+        self.name = name
+        self.errors = 0
+        self.last_error: Optional[BaseException] = None
+        self._clock = clock
+        self._value: Optional[Tuple[float, Any]] = None
+        self._attempted_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def latest(self) -> Optional[Tuple[Any, float]]:
+        """Return the last value and its age in seconds, or None if too old."""
+        with self._lock:
+            if self._value is None:
+                return None
+            built_at, value = self._value
+        age = self._clock() - built_at
+        return None if age > self.max_age else (value, age)
+
+    def refresh(self) -> Any:
+        """Build the value now, in the calling thread, and store it."""
+        started = self._attempted_at = self._clock()
+        value = self.build()
+        with self._lock:
+            self._value = (started, value)
+        return value
+
+    def request(self) -> None:
+        """Ask the background thread to rebuild as soon as possible."""
+        self._wake.set()
+
+    def start(self) -> None:
+        """Start the refresh thread if it is not already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=self.name, daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the refresh thread."""
+        self._stopped.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        passive.set(True)
+        while not self._stopped.is_set():
+            attempted_at = self._attempted_at
+            if attempted_at is not None:
+                # A caller may have just built the value with ``refresh``.
+                self._wake.wait(
+                    max(0.0, self.interval - (self._clock() - attempted_at))
+                )
+                self._wake.clear()
+                if self._stopped.is_set():
+                    return
+            if self.active is not None and not self.active():
+                return
+            try:
+                self.refresh()
+            except Exception as error:  # pylint: disable=broad-except
+                # Keep serving the last good value until it ages out.
+                self.errors += 1
+                self.last_error = error
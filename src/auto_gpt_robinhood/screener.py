@@ -0,0 +1,279 @@
+"""Vectorised stock screens over a cached table of fundamentals and tags."""
+import ast
+import functools
+import re
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .refresh import BackgroundRefresher
+
+NUMERIC_FIELDS = (
+    "open",
+    "high",
+    "low",
+    "volume",
+    "average_volume",
+    "market_cap",
+    "pe_ratio",
+    "pb_ratio",
+    "dividend_yield",
+    "high_52_weeks",
+    "low_52_weeks",
+    "shares_outstanding",
+    "num_employees",
+)
+"""`fundamentals` fields kept as float64 columns."""
+
+TEXT_FIELDS = ("sector", "industry")
+"""`fundamentals` fields kept as string columns."""
+
+DERIVED_FIELDS = ("price", "previous_close", "change_pct", "off_high_pct")
+"""Columns computed from quotes: last trade price, previous close, the day's
+change and the distance below the 52-week high, both in percent."""
+
+_SUFFIXES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+_NUMBER = re.compile(r"(?<![\w.])(\d+(?:\.\d+)?)([KMBT])\b")
+
+_COMPARE = {
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+}
+_ARITHMETIC = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+}
+
+Node = Callable[["ScreenTable"], Any]
+
+
+class ScreenTable:
+    """
+    One row per symbol, one NumPy array per column.
+
+    ``tags`` maps each screened tag to the set of its member symbols, and is
+    turned into boolean masks on first use.
+    """
+
+    def __init__(
+        self,
+        symbols: Sequence[str],
+        columns: Mapping[str, np.ndarray],
+        tags: Mapping[str, Iterable[str]],
+    ):
+        self.symbols = np.array(symbols, dtype=object)
+        self.columns = dict(columns)
+        self.tags = {tag: frozenset(members) for tag, members in tags.items()}
+        self._masks: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def build(
+        cls,
+        symbols: Sequence[str],
+        fundamentals: Mapping[str, Optional[Dict[str, Any]]],
+        quotes: Mapping[str, Dict[str, Any]],
+        tags: Mapping[str, Iterable[str]],
+    ) -> "ScreenTable":
+        """Lay `fundamentals` and `quotes` payloads out as columns."""
+
+        def column(rows: List[Dict[str, Any]], field: str) -> np.ndarray:
+            values = [row.get(field) for row in rows]
+            return np.array(
+                [np.nan if value in (None, "") else value for value in values],
+                dtype=np.float64,
+            )
+
+        rows = [fundamentals.get(symbol) or {} for symbol in symbols]
+        columns = {field: column(rows, field) for field in NUMERIC_FIELDS}
+        for field in TEXT_FIELDS:
+            columns[field] = np.array(
+                [row.get(field) or "" for row in rows], dtype=object
+            )
+        priced = [quotes.get(symbol) or {} for symbol in symbols]
+        price = column(priced, "last_trade_price")
+        previous = column(priced, "previous_close")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            columns["change_pct"] = (price / previous - 1) * 100
+            columns["off_high_pct"] = (1 - price / columns["high_52_weeks"]) * 100
+        columns["price"], columns["previous_close"] = price, previous
+        return cls(symbols, columns, tags)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def mask(self, tag: str) -> np.ndarray:
+        """Return the boolean membership mask of ``tag``."""
+        mask = self._masks.get(tag)
+        if mask is None:
+            if tag not in self.tags:
+                raise ValueError(
+                    f"Tag {tag!r} is not screened, expected one of {sorted(self.tags)}"
+                )
+            mask = self._masks[tag] = np.isin(self.symbols, list(self.tags[tag]))
+        return mask
+
+    def screen(
+        self,
+        where: str = "",
+        sort: str = "",
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """Return the symbols matching ``where``, ordered by ``sort``.
+
+        Args:
+            where (str, optional): filter expression, e.g.
+                ``tag("top-movers") and pe_ratio < 20 and market_cap > 10B``
+            sort (str, optional): expression sorted ascending, missing values
+                last; negate it, e.g. ``-market_cap``, for descending
+            limit (int, optional): maximum number of symbols
+
+        Returns:
+            (:obj:`list` of :obj:`str`): matching symbols
+
+        """
+        rows = np.ones(len(self), dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if where.strip():
+                selected = np.asarray(compile_expression(where)(self))
+                if selected.dtype != bool:
+                    raise ValueError(f"Filter {where!r} is not a condition")
+                rows &= np.broadcast_to(selected, rows.shape)
+            index = np.flatnonzero(rows)
+            if sort.strip():
+                keys = np.broadcast_to(
+                    np.asarray(compile_expression(sort)(self), dtype=np.float64),
+                    rows.shape,
+                )
+                index = index[np.argsort(keys[index], kind="stable")]
+        if limit is not None:
+            index = index[:limit]
+        return self.symbols[index].tolist()
+
+
+@functools.lru_cache(maxsize=128)
+def compile_expression(text: str) -> Node:
+    """Compile a screen expression into a function of a :class:`ScreenTable`.
+
+    Expressions use column names, numbers (optionally suffixed K, M, B or T),
+    strings, ``+ - * /``, comparisons (chained ones too), ``and``/``or``/
+    ``not`` (or ``& | ~``) and ``tag("name")``. Nothing else is accepted, so
+    evaluating an expression can neither call nor reach arbitrary Python.
+
+    Raises:
+        ValueError: if the expression is malformed or uses anything else
+    """
+    source = _NUMBER.sub(lambda m: repr(float(m[1]) * _SUFFIXES[m[2]]), text)
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as error:
+        raise ValueError(f"Invalid expression {text!r}: {error.msg}") from None
+    return _compile(tree.body, text)
+
+
+def _compile(node: ast.AST, text: str) -> Node:
+    # pylint: disable=too-many-return-statements
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float, str)):
+        value = node.value
+        return lambda table: value
+    if isinstance(node, ast.Name):
+        name = node.id
+        fields = NUMERIC_FIELDS + TEXT_FIELDS + DERIVED_FIELDS
+        if name not in fields:
+            raise ValueError(f"Unknown column {name!r}, expected one of {fields}")
+        return lambda table: table.columns[name]
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id == "tag"
+        and len(node.args) == 1
+        and not node.keywords
+        and isinstance(node.args[0], ast.Constant)
+        and isinstance(node.args[0].value, str)
+    ):
+        tag = node.args[0].value
+        return lambda table: table.mask(tag)
+    if isinstance(node, ast.BoolOp):
+        parts = [_compile(value, text) for value in node.values]
+        combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+        return lambda table: functools.reduce(
+            combine, (part(table) for part in parts)
+        )
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.Invert)):
+        operand = _compile(node.operand, text)
+        return lambda table: np.logical_not(operand(table))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _compile(node.operand, text)
+        sign = -1.0 if isinstance(node.op, ast.USub) else 1.0
+        return lambda table: sign * np.asarray(operand(table), dtype=np.float64)
+    if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC:
+        left, right = _compile(node.left, text), _compile(node.right, text)
+        func = _ARITHMETIC[type(node.op)]
+        return lambda table: func(left(table), right(table))
+    if isinstance(node, ast.BinOp) and isinstance(node.op, (ast.BitAnd, ast.BitOr)):
+        left, right = _compile(node.left, text), _compile(node.right, text)
+        func = np.logical_and if isinstance(node.op, ast.BitAnd) else np.logical_or
+        return lambda table: func(left(table), right(table))
+    if isinstance(node, ast.Compare) and all(
+        type(op) in _COMPARE for op in node.ops
+    ):
+        operands = [_compile(node.left, text)] + [
+            _compile(comparator, text) for comparator in node.comparators
+        ]
+        funcs = [_COMPARE[type(op)] for op in node.ops]
+
+        def compare(table: "ScreenTable") -> np.ndarray:
+            values = [operand(table) for operand in operands]
+            result = True
+            for func, left, right in zip(funcs, values, values[1:]):
+                result = np.logical_and(result, func(left, right))
+            return result
+
+        return compare
+    raise ValueError(
+        f"Unsupported syntax {ast.dump(node)[:40]!r} in expression {text!r}"
+    )
+
+
+class Screener:
+    """
+    Serves screens from a :class:`ScreenTable` rebuilt in the background.
+
+    The table is rebuilt every ``interval`` seconds for as long as ``active``
+    returns True. The first screen, or one after the table grew older than
+    ``max_age``, builds it in the caller.
+    """
+
+    def __init__(
+        self,
+        build: Callable[[], ScreenTable],
+        interval: float = 900.0,
+        max_age: float = 3600.0,
+        active: Optional[Callable[[], bool]] = None,
+    ):
+        self.refresher = BackgroundRefresher(
+            build,
+            interval=interval,
+            max_age=max_age,
+            name="robinhood-screener",
+            active=active,
+        )
+
+    def table(self) -> ScreenTable:
+        """Return the current table, building it now if there is none."""
+        latest = self.refresher.latest()
+        table = self.refresher.refresh() if latest is None else latest[0]
+        if self.refresher.interval > 0:
+            self.refresher.start()
+        return table
+
+    def screen(
+        self, where: str = "", sort: str = "", limit: Optional[int] = None
+    ) -> List[str]:
+        """Run a screen, see :meth:`ScreenTable.screen`."""
+        return self.table().screen(where, sort, limit)
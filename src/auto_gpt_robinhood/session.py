@@ -0,0 +1,149 @@
+"""Lazy, thread-safe Robinhood session handle."""
+import os
+import threading
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from .backend import BACKENDS
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import MetricsRegistry
+    from .ratelimit import RateLimiter
+    from .transport import TransportConfig
+
+DEFAULT_SESSION_FILE = Path("~/.robinhood/auto_gpt_session.json")
+DEFAULT_ARCHIVE = Path("~/.robinhood/archive.jsonl.gz")
+
+passive: ContextVar[bool] = ContextVar("robinhood_passive", default=False)
+"""Set by background work, which may only use sessions already connected and
+must never log in, since a login may prompt on the terminal for a code."""
+
+
+class RobinhoodSession:
+    """
+    Owns the pyrh client and logs in on first use.
+
+    Neither pyrh nor its dependencies are imported until ``client`` is first
+    accessed, so loading the plugin costs nothing. The OAuth token is saved to
+    ``session_file`` and reused across restarts, only falling back to a full
+    login when the cached token cannot be refreshed. Every request goes
+    through a pooled, retrying transport built from ``transport`` (or the
+    ``ROBINHOOD_*`` environment variables when it is None), paced by
+    ``limiter`` and measured into ``metrics`` when they are given.
+
+    With the ``record`` backend every pyrh call and its result is also
+    appended to ``archive``; with ``replay`` no login or network access
+    happens at all and calls are answered from ``archive`` after
+    ``replay_latency`` seconds (or their recorded latency).
+    """
+
+    def __init__(
+        self,
+        username: Optional[str],
+        password: Optional[str],
+        session_file: Optional[str] = None,
+        transport: Optional["TransportConfig"] = None,
+        limiter: Optional["RateLimiter"] = None,
+        metrics: Optional["MetricsRegistry"] = None,
+        backend: str = "live",
+        archive: Optional[str] = None,
+        replay_latency: Union[float, str] = 0.0,
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, not {backend!r}")
+        self.username = username
+        self.password = password
+        self.session_file = Path(session_file or DEFAULT_SESSION_FILE).expanduser()
+        self.transport = transport
+        self.limiter = limiter
+        self.metrics = metrics
+        self.backend = backend
+        self.archive = Path(archive or DEFAULT_ARCHIVE).expanduser()
+        self.replay_latency = replay_latency
+        self._client = None
+        self._pyrh = None
+        self._lock = threading.Lock()
+
+    @property
+    def connected(self) -> bool:
+        """Whether the pyrh client has been created yet."""
+        return self._client is not None
+
+    @property
+    def client(self) -> Any:
+        """Return the logged-in pyrh client, creating it if needed.
+
+        Raises:
+            LookupError: if not connected while :data:`passive` is set
+        """
+        client = self._client
+        if client is None:
+            if passive.get():
+                raise LookupError("Robinhood session is not connected")
+            with self._lock:
+                if self._client is None:
+                    self._client = self._connect()
+                client = self._client
+        return client
+
+    def attach(self, client: Any) -> None:
+        """Use an already built client, e.g. a :class:`RecordingClient` or double."""
+        with self._lock:
+            self._client = client
+
+    def save(self) -> None:
+        """Write the current session token to ``session_file``."""
+        import pyrh  # pylint: disable=import-outside-toplevel
+
+        if self._pyrh is None:
+            return
+        self.session_file.parent.mkdir(parents=True, exist_ok=True)
+        pyrh.dump_session(self._pyrh, self.session_file)
+        os.chmod(self.session_file, 0o600)
+
+    def reset(self) -> None:
+        """Drop the current client so the next access logs in again."""
+        with self._lock:
+            self._client = None
+            self._pyrh = None
+
+    def _connect(self) -> Any:
+        # pylint: disable=import-outside-toplevel
+        from .backend import Archive, RecordingClient, ReplayClient
+
+        if self.backend == "replay":
+            return ReplayClient(Archive(self.archive), self.replay_latency)
+
+        import pyrh
+
+        from .transport import TransportConfig, configure_session
+
+        client = self._load_cached(pyrh)
+        if client is None:
+            client = pyrh.Robinhood(self.username, self.password)
+        configure_session(
+            client.session,
+            self.transport or TransportConfig.from_env(),
+            self.limiter,
+            self.metrics,
+        )
+        self._pyrh = client
+        if not client.authenticated:
+            client.login()
+            self.save()
+        if self.backend == "record":
+            return RecordingClient(client, Archive(self.archive))
+        return client
+
+    def _load_cached(self, pyrh: Any) -> Any:
+        if not self.session_file.is_file():
+            return None
+        try:
+            client = pyrh.load_session(self.session_file)
+        except Exception:  # pylint: disable=broad-except
+            # A stale or corrupt cache only costs us a fresh login.
+            return None
+        if self.username and client.username != self.username:
+            return None
+        return client
@@ -0,0 +1,201 @@
+"""Per-command projection and size budgeting of command responses."""
+import ast
+import json
+from typing import Any, Dict, Iterable, Optional
+
+QUOTE_FIELDS = [
+    "symbol",
+    "last_trade_price",
+    "bid_price",
+    "ask_price",
+    "previous_close",
+    "updated_at",
+]
+
+DEFAULT_FIELDS: Dict[str, Any] = {
+    "quote_data": QUOTE_FIELDS,
+    "quote_batch": {"quotes": {"*": QUOTE_FIELDS}, "errors": None},
+    "get_stock_news": {
+        "results": ["title", "source", "published_at", "url", "summary"],
+    },
+    "get_fundamentals": [
+        "open",
+        "high",
+        "low",
+        "volume",
+        "average_volume",
+        "market_cap",
+        "pe_ratio",
+        "dividend_yield",
+        "high_52_weeks",
+        "low_52_weeks",
+        "sector",
+        "industry",
+    ],
+    "get_positions": {
+        "results": ["instrument", "quantity", "average_buy_price", "updated_at"],
+    },
+    "order_history": [
+        "id",
+        "symbol",
+        "side",
+        "type",
+        "state",
+        "quantity",
+        "cumulative_quantity",
+        "price",
+        "average_price",
+        "created_at",
+        "updated_at",
+    ],
+    "portfolio_snapshot": {
+        "holdings": [
+            "symbol",
+            "quantity",
+            "price",
+            "market_value",
+            "unrealized_pnl",
+            "unrealized_pnl_pct",
+            "day_change",
+            "weight",
+            "sector",
+        ],
+        "totals": None,
+        "sector_exposure": None,
+    },
+    "place_orders_bulk": {
+        "submitted": None,
+        "failed": None,
+        "skipped": None,
+        "results": [
+            "index",
+            "symbol",
+            "side",
+            "type",
+            "quantity",
+            "status",
+            "order_id",
+            "state",
+            "error",
+        ],
+    },
+    "cancel_orders_bulk": None,
+    "ingest_news": None,
+    "search_news": None,
+    "screen_stocks": None,
+    "technical_indicators": None,
+    "watch_symbols": None,
+    "unwatch_symbols": None,
+}
+"""Projection applied to each command's response.
+
+A projection is None (keep everything), a list of keys to keep from a dict
+or from every dict in a list, or a dict mapping keys to nested projections
+where ``"*"`` matches every key.
+"""
+
+TRUNCATED = "...(truncated)"
+
+
+def project(value: Any, projection: Any) -> Any:
+    """Keep only the fields named by ``projection``."""
+    if projection is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, projection) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if isinstance(projection, dict):
+        wildcard = projection.get("*", ...)
+        return {
+            key: project(item, projection.get(key, wildcard))
+            for key, item in value.items()
+            if key in projection or wildcard is not ...
+        }
+    return {key: value[key] for key in projection if key in value}
+
+
+def trim(value: Any, max_items: int, max_chars: int) -> Any:
+    """Cap list lengths and string lengths throughout ``value``."""
+    if isinstance(value, dict):
+        return {key: trim(item, max_items, max_chars) for key, item in value.items()}
+    if isinstance(value, list):
+        items = [trim(item, max_items, max_chars) for item in value[:max_items]]
+        if len(value) > max_items:
+            items.append(f"... {len(value) - max_items} more")
+        return items
+    if isinstance(value, str) and len(value) > max_chars:
+        return value[:max_chars] + TRUNCATED
+    return value
+
+
+def encode(value: Any, max_bytes: int) -> str:
+    """Serialise ``value`` as compact JSON, stopping once ``max_bytes`` is hit.
+
+    The encoder runs incrementally, so nothing past the budget is serialised.
+    """
+    chunks, size = [], 0
+    encoder = json.JSONEncoder(separators=(",", ":"), default=str)
+    for chunk in encoder.iterencode(value):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            return "".join(chunks)[:max_bytes] + TRUNCATED
+    return "".join(chunks)
+
+
+def _parse(response: Any) -> Any:
+    if not isinstance(response, str):
+        return response
+    try:
+        return json.loads(response)
+    except ValueError:
+        pass
+    try:
+        return ast.literal_eval(response)
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return response
+
+
+class ResponseShaper:
+    """
+    Shrink command responses before they reach the model's context.
+
+    Responses are projected to the command's field whitelist, long lists and
+    strings are cut, and the result is serialised within a byte budget of
+    roughly four bytes per token. Responses of ``commands`` without a
+    whitelist are only cut and budgeted.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, Any]] = None,
+        max_items: int = 20,
+        max_chars: int = 500,
+        max_tokens: int = 1000,
+        commands: Iterable[str] = (),
+    ):
+        self.fields = dict(DEFAULT_FIELDS, **(fields or {}))
+        self.commands = frozenset(commands)
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.max_bytes = max_tokens * 4
+
+    def handles(self, command_name: str) -> bool:
+        """Whether responses of ``command_name`` are shaped."""
+        return command_name in self.fields or command_name in self.commands
+
+    def shape(self, command_name: str, response: Any) -> str:
+        """Return the shaped, serialised response.
+
+        Auto-GPT hands over ``Command <name> returned: <result>``; only the
+        result is shaped and the prefix is kept in front of it.
+        """
+        prefix = f"Command {command_name} returned: "
+        if isinstance(response, str) and response.startswith(prefix):
+            return prefix + self.shape(command_name, response[len(prefix) :])
+        value = _parse(response)
+        if isinstance(value, str):
+            return trim(value, self.max_items, self.max_bytes)
+        value = project(value, self.fields.get(command_name))
+        return encode(trim(value, self.max_items, self.max_chars), self.max_bytes)
@@ -0,0 +1,118 @@
+"""Single-flight coalescing of concurrent identical read-only calls."""
+import functools
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional
+
+WRITE_PREFIXES = ("place_", "cancel_")
+"""Method name prefixes that may never be coalesced."""
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def call_key(name: str, args: tuple, kwargs: Dict[str, Any]) -> Optional[Hashable]:
+    """Return the key identifying a call, or None if its arguments can't be keyed."""
+    key = (name, _freeze(args), _freeze(kwargs))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class SingleFlight:
+    """
+    Share one execution between concurrent calls with the same key.
+
+    The first caller runs the function; callers arriving while it is still
+    running wait for it and get the same result or exception. Nothing is kept
+    once the call completes, so this is not a cache.
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any):
+        """Run ``func`` unless a call with ``key`` is in flight, then join it."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return call.result()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+def _coalesced(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    @functools.wraps(method)
+    def wrapper(self: "SingleFlightMixin", *args: Any, **kwargs: Any) -> Any:
+        key = call_key(name, args, kwargs)
+        if key is None:
+            return method(self, *args, **kwargs)
+        scope = self.coalescing_scope(name)
+        if scope is not None:
+            key = (scope, key)
+        return self.single_flight.do(key, method, self, *args, **kwargs)
+
+    return wrapper
+
+
+class SingleFlightMixin:
+    """
+    Coalesces concurrent identical calls to every method named in ``COALESCED``.
+
+    Only read-only wrappers may be listed: naming a method that places or
+    cancels orders raises :class:`TypeError` when the class is defined, since
+    two identical orders are two orders. Concurrent callers share one result
+    object and should treat it as read-only. Calls are only joined when
+    ``coalescing_scope`` returns the same value for both, e.g. the account
+    they act for.
+    """
+
+    COALESCED: tuple = ()
+
+    _single_flight: Optional[SingleFlight] = None
+    _single_flight_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        for name in cls.COALESCED:
+            if name.startswith(WRITE_PREFIXES):
+                raise TypeError(f"{cls.__name__}.{name} must not be coalesced")
+            setattr(cls, name, _coalesced(name, getattr(cls, name)))
+
+    def coalescing_scope(self, name: str) -> Hashable:
+        """Return what, besides its arguments, a call to ``name`` depends on."""
+        return None
+
+    @property
+    def single_flight(self) -> SingleFlight:
+        """Return the coalescing group shared by this instance's wrappers."""
+        if self._single_flight is None:
+            with self._single_flight_lock:
+                if self._single_flight is None:
+                    self._single_flight = SingleFlight()
+        return self._single_flight
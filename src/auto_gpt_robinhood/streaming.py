@@ -0,0 +1,155 @@
+"""Background quote poller that publishes only meaningful price changes."""
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+FetchBatch = Callable[[List[str]], Dict[str, Dict[str, Any]]]
+
+
+@dataclass
+class QuoteEvent:
+    """A watched symbol moved at least its threshold since the last event."""
+
+    symbol: str
+    price: float
+    previous: Optional[float]
+    change_pct: Optional[float]
+    updated_at: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the event as a plain dict."""
+        return asdict(self)
+
+
+class QuotePoller:
+    """
+    Poll every watched symbol in one batched request on an adaptive interval.
+
+    The interval halves (down to ``min_interval``) after a poll that produced
+    events and grows by half (up to ``max_interval``) after a quiet one. Each
+    symbol only publishes when its last trade price has moved by at least its
+    threshold, in percent, since the price it last published. Events go to a
+    bounded queue; when consumers fall behind the oldest are dropped and
+    counted in ``dropped``. The thread exits once nothing is watched, and
+    ``watch`` starts it again.
+    """
+
+    def __init__(
+        self,
+        fetch_batch: FetchBatch,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        max_events: int = 256,
+    ):
+        self.fetch_batch = fetch_batch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.dropped = 0
+        self._thresholds: Dict[str, float] = {}
+        self._baselines: Dict[str, float] = {}
+        self._events: "deque[QuoteEvent]" = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, symbols: Iterable[str], threshold_pct: float = 0.5) -> List[str]:
+        """Start watching symbols, returning everything now watched."""
+        with self._lock:
+            for symbol in symbols:
+                self._thresholds[symbol.upper()] = threshold_pct
+            watched = sorted(self._thresholds)
+        self.interval = self.min_interval
+        self.start()
+        self._wake.set()
+        return watched
+
+    def unwatch(self, symbols: Iterable[str]) -> List[str]:
+        """Stop watching symbols, returning everything still watched."""
+        with self._lock:
+            for symbol in symbols:
+                self._thresholds.pop(symbol.upper(), None)
+                self._baselines.pop(symbol.upper(), None)
+            watched = sorted(self._thresholds)
+        if not watched:
+            self._wake.set()
+        return watched
+
+    def poll_once(self) -> List[QuoteEvent]:
+        """Fetch all watched symbols once and publish the meaningful moves."""
+        with self._lock:
+            thresholds = dict(self._thresholds)
+        if not thresholds:
+            return []
+        quotes = self.fetch_batch(list(thresholds))
+        events = []
+        with self._lock:
+            for symbol, quote in quotes.items():
+                if symbol not in self._thresholds or not quote.get("last_trade_price"):
+                    continue
+                price = float(quote["last_trade_price"])
+                previous = self._baselines.get(symbol)
+                change = None if previous is None else (price / previous - 1) * 100
+                if change is not None and abs(change) < thresholds[symbol]:
+                    continue
+                self._baselines[symbol] = price
+                events.append(
+                    QuoteEvent(
+                        symbol,
+                        price,
+                        previous,
+                        None if change is None else round(change, 3),
+                        quote.get("updated_at", ""),
+                    )
+                )
+            if len(self._events) + len(events) > (self._events.maxlen or 0):
+                self.dropped += len(self._events) + len(events) - self._events.maxlen
+            self._events.extend(events)
+        return events
+
+    def drain(self) -> List[QuoteEvent]:
+        """Return and clear every event published since the last drain."""
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+        return events
+
+    def start(self) -> None:
+        """Start the polling thread if it is not already running."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="robinhood-quote-poller", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the polling thread."""
+        self._stopped.set()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            with self._lock:
+                if not self._thresholds:
+                    # Checked under the lock ``watch`` adds symbols with, so
+                    # a watch either sees this thread gone or is polled here.
+                    self._thread = None
+                    return
+            started = time.monotonic()
+            try:
+                published = bool(self.poll_once())
+            except Exception:  # pylint: disable=broad-except
+                # Keep polling through transient errors, just less often.
+                published = False
+            if published:
+                self.interval = max(self.min_interval, self.interval / 2)
+            else:
+                self.interval = min(self.max_interval, self.interval * 1.5)
+            self._wake.wait(max(0.0, self.interval - (time.monotonic() - started)))
+            self._wake.clear()
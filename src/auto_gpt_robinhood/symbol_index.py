@@ -0,0 +1,181 @@
+"""Memory-mapped symbol to instrument-ID index."""
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from .session import passive
+
+MAGIC = b"RHSYMIDX"
+HEADER = struct.Struct("<8sQ")
+SYMBOL_WIDTH = 16
+ID_WIDTH = 36
+RECORD_SIZE = SYMBOL_WIDTH + ID_WIDTH
+
+Source = Callable[[], Iterable[Tuple[str, str]]]
+Lookup = Callable[[str], Optional[str]]
+
+logger = logging.getLogger(__name__)
+
+
+def write_index(path: Path, pairs: Iterable[Tuple[str, str]]) -> int:
+    """Write ``(symbol, id)`` pairs as a sorted index file, atomically.
+
+    Returns:
+        (int): number of records written
+
+    """
+    records = {}
+    for symbol, id_ in pairs:
+        key = symbol.upper().encode()
+        if 0 < len(key) <= SYMBOL_WIDTH and len(id_) == ID_WIDTH:
+            records[key] = id_.encode()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as file:
+        file.write(HEADER.pack(MAGIC, len(records)))
+        for key in sorted(records):
+            file.write(key.ljust(SYMBOL_WIDTH, b"\0") + records[key])
+    os.replace(tmp, path)
+    return len(records)
+
+
+class SymbolIndex:
+    """
+    Symbol to instrument-ID lookups without a network round trip.
+
+    The index is a sorted file of fixed-width records that is memory-mapped
+    and searched by bisection, so a lookup touches a handful of pages. When
+    the file is missing, truncated or older than ``max_age`` seconds it is
+    rebuilt from ``source`` on a background thread, under
+    :data:`session.passive` so it never logs in; until then, and for
+    symbols it does not contain, ``lookup`` is used and the answer
+    remembered.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        source: Source,
+        lookup: Lookup,
+        max_age: float = 86400.0,
+    ):
+        self.path = Path(path).expanduser()
+        self.source = source
+        self.lookup = lookup
+        self.max_age = max_age
+        self._index: Tuple[Optional[mmap.mmap], int] = (None, 0)
+        self._overlay: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._checked_at = float("-inf")
+        self._open()
+
+    def __len__(self) -> int:
+        return self._index[1]
+
+    def instrument_id(self, symbol: str) -> Optional[str]:
+        """Return the instrument ID for ``symbol``, or None if unknown."""
+        self._refresh_if_stale()
+        symbol = symbol.strip().upper()
+        id_ = self._overlay.get(symbol) or self._search(symbol.encode())
+        if id_ is None:
+            id_ = self.lookup(symbol)
+            if id_ is not None:
+                self._overlay[symbol] = id_
+        return id_
+
+    def add(self, symbol: str, id_: str) -> None:
+        """Remember a mapping learned elsewhere until the next rebuild."""
+        self._overlay[symbol.upper()] = id_
+
+    def refresh(self) -> int:
+        """Rebuild the index from ``source`` and swap it in.
+
+        Returns:
+            (int): number of symbols indexed
+
+        """
+        count = write_index(self.path, self.source())
+        self._open()
+        return count
+
+    def refresh_async(self) -> None:
+        """Start a background rebuild unless one is already running."""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_passively,
+                name="robinhood-symbol-index",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _refresh_passively(self) -> None:
+        passive.set(True)
+        try:
+            self.refresh()
+        except Exception as error:  # pylint: disable=broad-except
+            # Lookups keep working through ``lookup``; the next check retries.
+            logger.warning("Could not rebuild symbol index %s: %r", self.path, error)
+
+    def _refresh_if_stale(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < 60:
+            return
+        self._checked_at = now
+        try:
+            age = time.time() - self.path.stat().st_mtime
+        except OSError:
+            age = float("inf")
+        if age > self.max_age or self._index[0] is None:
+            self.refresh_async()
+
+    def _open(self) -> None:
+        # A missing, empty or truncated file leaves no index loaded, which
+        # ``_refresh_if_stale`` treats as stale and rebuilds.
+        try:
+            if self.path.stat().st_size < HEADER.size:
+                return
+            with open(self.path, "rb") as file:
+                new_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        magic, count = HEADER.unpack_from(new_map)
+        if magic != MAGIC or len(new_map) < HEADER.size + count * RECORD_SIZE:
+            new_map.close()
+            return
+        with self._lock:
+            # Searches hold the lock, so none is still reading the old map.
+            if self._index[0] is not None:
+                self._index[0].close()
+            self._index = (new_map, count)
+            self._overlay = {}
+
+    def _search(self, key: bytes) -> Optional[str]:
+        if len(key) > SYMBOL_WIDTH:
+            return None
+        with self._lock:
+            return self._bisect(key.ljust(SYMBOL_WIDTH, b"\0"))
+
+    def _bisect(self, key: bytes) -> Optional[str]:
+        index_map, count = self._index
+        if index_map is None:
+            return None
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            offset = HEADER.size + middle * RECORD_SIZE
+            if index_map[offset : offset + SYMBOL_WIDTH] < key:
+                low = middle + 1
+            else:
+                high = middle
+        offset = HEADER.size + low * RECORD_SIZE
+        if low < count and index_map[offset : offset + SYMBOL_WIDTH] == key:
+            return index_map[offset + SYMBOL_WIDTH : offset + RECORD_SIZE].decode()
+        return None
@@ -0,0 +1,192 @@
+"""Pooled, retrying HTTP transport for the pyrh session."""
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .metrics import MetricsRegistry
+    from .ratelimit import RateLimiter
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool, timeout and retry settings for Robinhood requests."""
+
+    pool_connections: int = 4
+    pool_maxsize: int = 16
+    connect_timeout: float = 3.05
+    read_timeout: float = 10.0
+    retries: int = 3
+    backoff_factor: float = 0.5
+    backoff_jitter: float = 0.5
+
+    @classmethod
+    def from_env(cls) -> "TransportConfig":
+        """Build a config from ``ROBINHOOD_*`` environment variables."""
+        return cls(
+            pool_connections=int(os.getenv("ROBINHOOD_POOL_CONNECTIONS", "4")),
+            pool_maxsize=int(os.getenv("ROBINHOOD_POOL_MAXSIZE", "16")),
+            connect_timeout=float(os.getenv("ROBINHOOD_CONNECT_TIMEOUT", "3.05")),
+            read_timeout=float(os.getenv("ROBINHOOD_READ_TIMEOUT", "10")),
+            retries=int(os.getenv("ROBINHOOD_RETRIES", "3")),
+            backoff_factor=float(os.getenv("ROBINHOOD_BACKOFF_FACTOR", "0.5")),
+            backoff_jitter=float(os.getenv("ROBINHOOD_BACKOFF_JITTER", "0.5")),
+        )
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """The ``(connect, read)`` timeout pair passed to requests."""
+        return self.connect_timeout, self.read_timeout
+
+
+class JitteredRetry(Retry):
+    """Exponential backoff with up to ``jitter`` seconds of random delay added.
+
+    A ``Retry-After`` header on 429 and 503 responses still takes precedence.
+    urllib3 resends inside the adapter, so when a ``limiter`` is given each
+    retry also waits for a token in the lane the request was sent in.
+    """
+
+    def __init__(
+        self,
+        *args: Any,
+        jitter: float = 0.0,
+        limiter: Optional["RateLimiter"] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+        self.limiter = limiter
+
+    def new(self, **kwargs: Any) -> "JitteredRetry":
+        retry = super().new(**kwargs)
+        retry.jitter = self.jitter
+        retry.limiter = self.limiter
+        return retry
+
+    def sleep(self, response: Any = None) -> None:
+        super().sleep(response)
+        if self.limiter is not None:
+            # pylint: disable-next=import-outside-toplevel
+            from .ratelimit import current_lane
+
+            self.limiter.acquire(current_lane.get() or "quotes")
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, self.jitter) if backoff else backoff
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies the configured timeouts to every request.
+
+    pyrh hard-codes a short timeout on each call, so it is overridden here.
+    When a ``limiter`` is given each request first waits for its lane's
+    budget, the lane set by :func:`ratelimit.lane_scope` if any, and when
+    ``metrics`` is given each request's latency, status, body size and
+    retries are recorded per lane.
+    """
+
+    def __init__(
+        self,
+        timeout: Tuple[float, float],
+        limiter: Optional["RateLimiter"] = None,
+        metrics: Optional["MetricsRegistry"] = None,
+        **kwargs: Any,
+    ):
+        self.timeout = timeout
+        self.limiter = limiter
+        self.metrics = metrics
+        super().__init__(**kwargs)
+
+    def send(self, request: Any, **kwargs: Any) -> Any:
+        # pylint: disable-next=import-outside-toplevel
+        from .ratelimit import classify, current_lane, lane_scope
+
+        lane = current_lane.get() or classify(request.method, request.url)
+        if self.limiter is not None:
+            self.limiter.acquire(lane)
+        kwargs["timeout"] = self.timeout
+        # Retries are sent from within, and JitteredRetry paces them in lane.
+        with lane_scope(lane):
+            return self._send(lane, request, **kwargs)
+
+    def _send(self, lane: str, request: Any, **kwargs: Any) -> Any:
+        if self.metrics is None:
+            return super().send(request, **kwargs)
+        started = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except Exception:
+            self.metrics.inc("robinhood_http_requests_total", lane=lane, status="error")
+            raise
+        finally:
+            self.metrics.observe(
+                "robinhood_http_duration_seconds",
+                time.perf_counter() - started,
+                lane=lane,
+            )
+        self._record(lane, response)
+        return response
+
+    def _record(self, lane: str, response: Any) -> None:
+        metrics = self.metrics
+        metrics.inc(
+            "robinhood_http_requests_total", lane=lane, status=response.status_code
+        )
+        metrics.inc(
+            "robinhood_http_received_bytes_total", len(response.content), lane=lane
+        )
+        retries = getattr(response.raw, "retries", None)
+        if retries is not None and retries.history:
+            metrics.inc("robinhood_http_retries_total", len(retries.history), lane=lane)
+
+
+def build_adapter(
+    config: TransportConfig,
+    limiter: Optional["RateLimiter"] = None,
+    metrics: Optional["MetricsRegistry"] = None,
+) -> TimeoutHTTPAdapter:
+    """Create the pooled adapter described by ``config``.
+
+    Only idempotent methods are retried, so order placement is never resent.
+    """
+    retry = JitteredRetry(
+        total=config.retries,
+        backoff_factor=config.backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+        jitter=config.backoff_jitter,
+        limiter=limiter,
+    )
+    return TimeoutHTTPAdapter(
+        config.timeout,
+        limiter,
+        metrics,
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+
+def configure_session(
+    session: Session,
+    config: TransportConfig,
+    limiter: Optional["RateLimiter"] = None,
+    metrics: Optional["MetricsRegistry"] = None,
+) -> Session:
+    """Mount the pooled adapter on ``session`` so connections are kept alive."""
+    adapter = build_adapter(config, limiter, metrics)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
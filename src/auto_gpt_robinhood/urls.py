@@ -0,0 +1,31 @@
+"""Robinhood endpoints used directly by the plugin."""
+API_BASE = "https://api.robinhood.com/"
+
+FUNDAMENTALS = API_BASE + "fundamentals/"
+INSTRUMENTS = API_BASE + "instruments/"
+MARKETS = API_BASE + "markets/"
+MARKETDATA_OPTIONS = API_BASE + "marketdata/options/"
+MARKETDATA_QUOTES = API_BASE + "marketdata/quotes/"
+NEWS = API_BASE + "midlands/news/"
+OPTIONS_CHAINS = API_BASE + "options/chains/"
+OPTIONS_INSTRUMENTS = API_BASE + "options/instruments/"
+ORDERS = API_BASE + "orders/"
+PORTFOLIOS = API_BASE + "portfolios/"
+POSITIONS = API_BASE + "positions/"
+TAGS = API_BASE + "midlands/tags/tag/"
+WATCHLISTS = API_BASE + "watchlists/"
+
+
+def instrument_id(url: str) -> str:
+    """Return the UUID at the end of an instrument URL."""
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+def instrument_url(id_: str) -> str:
+    """Return the canonical instrument URL for a UUID."""
+    return f"{INSTRUMENTS}{id_}/"
+
+
+def market_hours_url(date: str, mic: str = "XNYS") -> str:
+    """Return the trading hours URL of market ``mic`` on a YYYY-MM-DD date."""
+    return f"{MARKETS}{mic}/hours/{date}/"
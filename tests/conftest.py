@@ -0,0 +1,139 @@
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import pytest  # noqa: E402
+
+from auto_gpt_robinhood import urls  # noqa: E402
+
+
+class FakeRobinhood:
+    """A pyrh client double serving a few instruments and accepting orders."""
+
+    def __init__(self, symbols=("AAPL", "MSFT", "TSLA")):
+        self.symbols = list(symbols)
+        self.positions = []
+        self.fundamentals = {}
+        self.tags = {}
+        self.placed = []
+        self.cancelled = []
+
+    def instrument(self, symbol):
+        return {
+            "symbol": symbol,
+            "id": f"id-{symbol}",
+            "url": urls.instrument_url(f"id-{symbol}"),
+        }
+
+    def get_url(self, url):
+        if url == urls.INSTRUMENTS:
+            return {
+                "results": [self.instrument(symbol) for symbol in self.symbols],
+                "next": None,
+            }
+        if url.startswith(f"{urls.INSTRUMENTS}?ids="):
+            symbols = [id_[3:] for id_ in url.rsplit("=", 1)[1].split(",")]
+            return {
+                "results": [
+                    self.instrument(symbol)
+                    for symbol in symbols
+                    if symbol in self.symbols
+                ]
+            }
+        if url.startswith(urls.POSITIONS):
+            return {"results": self.positions, "next": None}
+        if url.startswith(urls.ORDERS):
+            return {"results": [], "next": None}
+        if url.startswith(f"{urls.FUNDAMENTALS}?symbols="):
+            symbols = url.rsplit("=", 1)[1].split(",")
+            return {"results": [self.fundamentals.get(symbol) for symbol in symbols]}
+        if url.startswith(urls.TAGS):
+            members = self.tags.get(url[len(urls.TAGS) :].strip("/"), [])
+            return {
+                "instruments": [self.instrument(symbol)["url"] for symbol in members]
+            }
+        if url.startswith(f"{urls.INSTRUMENTS}?symbol="):
+            symbol = url.rsplit("=", 1)[1]
+            found = symbol in self.symbols
+            return {"results": [self.instrument(symbol)] * found}
+        raise LookupError(url)
+
+    def get_account(self):
+        return {"buying_power": "1000.00", "cash": "1000.00"}
+
+    def quote_data(self, symbol):
+        return {"symbol": symbol, "last_trade_price": "100.00", "updated_at": "now"}
+
+    def quotes_data(self, symbols):
+        return [self.quote_data(symbol) for symbol in symbols]
+
+    def get_open_orders(self):
+        return [{"id": "open-1"}, {"id": "open-2"}]
+
+    def cancel_order(self, order_id):
+        if order_id == "filled":
+            return None
+        self.cancelled.append(order_id)
+        return {}
+
+    def __getattr__(self, name):
+        if not name.startswith("place_"):
+            raise AttributeError(name)
+
+        def place(**kwargs):
+            self.placed.append((name, kwargs))
+            return {"id": f"order-{len(self.placed)}", "state": "queued"}
+
+        return place
+
+
+@pytest.fixture
+def fake_robinhood():
+    """A fresh :class:`FakeRobinhood`."""
+    return FakeRobinhood()
+
+
+@pytest.fixture(scope="session")
+def _plugin(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp("robinhood")
+    for name, value in {
+        "ROBINHOOD_SESSION_FILE": workdir / "session.json",
+        "ROBINHOOD_SYMBOL_INDEX": workdir / "symbols.idx",
+        "ROBINHOOD_INSTRUMENT_CACHE": workdir / "instruments.json",
+        "ROBINHOOD_ORDER_LEDGER": workdir / "orders.sqlite3",
+        "ROBINHOOD_IDEMPOTENCY_FILE": workdir / "idempotency.json",
+        "ROBINHOOD_BAR_STORE_DIR": workdir / "bars",
+        "ROBINHOOD_NEWS_DB": workdir / "news.sqlite3",
+    }.items():
+        os.environ[name] = str(value)
+    from auto_gpt_robinhood import (  # pylint: disable=import-outside-toplevel
+        AutoGPTRobinhoodPlugin,
+    )
+
+    return AutoGPTRobinhoodPlugin()
+
+
+@pytest.fixture
+def plugin(_plugin, tmp_path):
+    """The plugin singleton on a fresh :class:`FakeRobinhood`."""
+    _plugin.session.attach(FakeRobinhood())
+    _plugin.idempotency_path = str(tmp_path / "idempotency.json")
+    _plugin._idempotency_ledgers.clear()  # pylint: disable=protected-access
+    return _plugin
+
+
+@pytest.fixture
+def alice(plugin, monkeypatch):
+    """A second account, ``alice``, whose session is not logged in yet."""
+    # pylint: disable=protected-access
+    monkeypatch.setattr(plugin.sessions, "accounts", ["alice"])
+    monkeypatch.setattr(plugin, "digest_interval", 0.01)
+    yield plugin.sessions.session("alice")
+    for refresher in plugin._digests.values():
+        refresher.stop()
+    plugin._digests.clear()
+    plugin._planned_at.clear()
+    plugin.sessions._sessions.clear()
+    plugin.sessions._used.clear()
@@ -0,0 +1,70 @@
+# pylint: disable=protected-access
+import time
+
+from auto_gpt_robinhood import urls
+from auto_gpt_robinhood.session import passive
+
+
+def _wait(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def _wait_for_events(poller):
+    _wait(lambda: poller._events)
+
+
+def test_watches_and_moves_are_per_account(plugin, monkeypatch):
+    monkeypatch.setattr(plugin.sessions, "accounts", ["alice"])
+    monkeypatch.setattr(plugin, "digest_interval", 0)
+    try:
+        with plugin.account_scope("alice"):
+            assert plugin.watch_symbols("AAPL") == {"watching": ["AAPL"]}
+            _wait_for_events(plugin.quote_poller)
+        assert plugin.watch_symbols("MSFT") == {"watching": ["MSFT"]}
+        _wait_for_events(plugin.quote_poller)
+
+        primary = plugin.on_planning(None, [])
+        with plugin.account_scope("alice"):
+            alice = plugin.on_planning(None, [])
+
+        assert "MSFT" in primary and "AAPL" not in primary
+        assert "AAPL" in alice and "MSFT" not in alice
+    finally:
+        for poller in plugin._quote_pollers.values():
+            poller.stop()
+        plugin._quote_pollers.clear()
+
+
+def test_metrics_cover_every_account(plugin):
+    samples = {name: value for name, _, _, value in plugin._collect_metrics()}
+
+    assert samples["robinhood_watch_dropped_events_total"] == 0
+    assert samples["robinhood_sessions_connected"] == 0
+
+
+def test_market_data_uses_the_only_logged_in_account(plugin, alice, fake_robinhood):
+    plugin.session.reset()
+    fake_robinhood.positions = [
+        {
+            "instrument": urls.instrument_url("id-AAPL"),
+            "quantity": "2",
+            "average_buy_price": "90.00",
+        }
+    ]
+    alice.attach(fake_robinhood)
+    with plugin.account_scope("alice"):
+        plugin.market_context()
+        assert _wait(lambda: plugin.market_context() is not None)
+        assert "AAPL 2 @ 100" in plugin.market_context()
+        token = passive.set(True)
+        try:
+            quotes = plugin.quote_batch("MSFT", refresh=True)
+        finally:
+            passive.reset(token)
+
+    assert quotes["quotes"]["MSFT"]["last_trade_price"] == "100.00"
+    assert plugin._digests["alice"].errors == 0
+    assert not plugin.session.connected
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+
+from auto_gpt_robinhood.aio import gather_bounded
+from auto_gpt_robinhood.pool import current_account
+
+
+def test_gather_bounded_limits_concurrency_and_keeps_order():
+    running, peak = 0, []
+
+    async def work(value):
+        nonlocal running
+        running += 1
+        peak.append(running)
+        await asyncio.sleep(0.01 * (5 - value))
+        running -= 1
+        return value
+
+    results = asyncio.run(gather_bounded((work(value) for value in range(5)), 2))
+
+    assert results == [0, 1, 2, 3, 4]
+    assert max(peak) == 2
+
+
+def test_twins_run_on_the_io_pool_as_the_callers_account(plugin, monkeypatch):
+    seen = []
+
+    def get_account():
+        seen.append((threading.current_thread().name, current_account.get()))
+        return {"account": "ok"}
+
+    monkeypatch.setattr(plugin, "get_account", get_account)
+
+    async def main():
+        token = current_account.set("alice")
+        try:
+            return await plugin.aget_account()
+        finally:
+            current_account.reset(token)
+
+    assert asyncio.run(main()) == {"account": "ok"}
+    assert seen[0][0].startswith("robinhood-io")
+    assert seen[0][1] == "alice"
+
+
+def test_amap_returns_errors_in_place(plugin, monkeypatch):
+    def get_fundamentals(stock):
+        if stock == "NOPE":
+            raise ValueError(stock)
+        return {"symbol": stock}
+
+    monkeypatch.setattr(plugin, "get_fundamentals", get_fundamentals)
+
+    results = asyncio.run(
+        plugin.amap(
+            "get_fundamentals", ["AAPL", "NOPE", "MSFT"], return_exceptions=True
+        )
+    )
+
+    assert results[0] == {"symbol": "AAPL"}
+    assert isinstance(results[1], ValueError)
+    assert results[2] == {"symbol": "MSFT"}
@@ -0,0 +1,74 @@
+import pytest
+
+from auto_gpt_robinhood.backend import (
+    Archive,
+    RecordedError,
+    RecordingClient,
+    ReplayClient,
+)
+from auto_gpt_robinhood.session import RobinhoodSession
+
+
+class Live:
+    """A pyrh client whose price moves with every quote."""
+
+    def __init__(self):
+        self.price = 100
+
+    def quote_data(self, symbol):
+        self.price += 1
+        return {
+            "symbol": symbol,
+            "last_trade_price": f"{self.price}.00",
+            "ask_price": f"{self.price}.50",
+        }
+
+    def get_fundamentals(self, symbol):
+        raise ValueError(f"no fundamentals for {symbol}")
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = Archive(tmp_path / "archive.jsonl.gz")
+    recording = RecordingClient(Live(), archive)
+    recording.quote_data("AAPL")
+    recording.quote_data("AAPL")
+    with pytest.raises(ValueError):
+        recording.get_fundamentals("AAPL")
+    return archive
+
+
+def test_replay_steps_through_recorded_responses(archive):
+    slept = []
+    client = ReplayClient(archive, "recorded", sleep=slept.append)
+
+    prices = [client.quote_data("AAPL")["last_trade_price"] for _ in range(3)]
+
+    assert prices == ["101.00", "102.00", "102.00"]
+    assert len(slept) == 3
+    with pytest.raises(RecordedError, match="ValueError: no fundamentals"):
+        client.get_fundamentals("AAPL")
+    with pytest.raises(LookupError):
+        client.quote_data("MSFT")
+
+
+def test_orders_fill_on_paper_against_the_latest_quote(archive):
+    client = ReplayClient(archive)
+
+    filled = client.place_market_buy_order(symbol="aapl", quantity=2)
+    resting = client.place_limit_buy_order(symbol="AAPL", quantity=1, price=100.0)
+
+    assert filled["state"] == "filled"
+    assert filled["average_price"] == 102.5
+    assert client.get_open_orders() == [client.paper_orders[resting["id"]]]
+    assert client.cancel_order(resting["id"]) == {}
+    assert client.cancel_order(filled["id"]) is None
+    assert client.get_open_orders() == []
+
+
+def test_replay_sessions_never_log_in(archive):
+    session = RobinhoodSession(None, None, backend="replay", archive=archive.path)
+
+    assert session.client.quote_data("AAPL")["symbol"] == "AAPL"
+    with pytest.raises(ValueError):
+        RobinhoodSession(None, None, backend="paper")
@@ -0,0 +1,94 @@
+import numpy as np
+
+from auto_gpt_robinhood.bar_store import BAR_DTYPE, BarStore
+from auto_gpt_robinhood.historicals import PRICE_FIELDS, to_epoch
+
+SESSIONS = ("2024-01-04", "2024-01-05")  # Thursday and Friday
+BAR = 300
+
+
+def _session(day):
+    opened = to_epoch(f"{day}T14:30:00")
+    return list(range(opened, opened + int(6.5 * 3600), BAR))
+
+
+class Market:
+    """Serves the `historicals` spans as of ``now``."""
+
+    def __init__(self):
+        self.now = 0
+        self.timestamps = [t for day in SESSIONS for t in _session(day)]
+        self.spans = []
+
+    def clock(self):
+        return self.now
+
+    def fetch(self, symbol, interval, span, bounds):
+        self.spans.append(span)
+        available = [t for t in self.timestamps if t <= self.now]
+        if span == "day":
+            latest = (available[-1] - 5 * 3600) // 86400
+            available = [t for t in available if (t - 5 * 3600) // 86400 == latest]
+        else:
+            available = [t for t in available if t >= self.now - 7 * 86400]
+        rows = [
+            dict(
+                {field: 1.0 for field in PRICE_FIELDS},
+                begins_at=str(np.datetime64(t, "s")) + "Z",
+                volume=100,
+            )
+            for t in available
+        ]
+        return {"results": [{"symbol": symbol, "historicals": rows}]}
+
+
+def test_top_up_reaches_back_to_the_last_stored_session(tmp_path):
+    market = Market()
+    store = BarStore(str(tmp_path), market.fetch, clock=market.clock)
+    market.now = to_epoch("2024-01-04T17:00:00")
+    assert len(store.get("AAPL", "5minute", "day")) == 31
+
+    # Less than 24 hours later, but "day" would only return Friday.
+    market.now = to_epoch("2024-01-05T15:00:00")
+    assert len(store.get("AAPL", "5minute", "day")) == 7
+
+    bars = store.read("AAPL", "5minute")
+    assert market.spans == ["day", "week"]
+    assert len(bars) == 78 + 7
+    assert np.all(np.diff(bars.timestamps) > 0)
+
+
+def test_day_span_outside_market_hours_returns_the_last_session(tmp_path):
+    market = Market()
+    store = BarStore(str(tmp_path), market.fetch, clock=market.clock)
+    market.now = to_epoch("2024-01-05T23:00:00")
+    store.get("AAPL", "5minute", "week")
+
+    market.now = to_epoch("2024-01-06T12:00:00")  # Saturday
+    bars = store.get("AAPL", "5minute", "day")
+    assert len(bars) == 78
+    assert bars.timestamps[0] == to_epoch("2024-01-05T14:30:00")
+
+    # Nothing new was found, so the next call stays on disk.
+    fetches = len(market.spans)
+    market.now += 60
+    assert len(store.get("AAPL", "5minute", "day")) == 78
+    assert len(market.spans) == fetches
+
+
+def test_a_torn_append_is_truncated_to_the_last_complete_bar(tmp_path, caplog):
+    market = Market()
+    store = BarStore(str(tmp_path), market.fetch, clock=market.clock)
+    market.now = to_epoch("2024-01-04T17:00:00")
+    store.get("AAPL", "5minute", "day")
+    path = store.path("AAPL", "5minute")
+    with open(path, "ab") as file:
+        file.write(b"\0" * (BAR_DTYPE.itemsize // 2))
+
+    bars = store.read("AAPL", "5minute")
+
+    assert len(bars) == 31
+    assert path.stat().st_size == 31 * BAR_DTYPE.itemsize
+    assert "Truncating" in caplog.text
+    market.now = to_epoch("2024-01-04T18:00:00")
+    assert len(store.get("AAPL", "5minute", "day")) == 43
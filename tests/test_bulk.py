@@ -0,0 +1,104 @@
+import math
+
+import pytest
+
+from auto_gpt_robinhood.bulk import idempotency_key, validate_order
+
+
+def _order(**fields):
+    return {"symbol": "AAPL", "side": "buy", "quantity": 1, **fields}
+
+
+@pytest.mark.parametrize(
+    "order, message",
+    [
+        (_order(quantity=math.inf), "quantity"),
+        (_order(quantity="nan"), "quantity"),
+        (_order(quantity=[1]), "quantity"),
+        (_order(quantity=1.5), "quantity"),
+        (_order(type="limit", price="inf"), "price"),
+        (_order(type="stop_limit", price=10, stop_price=-math.inf), "stop_price"),
+    ],
+)
+def test_validate_order_rejects_bad_numbers(order, message):
+    with pytest.raises(ValueError, match=message):
+        validate_order(order)
+
+
+def test_validate_order_normalises():
+    order = validate_order(
+        _order(symbol=" aapl ", side="BUY", type="limit", quantity="2", price="10.5")
+    )
+    assert order == {
+        "symbol": "AAPL",
+        "side": "buy",
+        "type": "limit",
+        "time_in_force": "gfd",
+        "quantity": 2,
+        "price": 10.5,
+    }
+
+
+def test_idempotency_key_depends_on_content_repeats_and_day():
+    order = validate_order(_order())
+    key = idempotency_key(order, "2024-01-02")
+    assert key == idempotency_key(dict(order), "2024-01-02")
+    assert key != idempotency_key(order, "2024-01-02", 1)
+    assert key != idempotency_key(order, "2024-01-03")
+    assert key != idempotency_key(validate_order(_order(quantity=2)), "2024-01-02")
+    assert idempotency_key({**order, "idempotency_key": "mine"}, "x", 3) == "mine"
+
+
+def test_bulk_rejects_whole_batch_on_a_non_finite_row(plugin):
+    result = plugin.place_orders_bulk(
+        [
+            _order(),
+            _order(symbol="MSFT", quantity="inf"),
+        ]
+    )
+    statuses = [row["status"] for row in result["results"]]
+    assert statuses == ["not_submitted", "invalid"]
+    assert "finite" in result["results"][1]["error"]
+    assert plugin.robinhood.placed == []
+
+
+def test_bulk_retry_does_not_resubmit(plugin):
+    batch = [
+        _order(),
+        _order(symbol="MSFT", side="sell", type="limit", quantity=2, price=300),
+    ]
+    first = plugin.place_orders_bulk(batch)
+    second = plugin.place_orders_bulk(batch)
+
+    assert first["submitted"] == 2
+    assert [row["status"] for row in second["results"]] == ["duplicate"] * 2
+    assert [row["order_id"] for row in second["results"]] == [
+        row["order_id"] for row in first["results"]
+    ]
+    assert len(plugin.robinhood.placed) == 2
+
+
+def test_bulk_retry_with_a_changed_batch_sends_only_new_orders(plugin):
+    first = plugin.place_orders_bulk([_order(), _order()])
+    second = plugin.place_orders_bulk([_order(symbol="MSFT"), _order(), _order()])
+
+    assert first["submitted"] == 2
+    statuses = [row["status"] for row in second["results"]]
+    assert statuses == ["submitted", "duplicate", "duplicate"]
+    assert len(plugin.robinhood.placed) == 3
+
+
+def test_cancels_invalidate_cached_account_state(plugin, monkeypatch):
+    calls = []
+    monkeypatch.setattr(plugin, "_order_placed", lambda: calls.append(1))
+
+    assert plugin.cancel_order("filled") is None
+    assert not calls
+    plugin.cancel_order("open-1")
+    assert len(calls) == 1
+
+    result = plugin.cancel_orders_bulk("all")
+    assert result["cancelled"] == 2
+    assert len(calls) == 2
+    plugin.cancel_orders_bulk(["filled"])
+    assert len(calls) == 2
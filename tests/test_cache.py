@@ -0,0 +1,47 @@
+from auto_gpt_robinhood.cache import QuoteCache
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_the_ttl():
+    clock = Clock()
+    cache = QuoteCache(ttl=5.0, clock=clock)
+    cache.put("aapl", {"symbol": "AAPL"})
+
+    clock.now = 4.9
+    assert cache.get("AAPL") == {"symbol": "AAPL"}
+    clock.now = 5.0
+    assert cache.get("AAPL") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 0, "hit_ratio": 0.5}
+
+
+def test_the_least_recently_used_entry_is_evicted():
+    cache = QuoteCache(max_size=2)
+    cache.put("AAPL", {})
+    cache.put("MSFT", {})
+    cache.get("AAPL")
+    cache.put("TSLA", {})
+
+    assert cache.get("MSFT") is None
+    assert cache.get("AAPL") == {}
+    assert cache.get("TSLA") == {}
+
+
+def test_quote_accessors_share_one_fetch(plugin, monkeypatch):
+    fake, calls = plugin.robinhood, []
+    quote_data = fake.quote_data
+    monkeypatch.setattr(
+        fake, "quote_data", lambda symbol: calls.append(symbol) or quote_data(symbol)
+    )
+    plugin.quote_cache.invalidate("CACHED")
+
+    assert plugin.last_trade_price("CACHED") == 100.0
+    assert plugin.get_symbol("CACHED") == "CACHED"
+    assert plugin.last_updated_at("CACHED") == "now"
+    assert calls == ["CACHED"]
@@ -0,0 +1,42 @@
+import contextvars
+import threading
+
+from auto_gpt_robinhood.concurrency import chunked, fan_out, unique
+
+account = contextvars.ContextVar("account", default=None)
+
+
+def test_unique_and_chunked():
+    assert unique([" aapl", "MSFT", "", "AAPL", "tsla "]) == ["AAPL", "MSFT", "TSLA"]
+    assert list(chunked([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+
+
+def test_fan_out_keeps_order_and_collects_errors():
+    def call(item):
+        if item == 3:
+            raise ValueError("bad")
+        return item * 10
+
+    outcomes = fan_out(call, [1, 2, 3, 4], max_workers=4)
+
+    assert [(item, result) for item, result, _ in outcomes] == [
+        (1, 10),
+        (2, 20),
+        (3, None),
+        (4, 40),
+    ]
+    assert [error is None for _, _, error in outcomes] == [True, True, False, True]
+    assert isinstance(outcomes[2][2], ValueError)
+
+
+def test_fan_out_runs_concurrently_in_the_callers_context():
+    barrier = threading.Barrier(3, timeout=5)
+    account.set("alice")
+
+    def call(item):
+        barrier.wait()
+        return account.get()
+
+    outcomes = fan_out(call, [1, 2, 3], max_workers=3)
+
+    assert [result for _, result, _ in outcomes] == ["alice"] * 3
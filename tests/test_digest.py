@@ -0,0 +1,35 @@
+# pylint: disable=protected-access
+import time
+
+
+def _wait(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_digest_never_logs_in(plugin, alice):
+    with plugin.account_scope("alice"):
+        assert plugin.market_context() is None
+    refresher = plugin._digests["alice"]
+
+    assert _wait(lambda: not refresher._thread.is_alive())
+    assert not alice.connected
+    assert refresher.errors == 0
+
+
+def test_digest_neither_touches_nor_outlives_an_idle_session(
+    plugin, alice, fake_robinhood
+):
+    alice.attach(fake_robinhood)
+    with plugin.account_scope("alice"):
+        plugin.market_context()
+        assert _wait(lambda: plugin.market_context() is not None)
+        assert "buying power $1,000.00" in plugin.market_context()
+    assert "alice" not in plugin.sessions._used
+
+    plugin._planned_at["alice"] -= plugin.sessions.idle_timeout
+    refresher = plugin._digests["alice"]
+    assert _wait(lambda: not refresher._thread.is_alive())
+    assert refresher.errors == 0
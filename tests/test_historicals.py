@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from auto_gpt_robinhood.historicals import HistoricalBars, parse_historicals, to_epoch
+
+DAYS = ("2024-01-04", "2024-01-05", "2024-01-08")  # Thursday, Friday, Monday
+
+
+def _payload():
+    rows = [
+        {
+            "begins_at": f"{day}T00:00:00Z",
+            "open_price": str(10 + index),
+            "high_price": str(12 + index),
+            "low_price": str(9 + index),
+            "close_price": str(11 + index),
+            "volume": 100 * (index + 1),
+        }
+        for index, day in enumerate(DAYS)
+    ]
+    return {"results": [{"symbol": "AAPL", "interval": "day", "historicals": rows}]}
+
+
+def test_parses_rows_into_columns():
+    bars = parse_historicals(_payload())["AAPL"]
+
+    assert len(bars) == 3
+    assert bars.timestamps.dtype == np.int64
+    assert bars.close.dtype == np.float64
+    assert bars.timestamps[0] == to_epoch("2024-01-04T00:00:00Z")
+    assert bars.close.tolist() == [11.0, 12.0, 13.0]
+    assert bars.to_dict()["begins_at"][-1] == "2024-01-08T00:00:00Z"
+
+
+def test_slices_are_views():
+    bars = parse_historicals(_payload())["AAPL"]
+
+    assert np.shares_memory(bars[1:].close, bars.close)
+    assert bars[-1].close.tolist() == [13.0]
+    assert bars.between("2024-01-05", "2024-01-08").volume.tolist() == [200.0]
+
+
+def test_weeks_start_on_monday():
+    weekly = parse_historicals(_payload())["AAPL"].resample("week")
+
+    assert weekly.to_dict() == {
+        "symbol": "AAPL",
+        "interval": "week",
+        "begins_at": ["2024-01-01T00:00:00Z", "2024-01-08T00:00:00Z"],
+        "open": [10.0, 12.0],
+        "high": [13.0, 14.0],
+        "low": [9.0, 11.0],
+        "close": [12.0, 13.0],
+        "volume": [300.0, 300.0],
+    }
+
+
+def test_resample_rejects_unknown_intervals():
+    with pytest.raises(ValueError):
+        HistoricalBars.from_rows("AAPL", "day", []).resample("month")
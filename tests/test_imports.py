@@ -0,0 +1,20 @@
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_plugin_import_does_not_load_numpy():
+    code = (
+        "import sys; import auto_gpt_robinhood as m; m.AutoGPTRobinhoodPlugin();"
+        " print('numpy' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,58 @@
+import numpy as np
+
+from auto_gpt_robinhood.historicals import HistoricalBars
+from auto_gpt_robinhood.indicators import ema, rsi, sma, summarize, vwap
+
+
+def _bars(symbol, close):
+    close = np.asarray(close, dtype=np.float64)
+    timestamps = np.arange(len(close), dtype=np.int64) * 86400
+    volume = np.full(len(close), 100.0)
+    return HistoricalBars(
+        symbol, "day", timestamps, close, close + 1, close - 1, close, volume
+    )
+
+
+def test_moving_averages():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    np.testing.assert_allclose(sma(values, 3), [np.nan, np.nan, 2.0, 3.0, 4.0])
+    np.testing.assert_allclose(ema(values, 3), [np.nan, np.nan, 2.0, 3.0, 4.0])
+    assert np.isnan(sma(values, 6)).all()
+
+
+def test_rsi_is_100_without_losses():
+    assert rsi(np.arange(1.0, 20.0))[-1] == 100.0
+
+
+def test_vwap_weights_the_typical_price_by_volume():
+    high, low, close = np.array([3.0, 6.0]), np.array([1.0, 4.0]), np.array([2.0, 5.0])
+
+    np.testing.assert_allclose(vwap(high, low, close, [1.0, 3.0]), [2.0, 4.25])
+
+
+def test_rows_of_a_2d_array_match_1d_results():
+    rows = np.array([np.linspace(1, 30, 30), np.linspace(30, 1, 30)])
+
+    for function in (sma, ema):
+        stacked = function(rows, 5)
+        for row, values in zip(stacked, rows):
+            np.testing.assert_allclose(row, function(values, 5))
+
+
+def test_summarize_groups_by_length_and_reports_missing_values():
+    summary = summarize(
+        [
+            _bars("UP", np.arange(1.0, 61.0)),
+            _bars("DOWN", np.arange(60.0, 0.0, -1)),
+            _bars("NEW", [10.0, 11.0]),
+            _bars("EMPTY", []),
+        ]
+    )
+
+    assert sorted(summary) == ["DOWN", "NEW", "UP"]
+    assert summary["UP"]["sma_20"] == 50.5
+    assert summary["UP"]["rsi_14"] == 100.0
+    assert summary["DOWN"]["rsi_14"] == 0.0
+    assert summary["NEW"]["close"] == 11.0
+    assert summary["NEW"]["sma_20"] is None
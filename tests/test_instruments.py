@@ -0,0 +1,52 @@
+import threading
+
+from auto_gpt_robinhood import urls
+from auto_gpt_robinhood.instruments import InstrumentCache
+
+
+def _instrument(id_):
+    return {"id": id_, "url": urls.instrument_url(id_), "symbol": f"S{id_}"}
+
+
+def _fetch(url):
+    ids = url.split("ids=", 1)[1].split(",")
+    return {"results": [_instrument(id_) for id_ in ids]}
+
+
+def test_concurrent_resolve_saves_every_instrument(tmp_path):
+    path = tmp_path / "instruments.json"
+    cache = InstrumentCache(str(path), _fetch, batch_size=2, max_workers=2)
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def resolve(worker):
+        barrier.wait()
+        try:
+            ids = [f"{worker}{index}" for index in range(5)]
+            resolved = cache.resolve([urls.instrument_url(id_) for id_ in ids])
+            assert [item["id"] for item in resolved] == ids
+        except Exception as error:  # pylint: disable=broad-except
+            errors.append(error)
+
+    threads = [threading.Thread(target=resolve, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert not path.with_suffix(".tmp").exists()
+    reloaded = InstrumentCache(str(path), _fetch)
+    assert reloaded.by_symbol("S00") is not None
+    assert reloaded.by_symbol("S74") is not None
+
+
+def test_resolve_survives_a_failed_save(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    cache = InstrumentCache(str(blocker / "instruments.json"), _fetch)
+
+    resolved = cache.resolve([urls.instrument_url("1")])
+
+    assert resolved[0]["symbol"] == "S1"
+    assert cache.by_symbol("S1") is not None
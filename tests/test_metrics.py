@@ -0,0 +1,101 @@
+import urllib.request
+
+import pytest
+
+from auto_gpt_robinhood.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = MetricsRegistry(buckets=(0.1, 1.0), window=8)
+    registry.describe("robinhood_calls_total", "Wrapper calls.")
+    registry.inc("robinhood_calls_total", method="quote_data", outcome="ok")
+    registry.inc("robinhood_calls_total", 2, method="quote_data", outcome="ok")
+    registry.observe("robinhood_call_duration_seconds", 0.05, method="quote_data")
+    registry.observe("robinhood_call_duration_seconds", 0.5, method="quote_data")
+    registry.add_collector(
+        lambda: [("robinhood_queue_depth", "gauge", {"lane": 'say "hi"\n'}, 2)]
+    )
+    return registry
+
+
+PROMETHEUS = """\
+# HELP robinhood_calls_total Wrapper calls.
+# TYPE robinhood_calls_total counter
+robinhood_calls_total{method="quote_data",outcome="ok"} 3
+# TYPE robinhood_call_duration_seconds histogram
+robinhood_call_duration_seconds_bucket{method="quote_data",le="0.1"} 1
+robinhood_call_duration_seconds_bucket{method="quote_data",le="1.0"} 2
+robinhood_call_duration_seconds_bucket{method="quote_data",le="+Inf"} 2
+robinhood_call_duration_seconds_count{method="quote_data"} 2
+robinhood_call_duration_seconds_sum{method="quote_data"} 0.55
+# TYPE robinhood_call_duration_seconds_quantile gauge
+robinhood_call_duration_seconds_quantile{method="quote_data",quantile="0.5"} 0.5
+robinhood_call_duration_seconds_quantile{method="quote_data",quantile="0.95"} 0.5
+robinhood_call_duration_seconds_quantile{method="quote_data",quantile="0.99"} 0.5
+# TYPE robinhood_queue_depth gauge
+robinhood_queue_depth{lane="say \\"hi\\"\\n"} 2
+"""
+
+
+def test_prometheus_exposition(registry):
+    assert registry.exposition() == PROMETHEUS
+
+
+def test_openmetrics_names_counter_families_and_ends_with_eof(registry):
+    lines = registry.exposition(openmetrics=True).splitlines()
+
+    assert lines[:3] == [
+        "# HELP robinhood_calls Wrapper calls.",
+        "# TYPE robinhood_calls counter",
+        'robinhood_calls_total{method="quote_data",outcome="ok"} 3',
+    ]
+    assert lines[-1] == "# EOF"
+
+
+def test_summary_reports_counters_and_latency(registry):
+    summary = registry.summary()
+
+    series = '{method="quote_data"}'
+    assert summary["counters"]["robinhood_calls_total"] == {
+        '{method="quote_data",outcome="ok"}': 3
+    }
+    assert summary["latency"]["robinhood_call_duration_seconds"][series] == {
+        "count": 2,
+        "mean": 0.275,
+        "p50": 0.5,
+        "p95": 0.5,
+        "p99": 0.5,
+    }
+
+
+def test_write_and_serve(registry, tmp_path):
+    path = tmp_path / "metrics" / "robinhood.prom"
+    registry.write(path)
+    assert path.read_text() == PROMETHEUS
+
+    server = registry.serve(0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/metrics"
+        request = urllib.request.Request(
+            url, headers={"Accept": "application/openmetrics-text"}
+        )
+        with urllib.request.urlopen(request) as response:
+            content_type = response.headers["Content-Type"]
+            body = response.read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert content_type.startswith("application/openmetrics-text")
+    assert body.endswith("# EOF\n")
+
+
+def test_wrappers_are_timed(plugin):
+    before = plugin.metrics.summary()["counters"].get("robinhood_calls_total", {})
+    key = '{method="get_account",outcome="ok"}'
+
+    plugin.get_account()
+
+    after = plugin.metrics.summary()["counters"]["robinhood_calls_total"]
+    assert after[key] == before.get(key, 0) + 1
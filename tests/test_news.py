@@ -0,0 +1,67 @@
+from auto_gpt_robinhood import urls
+from auto_gpt_robinhood.news import NewsStore
+
+
+class Feed:
+    """One symbol's `news` feed, newest first, two articles per page."""
+
+    def __init__(self):
+        self.articles = []
+
+    def publish(self, count):
+        start = len(self.articles)
+        self.articles[:0] = [
+            {
+                "url": f"https://example.com/{n}",
+                "title": f"Story {n}",
+                "summary": f"Summary number {n}",
+                "published_at": f"2024-01-01T00:{n:02d}:00Z",
+            }
+            for n in reversed(range(start, start + count))
+        ]
+
+    def __call__(self, url):
+        offset = int(url.rsplit("=", 1)[1]) if "offset=" in url else 0
+        following = offset + 2
+        return {
+            "results": self.articles[offset:following],
+            "next": (
+                f"{urls.NEWS}AAPL/?offset={following}"
+                if following < len(self.articles)
+                else None
+            ),
+        }
+
+
+def test_ingest_resumes_where_max_pages_stopped():
+    feed = Feed()
+    store = NewsStore(None, feed, max_pages=2)
+    feed.publish(6)
+    assert len(store.ingest(["AAPL"])["new"]) == 4  # history is capped
+
+    feed.publish(6)
+    assert len(store.ingest(["AAPL"])["new"]) == 4
+    assert len(store.ingest(["AAPL"])["new"]) == 2
+    assert len(store.ingest(["AAPL"])["new"]) == 0
+
+    stored = {article["title"] for article in store.search(limit=100)}
+    assert {f"Story {n}" for n in range(6, 12)} <= stored
+
+
+def test_new_articles_during_a_catch_up_are_read_next(tmp_path):
+    feed = Feed()
+    store = NewsStore(tmp_path / "news.sqlite3", feed, max_pages=1)
+    feed.publish(1)
+    store.ingest(["AAPL"])
+    feed.publish(4)
+    store.ingest(["AAPL"])
+    store.close()
+
+    store = NewsStore(tmp_path / "news.sqlite3", feed, max_pages=1)
+    store.ingest(["AAPL"])  # resumes the gap after a restart
+    feed.publish(1)
+    store.ingest(["AAPL"])
+    store.ingest(["AAPL"])
+
+    assert len(store) == 6
+    assert store.search("story", limit=1)[0]["title"] == "Story 5"
@@ -0,0 +1,106 @@
+import math
+from urllib.parse import parse_qs, urlsplit
+
+from auto_gpt_robinhood import urls
+from auto_gpt_robinhood.options import build_snapshot
+
+DATES = ("2024-02-16", "2024-01-19")
+
+
+def _contracts():
+    return [
+        {
+            "id": f"{date}-{kind}-{strike}",
+            "type": kind,
+            "expiration_date": date,
+            "strike_price": f"{strike}.0000",
+        }
+        for date in DATES
+        for kind in ("put", "call")
+        for strike in (110, 100)
+    ]
+
+
+class Chain:
+    """Serves one option chain, a contract per page, and its market data."""
+
+    def __init__(self):
+        self.urls = []
+
+    def __call__(self, url):
+        self.urls.append(url)
+        if url == f"{urls.OPTIONS_CHAINS}chain-1/":
+            return {"expiration_dates": list(DATES)}
+        query = parse_qs(urlsplit(url).query)
+        if url.startswith(urls.MARKETDATA_OPTIONS):
+            return {
+                "results": [
+                    (
+                        None
+                        if "110" in id_
+                        else {"instrument_id": id_, "delta": "0.5", "bid_price": "1.25"}
+                    )
+                    for id_ in query["ids"][0].split(",")
+                ]
+            }
+        contracts = [
+            contract
+            for contract in _contracts()
+            if contract["expiration_date"] == query["expiration_dates"][0]
+            and contract["type"] == query.get("type", [contract["type"]])[0]
+        ]
+        page = int(query.get("page", ["0"])[0])
+        more = page + 1 < len(contracts)
+        return {
+            "results": contracts[page : page + 1],
+            "next": f"{url.split('&page=')[0]}&page={page + 1}" if more else None,
+        }
+
+
+def test_snapshot_reads_every_page_and_sorts_contracts():
+    chain = Chain()
+
+    snapshot = build_snapshot("aapl", "chain-1", chain, batch_size=3)
+
+    assert snapshot.symbol == "AAPL"
+    assert len(snapshot) == 8
+    assert snapshot.expiration.astype(str).tolist()[::4] == ["2024-01-19", "2024-02-16"]
+    assert snapshot.type.tolist()[:4] == ["call", "call", "put", "put"]
+    assert snapshot.strike.tolist()[:2] == [100.0, 110.0]
+    market_data = [url for url in chain.urls if url.startswith(urls.MARKETDATA_OPTIONS)]
+    assert len(market_data) == 3
+
+
+def test_missing_market_data_is_nan_and_none():
+    snapshot = build_snapshot("AAPL", "chain-1", Chain(), ["2024-01-19"], "call")
+
+    assert snapshot.id.tolist() == ["2024-01-19-call-100", "2024-01-19-call-110"]
+    assert snapshot.delta[0] == 0.5 and math.isnan(snapshot.delta[1])
+    assert snapshot.to_records()[1]["bid"] is None
+    assert snapshot.to_records(1) == [
+        {
+            "id": "2024-01-19-call-100",
+            "type": "call",
+            "expiration": "2024-01-19",
+            "strike": 100.0,
+            **{name: None for name in ("ask", "mark", "last", "iv")},
+            "bid": 1.25,
+            "delta": 0.5,
+            **{name: None for name in ("gamma", "theta", "vega", "rho")},
+            "open_interest": None,
+            "volume": None,
+        }
+    ]
+
+
+def test_filter_by_type_expiry_and_ranges():
+    snapshot = build_snapshot("AAPL", "chain-1", Chain())
+
+    picked = snapshot.filter(
+        option_type="put",
+        expiration_dates=["2024-02-16"],
+        max_strike=105,
+        delta=(0.25, None),
+    )
+
+    assert picked.id.tolist() == ["2024-02-16-put-100"]
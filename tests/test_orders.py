@@ -0,0 +1,83 @@
+import pytest
+
+from auto_gpt_robinhood import urls
+from auto_gpt_robinhood.orders import OrderLedger
+
+
+def _order(id_, updated_at, state="filled"):
+    return {
+        "id": id_,
+        "instrument": f"{urls.INSTRUMENTS}{id_}/",
+        "symbol": "AAPL",
+        "state": state,
+        "side": "buy",
+        "updated_at": updated_at,
+    }
+
+
+class Pages:
+    """The `orders` feed split into pages, newest first."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.fail_at = None
+        self.requested = []
+
+    def __call__(self, url):
+        self.requested.append(url)
+        index = 0 if url == urls.ORDERS or "gte" in url else int(url.rsplit("=", 1)[1])
+        if index == self.fail_at:
+            raise ConnectionError("dropped")
+        following = index + 1 if index + 1 < len(self.pages) else None
+        return {
+            "results": self.pages[index],
+            "next": None if following is None else f"{urls.ORDERS}?page={following}",
+        }
+
+
+def test_sync_advances_cursor_after_the_last_page():
+    fetch = Pages(
+        [
+            [_order("c", "2024-01-03T00:00:00Z")],
+            [_order("b", "2024-01-02T00:00:00Z")],
+            [_order("a", "2024-01-01T00:00:00Z")],
+        ]
+    )
+    ledger = OrderLedger(None, fetch, lambda instruments: [None] * len(instruments))
+
+    assert ledger.sync() == 3
+    assert ledger.cursor == "2024-01-03T00:00:00Z"
+    assert [order["id"] for order in ledger.query()] == ["c", "b", "a"]
+
+
+def test_sync_resumes_from_old_cursor_after_a_failed_page():
+    fetch = Pages(
+        [
+            [_order("c", "2024-01-03T00:00:00Z")],
+            [_order("b", "2024-01-02T00:00:00Z")],
+            [_order("a", "2024-01-01T00:00:00Z")],
+        ]
+    )
+    ledger = OrderLedger(None, fetch, lambda instruments: [None] * len(instruments))
+    fetch.fail_at = 2
+
+    with pytest.raises(ConnectionError):
+        ledger.sync()
+    assert ledger.cursor is None
+
+    fetch.fail_at = None
+    ledger.sync(force=True)
+    assert fetch.requested[-3] == urls.ORDERS
+    assert ledger.cursor == "2024-01-03T00:00:00Z"
+    assert [order["id"] for order in ledger.query()] == ["c", "b", "a"]
+
+
+def test_sync_keeps_cursor_when_nothing_changed():
+    fetch = Pages([[_order("a", "2024-01-01T00:00:00Z")]])
+    ledger = OrderLedger(None, fetch, lambda instruments: [None] * len(instruments))
+    ledger.sync()
+    fetch.pages = [[]]
+
+    assert ledger.sync(force=True) == 0
+    assert ledger.cursor == "2024-01-01T00:00:00Z"
+    assert "updated_at[gte]=" in fetch.requested[-1]
@@ -0,0 +1,83 @@
+import numpy as np
+
+from auto_gpt_robinhood import pricing, urls
+from auto_gpt_robinhood.options import MARKET_DATA_FIELDS, OptionChainSnapshot
+from auto_gpt_robinhood.pricing import fill_chain, regular_close
+
+
+def _snapshot():
+    columns = {name: np.full(2, np.nan) for name in MARKET_DATA_FIELDS}
+    columns.update(
+        id=np.array(["call-100", "put-100"], dtype=object),
+        type=np.array(["call", "put"], dtype=object),
+        expiration=np.array(["2030-01-18", "2030-01-18"], dtype="datetime64[D]"),
+        strike=np.array([100.0, 100.0]),
+        bid=np.array([4.9, 3.9]),
+        ask=np.array([5.1, 4.1]),
+    )
+    columns["iv"][1] = 0.3
+    return OptionChainSnapshot("AAPL", columns)
+
+
+def test_fill_chain_leaves_the_snapshot_untouched():
+    snapshot = _snapshot()
+    before = {name: column.copy() for name, column in snapshot.columns.items()}
+
+    filled = fill_chain(snapshot, 100.0, 0.05, now=np.datetime64("2029-12-18"))
+
+    assert filled is not snapshot
+    for name, column in snapshot.columns.items():
+        np.testing.assert_array_equal(column, before[name])
+    assert 0 < filled.iv[0] < 1
+    assert filled.iv[1] == 0.3
+    assert 0 < filled.delta[0] < 1 and -1 < filled.delta[1] < 0
+    assert filled.id is snapshot.id
+
+
+def test_the_regular_close_follows_us_daylight_saving_time():
+    closes = regular_close(
+        np.array(
+            ["2024-03-08", "2024-03-11", "2024-11-01", "2024-11-04"],
+            dtype="datetime64[D]",
+        )
+    )
+
+    assert closes.astype(str).tolist() == [
+        "2024-03-08T21:00:00",
+        "2024-03-11T20:00:00",
+        "2024-11-01T20:00:00",
+        "2024-11-04T21:00:00",
+    ]
+
+
+def test_contracts_expire_at_the_market_hours_close():
+    now = np.datetime64("2030-01-04T14:30:00")
+    regular = fill_chain(_snapshot(), 100.0, 0.05, now=now)
+    early = fill_chain(
+        _snapshot(), 100.0, 0.05, now=now, closes={"2030-01-18": "2030-01-18T18:00Z"}
+    )
+
+    assert early.iv[0] > regular.iv[0]
+    assert early.iv[1] == regular.iv[1] == 0.3
+
+
+def test_price_option_chain_reads_the_close_of_each_expiry(plugin, monkeypatch):
+    fake, requested = plugin.robinhood, []
+
+    def get_url(url):
+        requested.append(url)
+        return {"is_open": True, "closes_at": "2030-01-18T18:00:00Z"}
+
+    monkeypatch.setattr(fake, "get_url", get_url)
+    monkeypatch.setattr(plugin, "get_option_chain_snapshot", lambda *args: _snapshot())
+    closes = {}
+    monkeypatch.setattr(
+        pricing,
+        "fill_chain",
+        lambda *args, **kwargs: closes.update(kwargs["closes"]),
+    )
+
+    plugin.price_option_chain("AAPL")
+
+    assert requested == [urls.market_hours_url("2030-01-18")]
+    assert closes == {"2030-01-18": "2030-01-18T18:00:00Z"}
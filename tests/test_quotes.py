@@ -0,0 +1,44 @@
+def test_quote_list_keeps_the_pyrh_shape(plugin, monkeypatch):
+    fake = plugin.robinhood
+    quotes_data = fake.quotes_data
+    monkeypatch.setattr(
+        fake,
+        "quotes_data",
+        lambda symbols: [
+            None if quote["symbol"] == "NOPE" else quote
+            for quote in quotes_data(symbols)
+        ],
+    )
+
+    rows = plugin.get_quote_list("aapl, NOPE,MSFT", "symbol,last_trade_price")
+
+    assert rows == [["AAPL", "100.00", ""], ["MSFT", "100.00", ""]]
+
+
+def test_quote_batch_chunks_misses_and_retries_a_failed_chunk(plugin, monkeypatch):
+    fake, requested = plugin.robinhood, []
+
+    def quotes_data(symbols):
+        requested.append(list(symbols))
+        if "NOPE" in symbols:
+            raise ValueError("invalid ticker")
+        return [fake.quote_data(symbol) for symbol in symbols]
+
+    def quote_data(symbol):
+        if symbol == "NOPE":
+            raise ValueError("invalid ticker")
+        return {"symbol": symbol, "last_trade_price": "100.00"}
+
+    monkeypatch.setattr(fake, "quotes_data", quotes_data)
+    monkeypatch.setattr(fake, "quote_data", quote_data)
+    monkeypatch.setattr(plugin, "quote_batch_size", 2)
+    for symbol in ("AAA", "BBB", "CCC", "NOPE"):
+        plugin.quote_cache.invalidate(symbol)
+    plugin.quote_cache.put("CCC", {"symbol": "CCC"})
+
+    result = plugin.quote_batch("aaa,BBB,ccc,nope,AAA")
+
+    assert sorted(result["quotes"]) == ["AAA", "BBB", "CCC"]
+    assert result["quotes"]["CCC"] == {"symbol": "CCC"}
+    assert list(result["errors"]) == ["NOPE"]
+    assert sorted(requested) == [["AAA", "BBB"], ["NOPE"]]
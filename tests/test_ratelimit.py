@@ -0,0 +1,94 @@
+import itertools
+import threading
+import time
+
+from auto_gpt_robinhood.ratelimit import (
+    RateLimiter,
+    TokenBucket,
+    classify,
+    current_lane,
+)
+
+
+def _limiter(global_budget=(0, 1), **budgets):
+    lanes = {lane: (0, 1) for lane in ("orders", "account", "historicals", "quotes")}
+    lanes.update(budgets)
+    return RateLimiter(lanes, global_budget)
+
+
+def test_classify_routes_order_writes_to_the_orders_lane():
+    orders = "https://api.robinhood.com/orders/"
+    assert classify("POST", orders) == "orders"
+    assert classify("POST", f"{orders}abc/cancel/") == "orders"
+    assert classify("GET", orders) == "account"
+    assert classify("GET", "https://api.robinhood.com/marketdata/quotes/") == "quotes"
+    assert classify("GET", "https://api.robinhood.com/unknown/") == "quotes"
+
+
+def test_token_bucket_refills_up_to_burst():
+    now = [0.0]
+    bucket = TokenBucket(2, 3, clock=lambda: now[0])
+    for _ in range(3):
+        bucket.take()
+    assert not bucket.ready()
+    assert bucket.delay() == 0.5
+    now[0] = 10.0
+    bucket.refill()
+    assert bucket.tokens == 3
+
+
+def test_orders_take_the_next_global_token_first():
+    limiter = _limiter(global_budget=(10, 1))
+    limiter.acquire("quotes")  # drain the global bucket
+    granted = []
+
+    def acquire(lane):
+        limiter.acquire(lane)
+        granted.append(lane)
+
+    quotes = threading.Thread(target=acquire, args=("quotes",))
+    quotes.start()
+    time.sleep(0.02)
+    orders = threading.Thread(target=acquire, args=("orders",))
+    orders.start()
+    quotes.join(5)
+    orders.join(5)
+
+    assert granted == ["orders", "quotes"]
+
+
+def test_throttled_lane_does_not_block_other_lanes():
+    limiter = _limiter(quotes=(0.5, 1))
+    limiter.acquire("quotes")  # the next quote waits two seconds
+    waiting = threading.Thread(target=limiter.acquire, args=("quotes",), daemon=True)
+    waiting.start()
+    time.sleep(0.02)
+
+    assert limiter.acquire("account") < 0.05
+    assert limiter.stats()["quotes"]["depth"] == 1
+
+
+def test_waits_are_measured_with_the_injected_clock():
+    ticks = itertools.count()
+    limiter = RateLimiter({"quotes": (0, 1)}, (0, 1), clock=lambda: float(next(ticks)))
+
+    assert limiter.acquire("quotes") >= 1
+    assert limiter.stats()["quotes"]["wait_seconds"] >= 1
+
+
+def test_order_wrappers_send_every_request_in_the_orders_lane(plugin, monkeypatch):
+    lanes = []
+    fake = plugin.robinhood
+
+    def record(*args, **kwargs):
+        lanes.append(current_lane.get())
+        return {"id": "order-1", "state": "queued"}
+
+    monkeypatch.setattr(fake, "place_market_buy_order", record, raising=False)
+    monkeypatch.setattr(fake, "cancel_order", record)
+
+    plugin.place_market_but_order("AAPL", "gfd", 1)
+    plugin.cancel_order("order-1")
+
+    assert lanes == ["orders", "orders"]
+    assert current_lane.get() is None
@@ -0,0 +1,46 @@
+# pylint: disable=protected-access
+import threading
+import time
+
+from auto_gpt_robinhood.refresh import BackgroundRefresher
+from auto_gpt_robinhood.session import passive
+
+
+def _wait(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_refresher_stops_when_inactive():
+    built, active = [], threading.Event()
+    active.set()
+    refresher = BackgroundRefresher(
+        lambda: built.append(1) or len(built), interval=0.01, active=active.is_set
+    )
+    refresher.start()
+    assert _wait(lambda: len(built) >= 2)
+
+    active.clear()
+    assert _wait(lambda: not refresher._thread.is_alive())
+    count = len(built)
+    time.sleep(0.05)
+    assert len(built) == count
+    assert refresher.latest()[0] == count
+
+    active.set()
+    refresher.start()
+    assert _wait(lambda: len(built) > count)
+    refresher.stop()
+
+
+def test_builds_run_passively_in_the_background():
+    seen = []
+    refresher = BackgroundRefresher(lambda: seen.append(passive.get()), interval=0.01)
+    refresher.refresh()
+    refresher.start()
+    assert _wait(lambda: len(seen) >= 2)
+    refresher.stop()
+
+    assert seen[0] is False and all(seen[1:])
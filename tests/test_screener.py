@@ -0,0 +1,62 @@
+# pylint: disable=protected-access
+import time
+
+import pytest
+
+
+def _wait(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def screener(plugin, monkeypatch):
+    fake = plugin.robinhood
+    fake.tags = {"top-movers": ["MSFT", "TSLA"]}
+    fake.fundamentals = {
+        "AAPL": {"pe_ratio": "30", "market_cap": "3000000000000"},
+        "MSFT": {"pe_ratio": "35", "market_cap": "2800000000000"},
+        "TSLA": {"pe_ratio": "60", "market_cap": "800000000000"},
+    }
+    monkeypatch.setattr(plugin, "screener_universe", ["AAPL"])
+    monkeypatch.setattr(plugin, "screener_tags", ["top-movers"])
+    monkeypatch.setattr(plugin, "screener_interval", 0)
+    monkeypatch.setattr(plugin, "_screener", None)
+    yield plugin
+    if plugin._screener is not None:
+        plugin._screener.refresher.stop()
+
+
+def test_screens_filter_and_sort_the_universe(screener):
+    assert screener.screen_stocks('tag("top-movers") and pe_ratio < 50') == ["MSFT"]
+    assert screener.screen_stocks("market_cap > 1T", "-market_cap") == [
+        "AAPL",
+        "MSFT",
+    ]
+    assert screener.screen_stocks(sort="pe_ratio", limit=2) == ["AAPL", "MSFT"]
+
+
+def test_background_rebuilds_stop_without_a_session(screener, monkeypatch):
+    monkeypatch.setattr(screener, "screener_interval", 0.01)
+    logins = []
+    screener.screen_stocks()
+    refresher = screener.screener.refresher
+    assert _wait(lambda: refresher._attempted_at is not None)
+
+    screener.session.reset()
+    monkeypatch.setattr(screener.session, "_connect", lambda: logins.append(1))
+    assert _wait(lambda: not refresher._thread.is_alive())
+    assert not logins and refresher.errors == 0
+
+
+def test_background_rebuilds_stop_once_screening_stops(screener, monkeypatch):
+    monkeypatch.setattr(screener, "screener_interval", 0.01)
+    screener.screen_stocks()
+    refresher = screener.screener.refresher
+    built = refresher._attempted_at
+    assert _wait(lambda: refresher._attempted_at != built)
+
+    screener._screened_at -= screener.sessions.idle_timeout
+    assert _wait(lambda: not refresher._thread.is_alive())
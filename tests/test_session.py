@@ -0,0 +1,101 @@
+import pyrh
+import pytest
+from requests import Session
+
+from auto_gpt_robinhood.session import RobinhoodSession, passive
+from auto_gpt_robinhood.transport import TimeoutHTTPAdapter
+
+
+class Client:
+    """A pyrh client that counts its logins."""
+
+    def __init__(self, username=None, password=None, authenticated=False):
+        self.username = username
+        self.authenticated = authenticated
+        self.session = Session()
+        self.logins = 0
+
+    def login(self):
+        self.logins += 1
+        self.authenticated = True
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    """Sessions written by ``pyrh.dump_session``, by path."""
+    files = {}
+
+    def load_session(path):
+        if path not in files:
+            raise ValueError("corrupt session file")
+        return files[path]
+
+    def dump_session(client, path):
+        path.touch()
+        files[path] = client
+
+    monkeypatch.setattr(pyrh, "Robinhood", Client)
+    monkeypatch.setattr(pyrh, "load_session", load_session)
+    monkeypatch.setattr(pyrh, "dump_session", dump_session)
+    return files
+
+
+def test_logs_in_once_and_saves_the_session(saved, tmp_path):
+    path = tmp_path / "session.json"
+    session = RobinhoodSession("me", "secret", str(path))
+
+    client = session.client
+
+    assert session.client is client
+    assert client.logins == 1
+    assert saved == {path: client}
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert isinstance(client.session.get_adapter("https://x/"), TimeoutHTTPAdapter)
+
+
+def test_reuses_a_saved_session_after_a_restart(saved, tmp_path):
+    path = tmp_path / "session.json"
+    path.touch()
+    saved[path] = Client("me", authenticated=True)
+
+    client = RobinhoodSession("me", "secret", str(path)).client
+
+    assert client is saved[path]
+    assert client.logins == 0
+    assert isinstance(client.session.get_adapter("https://x/"), TimeoutHTTPAdapter)
+
+
+@pytest.mark.parametrize("cached", [None, Client("someone-else", authenticated=True)])
+def test_logs_in_again_when_the_saved_session_is_unusable(saved, tmp_path, cached):
+    path = tmp_path / "session.json"
+    path.touch()
+    if cached is not None:
+        saved[path] = cached
+
+    client = RobinhoodSession("me", "secret", str(path)).client
+
+    assert client is not cached
+    assert client.logins == 1
+    assert saved[path] is client
+
+
+def test_reset_reloads_the_saved_session_on_the_next_access(saved, tmp_path):
+    session = RobinhoodSession("me", "secret", str(tmp_path / "session.json"))
+    first = session.client
+
+    session.reset()
+
+    assert not session.connected
+    assert session.client is first
+    assert first.logins == 1
+
+
+def test_passive_access_never_logs_in(saved, tmp_path):
+    session = RobinhoodSession("me", "secret", str(tmp_path / "session.json"))
+    token = passive.set(True)
+    try:
+        with pytest.raises(LookupError):
+            session.client
+    finally:
+        passive.reset(token)
+    assert saved == {}
@@ -0,0 +1,105 @@
+import json
+
+from auto_gpt_robinhood.shaping import TRUNCATED, ResponseShaper
+
+QUOTE = {
+    "symbol": "AAPL",
+    "last_trade_price": "190.00",
+    "instrument": "https://api.robinhood.com/instruments/id-AAPL/",
+    "trading_halted": False,
+}
+
+
+def test_responses_are_projected_to_the_command_fields():
+    shaper = ResponseShaper()
+
+    assert json.loads(shaper.shape("quote_data", QUOTE)) == {
+        "symbol": "AAPL",
+        "last_trade_price": "190.00",
+    }
+    assert json.loads(shaper.shape("quote_data", str(QUOTE)))["symbol"] == "AAPL"
+
+
+def test_auto_gpt_result_prefix_is_kept_around_the_shaped_result():
+    shaper = ResponseShaper()
+    response = f"Command quote_data returned: {QUOTE}"
+
+    assert shaper.shape("quote_data", response) == (
+        'Command quote_data returned: {"symbol":"AAPL","last_trade_price":"190.00"}'
+    )
+
+
+def test_long_lists_and_strings_are_cut_within_the_byte_budget():
+    shaper = ResponseShaper(max_items=2, max_chars=5)
+    news = {"results": [{"title": "headline", "url": "u"}] * 3}
+
+    assert json.loads(shaper.shape("get_stock_news", news)) == {
+        "results": [
+            {"title": "headl" + TRUNCATED, "url": "u"},
+            {"title": "headl" + TRUNCATED, "url": "u"},
+            "... 1 more",
+        ]
+    }
+    budgeted = ResponseShaper(max_tokens=5).shape("quote_data", QUOTE)
+    assert budgeted.endswith(TRUNCATED) and len(budgeted) == 20 + len(TRUNCATED)
+
+
+def test_portfolio_snapshot_keeps_the_useful_holding_fields():
+    shaper = ResponseShaper()
+    holding = {
+        "symbol": "AAPL",
+        "quantity": 2.0,
+        "price": 190.0,
+        "market_value": 380.0,
+        "cost_basis": 300.0,
+        "industry": "Computer Hardware",
+        "weight": 1.0,
+    }
+    snapshot = {"holdings": [holding], "totals": {"positions": 1}, "extra": 1}
+
+    shaped = json.loads(shaper.shape("portfolio_snapshot", snapshot))
+
+    assert shaped == {
+        "holdings": [
+            {
+                "symbol": "AAPL",
+                "quantity": 2.0,
+                "price": 190.0,
+                "market_value": 380.0,
+                "weight": 1.0,
+            }
+        ],
+        "totals": {"positions": 1},
+    }
+
+
+def test_bulk_results_drop_idempotency_keys():
+    shaper = ResponseShaper()
+    response = {
+        "submitted": 1,
+        "failed": 0,
+        "skipped": 0,
+        "results": [{"index": 0, "status": "submitted", "idempotency_key": "k"}],
+    }
+
+    shaped = json.loads(shaper.shape("place_orders_bulk", response))
+
+    assert shaped["results"] == [{"index": 0, "status": "submitted"}]
+    assert shaped["submitted"] == 1
+
+
+def test_commands_without_fields_are_still_trimmed():
+    shaper = ResponseShaper(max_items=2, max_chars=5, commands=["new_command"])
+    response = {"rows": [1, 2, 3], "text": "abcdefgh"}
+
+    assert shaper.handles("new_command")
+    assert json.loads(shaper.shape("new_command", response)) == {
+        "rows": [1, 2, "... 1 more"],
+        "text": "abcde" + TRUNCATED,
+    }
+    assert not shaper.handles("browse_website")
+
+
+def test_every_plugin_command_is_shaped(plugin):
+    for name in plugin.INSTRUMENTED + ("use_account",):
+        assert plugin.response_shaper.handles(name), name
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from auto_gpt_robinhood.singleflight import SingleFlight, SingleFlightMixin
+
+
+def test_concurrent_calls_share_one_execution():
+    group = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return {"price": 1}
+
+    def call():
+        results.append(group.do("quote", slow))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(5)
+    followers = [threading.Thread(target=call) for _ in range(4)]
+    for thread in followers:
+        thread.start()
+    while group.shared < 4:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+
+
+def test_failures_are_shared_and_not_kept():
+    group = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def failing():
+        started.set()
+        release.wait(5)
+        raise LookupError("down")
+
+    def call():
+        try:
+            group.do("quote", failing)
+        except LookupError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=call) for _ in range(2)]
+    threads[0].start()
+    started.wait(5)
+    threads[1].start()
+    while group.shared < 1:
+        threading.Event().wait(0.001)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 2 and errors[0] is errors[1]
+    assert group.do("quote", lambda: "fresh") == "fresh"
+
+
+class Client(SingleFlightMixin):
+    COALESCED = ("quote",)
+
+    def __init__(self):
+        self.account = None
+        self.calls = []
+        self.release = threading.Event()
+
+    def coalescing_scope(self, name):
+        return self.account
+
+    def quote(self, symbol):
+        self.calls.append((self.account, symbol))
+        self.release.wait(5)
+        return symbol
+
+
+def test_scopes_keep_accounts_apart():
+    client = Client()
+    client.account = "alice"
+    first = threading.Thread(target=client.quote, args=("AAPL",))
+    first.start()
+    while not client.calls:
+        threading.Event().wait(0.001)
+    client.account = "bob"
+    second = threading.Thread(target=client.quote, args=("AAPL",))
+    second.start()
+    while len(client.calls) < 2:
+        threading.Event().wait(0.001)
+    client.release.set()
+    first.join()
+    second.join()
+
+    assert client.calls == [("alice", "AAPL"), ("bob", "AAPL")]
+    assert client.single_flight.shared == 0
+
+
+def test_write_methods_cannot_be_coalesced():
+    with pytest.raises(TypeError):
+
+        class Orders(SingleFlightMixin):  # pylint: disable=unused-variable
+            COALESCED = ("place_market_buy_order",)
+
+            def place_market_buy_order(self):
+                pass
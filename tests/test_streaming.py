@@ -0,0 +1,49 @@
+# pylint: disable=protected-access
+import time
+
+from auto_gpt_robinhood.streaming import QuotePoller
+
+
+def _wait(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+def test_thread_exits_when_nothing_is_watched_and_restarts_on_watch():
+    polled = []
+    poller = QuotePoller(
+        lambda symbols: polled.append(symbols) or {},
+        min_interval=0.01,
+        max_interval=0.01,
+    )
+    poller.watch(["AAPL"])
+    assert _wait(lambda: polled)
+    thread = poller._thread
+
+    assert poller.unwatch(["AAPL"]) == []
+    assert _wait(lambda: not thread.is_alive())
+    assert poller._thread is None
+
+    poller.watch(["MSFT"])
+    assert _wait(lambda: ["MSFT"] in polled)
+    poller.stop()
+
+
+def test_polling_never_logs_in(plugin, monkeypatch):
+    logins = []
+    plugin.session.reset()
+    monkeypatch.setattr(plugin.session, "_connect", lambda: logins.append(1))
+    try:
+        plugin.watch_symbols("AAPL")
+        poller = plugin.quote_poller
+        # A quiet poll backs the interval off from its minimum.
+        assert _wait(lambda: poller.interval > plugin.watch_min_interval)
+    finally:
+        for poller in plugin._quote_pollers.values():
+            poller.stop()
+        plugin._quote_pollers.clear()
+
+    assert not logins
+    assert not plugin.session.connected
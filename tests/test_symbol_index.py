@@ -0,0 +1,101 @@
+import pytest
+
+from auto_gpt_robinhood.ratelimit import current_lane
+from auto_gpt_robinhood.session import passive
+from auto_gpt_robinhood.symbol_index import HEADER, SymbolIndex, write_index
+
+AAPL = "450dfc6d-5510-4d40-abfb-f633b7d9be3e"
+MSFT = "50810c35-d215-4866-9758-0ada4ac79ffa"
+
+
+def _index(path, pairs, lookup=lambda symbol: None):
+    return SymbolIndex(str(path), lambda: pairs, lookup)
+
+
+def _wait_for_rebuild(index):
+    index.instrument_id("ANY")
+    index._refresh_thread.join(5)  # pylint: disable=protected-access
+
+
+def test_lookups_come_from_the_index(tmp_path):
+    path = tmp_path / "symbols.idx"
+    write_index(path, [("aapl", AAPL), ("MSFT", MSFT), ("BAD", "short")])
+    index = _index(path, [])
+
+    assert len(index) == 2
+    assert index.instrument_id(" aapl ") == AAPL
+    assert index.instrument_id("MSFT") == MSFT
+
+
+@pytest.mark.parametrize("size", [0, 3, HEADER.size + 10])
+def test_empty_or_truncated_files_are_rebuilt(tmp_path, size):
+    path = tmp_path / "symbols.idx"
+    write_index(path, [("AAPL", AAPL), ("MSFT", MSFT)])
+    path.write_bytes(path.read_bytes()[:size])
+
+    index = _index(path, [("AAPL", AAPL)])
+    assert len(index) == 0
+    _wait_for_rebuild(index)
+
+    assert len(index) == 1
+    assert index.instrument_id("AAPL") == AAPL
+
+
+def test_refresh_closes_the_previous_map(tmp_path):
+    path = tmp_path / "symbols.idx"
+    write_index(path, [("AAPL", AAPL)])
+    index = _index(path, [("AAPL", AAPL), ("MSFT", MSFT)])
+    old_map = index._index[0]  # pylint: disable=protected-access
+
+    assert index.refresh() == 2
+    assert old_map.closed
+    assert index.instrument_id("MSFT") == MSFT
+
+
+def test_unknown_symbols_fall_back_to_lookup(tmp_path):
+    path = tmp_path / "symbols.idx"
+    write_index(path, [])
+    looked_up = []
+
+    def lookup(symbol):
+        looked_up.append(symbol)
+        return MSFT if symbol == "MSFT" else None
+
+    index = _index(path, [], lookup)
+    assert index.instrument_id("MSFT") == MSFT
+    assert index.instrument_id("MSFT") == MSFT
+    assert index.instrument_id("NOPE") is None
+    assert looked_up == ["MSFT", "NOPE"]
+
+
+def test_get_option_chainid_rejects_unknown_symbols(plugin):
+    with pytest.raises(ValueError, match="Unknown symbol"):
+        plugin.get_option_chainid("NOPE")
+
+
+def test_background_rebuilds_are_passive_and_survive_errors(tmp_path, caplog):
+    seen = []
+
+    def source():
+        seen.append(passive.get())
+        raise LookupError("Robinhood session is not connected")
+
+    index = SymbolIndex(str(tmp_path / "symbols.idx"), source, lambda symbol: MSFT)
+    assert index.instrument_id("MSFT") == MSFT
+    index._refresh_thread.join(5)  # pylint: disable=protected-access
+
+    assert seen == [True]
+    assert "Could not rebuild symbol index" in caplog.text
+
+
+def test_instrument_list_is_read_in_the_reference_lane(plugin, monkeypatch):
+    fake, lanes = plugin.robinhood, []
+    get_url = fake.get_url
+    monkeypatch.setattr(
+        fake, "get_url", lambda url: lanes.append(current_lane.get()) or get_url(url)
+    )
+
+    pairs = plugin._instrument_pairs()  # pylint: disable=protected-access
+
+    assert ("AAPL", "id-AAPL") in pairs
+    assert lanes == ["reference"]
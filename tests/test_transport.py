@@ -0,0 +1,106 @@
+from requests import Request, Session
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+from urllib3.util import retry as urllib3_retry
+
+from auto_gpt_robinhood import transport
+from auto_gpt_robinhood.ratelimit import lane_scope
+from auto_gpt_robinhood.transport import (
+    RETRY_STATUSES,
+    JitteredRetry,
+    TimeoutHTTPAdapter,
+    TransportConfig,
+    configure_session,
+)
+
+QUOTE_URL = "https://api.robinhood.com/quotes/AAPL/"
+
+
+class Limiter:
+    """Grants every request at once, recording its lane."""
+
+    def __init__(self):
+        self.lanes = []
+
+    def acquire(self, lane):
+        self.lanes.append(lane)
+        return 0.0
+
+
+def test_adapter_paces_requests_in_the_lane_in_scope(monkeypatch):
+    limiter, sent = Limiter(), []
+    monkeypatch.setattr(
+        HTTPAdapter, "send", lambda self, request, **kwargs: sent.append(kwargs)
+    )
+    adapter = TimeoutHTTPAdapter((1.0, 2.0), limiter)
+    request = Request("GET", QUOTE_URL).prepare()
+
+    adapter.send(request, timeout=0.5)
+    with lane_scope("orders"):
+        adapter.send(request)
+
+    assert limiter.lanes == ["quotes", "orders"]
+    assert [kwargs["timeout"] for kwargs in sent] == [(1.0, 2.0), (1.0, 2.0)]
+
+
+def test_retries_wait_for_a_token_in_the_lane_of_their_request():
+    limiter = Limiter()
+    retry = JitteredRetry(total=2, limiter=limiter).new(total=1)
+
+    with lane_scope("account"):
+        retry.sleep()
+
+    assert limiter.lanes == ["account"]
+
+
+def _failed_twice(**kwargs):
+    retry = JitteredRetry(
+        total=3,
+        backoff_factor=1.0,
+        status_forcelist=RETRY_STATUSES,
+        respect_retry_after_header=True,
+        **kwargs,
+    )
+    for _ in range(2):
+        retry = retry.increment("GET", QUOTE_URL, response=HTTPResponse(status=503))
+    return retry
+
+
+def test_backoff_adds_up_to_the_configured_jitter(monkeypatch):
+    monkeypatch.setattr(transport.random, "uniform", lambda low, high: high)
+
+    assert _failed_twice().get_backoff_time() == 2.0
+    assert _failed_twice(jitter=0.5).get_backoff_time() == 2.5
+
+
+def test_retry_after_takes_precedence_over_the_backoff(monkeypatch):
+    slept = []
+    monkeypatch.setattr(urllib3_retry.time, "sleep", slept.append)
+    monkeypatch.setattr(transport.random, "uniform", lambda low, high: high)
+    retry = _failed_twice(jitter=0.5)
+
+    retry.sleep(HTTPResponse(status=429, headers={"Retry-After": "7"}))
+    retry.sleep(HTTPResponse(status=503))
+
+    assert slept == [7.0, 2.5]
+
+
+def test_orders_are_never_retried():
+    retry = _failed_twice()
+
+    assert retry.is_retry("GET", 503)
+    assert not retry.is_retry("POST", 503)
+
+
+def test_sessions_get_a_pooled_adapter_from_the_environment(monkeypatch):
+    monkeypatch.setenv("ROBINHOOD_POOL_MAXSIZE", "3")
+    monkeypatch.setenv("ROBINHOOD_READ_TIMEOUT", "20")
+    monkeypatch.setenv("ROBINHOOD_RETRIES", "5")
+    session = configure_session(Session(), TransportConfig.from_env())
+
+    adapter = session.get_adapter(QUOTE_URL)
+
+    assert isinstance(adapter, TimeoutHTTPAdapter)
+    assert adapter.timeout == (3.05, 20.0)
+    assert adapter.max_retries.total == 5
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 3